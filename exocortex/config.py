@@ -28,6 +28,11 @@ class Config:
     max_tags_per_memory: int = 20
     stale_memory_days: int = 90
 
+    # Database settings
+    # Pooled connections for concurrent reads (async reads, explore_related);
+    # raise it for servers handling many simultaneous requests
+    max_concurrent_queries: int = 4
+
     # Server settings
     server_host: str = "127.0.0.1"
     server_port: int = 8765
@@ -65,6 +70,9 @@ class Config:
             ),
             max_tags_per_memory=int(os.environ.get("EXOCORTEX_MAX_TAGS", "20")),
             stale_memory_days=int(os.environ.get("EXOCORTEX_STALE_DAYS", "90")),
+            max_concurrent_queries=int(
+                os.environ.get("EXOCORTEX_MAX_CONCURRENT_QUERIES", "4")
+            ),
             server_host=os.environ.get("EXOCORTEX_HOST", "127.0.0.1"),
             server_port=int(os.environ.get("EXOCORTEX_PORT", "8765")),
             server_transport=os.environ.get("EXOCORTEX_TRANSPORT", "stdio"),
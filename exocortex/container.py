@@ -53,6 +53,7 @@ class Container:
             self._database_manager = SmartDatabaseManager(
                 db_path=self.config.db_path,
                 embedding_dimension=self.embedding_engine.dimension,
+                max_concurrent_queries=self.config.max_concurrent_queries,
             )
         return self._database_manager
 
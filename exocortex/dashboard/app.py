@@ -6,6 +6,7 @@ import asyncio
 import json
 import logging
 from collections.abc import AsyncGenerator
+from datetime import datetime, timezone
 from pathlib import Path
 
 from starlette.applications import Starlette
@@ -52,20 +53,16 @@ async def api_stats(request: Request) -> JSONResponse:
         container = get_container()
         repo = container.repository
 
-        # Get stats using the existing get_stats method
-        stats = repo.get_stats()
+        # Get stats without blocking the event loop
+        stats = await repo.get_stats_async()
 
         # Get context names using repository's internal method
         result = repo._execute_read("MATCH (c:Context) RETURN c.name ORDER BY c.name")
-        contexts = []
-        while result.has_next():
-            contexts.append(result.get_next()[0])
+        contexts = [row[0] for row in repo._fetch_rows(result)]
 
         # Get tag names
         result = repo._execute_read("MATCH (t:Tag) RETURN t.name ORDER BY t.name")
-        tags = []
-        while result.has_next():
-            tags.append(result.get_next()[0])
+        tags = [row[0] for row in repo._fetch_rows(result)]
 
         # Get orphan count
         orphans = repo.get_orphan_memories()
@@ -153,8 +150,8 @@ async def api_memory_detail(request: Request) -> JSONResponse:
                 {"success": False, "error": "Memory not found"}, status_code=404
             )
 
-        # Get links
-        links = repo.get_links(memory_id)
+        # Get links without blocking the event loop
+        links = await repo.get_links_async(memory_id)
 
         return JSONResponse(
             {
@@ -203,19 +200,22 @@ async def api_health(request: Request) -> JSONResponse:
         container = get_container()
         repo = container.repository
 
-        stats = repo.get_stats()
-        total = stats.total_memories
-        orphans = repo.get_orphan_memories()
+        # Memory and orphan counts from one query, without blocking the loop
+        snapshot = await repo.get_health_snapshot_async(
+            threshold=datetime.now(timezone.utc)
+        )
+        total = snapshot.total_memories
+        orphan_count = snapshot.orphan_count
 
         # Calculate health score
-        orphan_ratio = len(orphans) / total if total > 0 else 0
+        orphan_ratio = orphan_count / total if total > 0 else 0
         health_score = max(0, 100 - (orphan_ratio * 100))
 
         issues = []
         suggestions = []
 
-        if len(orphans) > 0:
-            issues.append(f"{len(orphans)} orphan memories without links")
+        if orphan_count > 0:
+            issues.append(f"{orphan_count} orphan memories without links")
             suggestions.append("Run exo_sleep to consolidate orphan memories")
 
         if total < 10:
@@ -230,7 +230,7 @@ async def api_health(request: Request) -> JSONResponse:
                 "health": {
                     "score": round(health_score, 1),
                     "total_memories": total,
-                    "orphan_count": len(orphans),
+                    "orphan_count": orphan_count,
                     "issues": issues,
                     "suggestions": suggestions,
                 },
@@ -332,18 +332,11 @@ async def api_graph(request: Request) -> JSONResponse:
             link_counts[memory.id] = 0
 
             # Get outgoing links
-            memory_links = repo.get_links(memory.id)
-            for link in memory_links:
+            for target_id, relation_type, _ in repo.get_links_raw(memory.id):
                 link_counts[memory.id] = link_counts.get(memory.id, 0) + 1
                 # Also count incoming for target
-                link_counts[link.target_id] = link_counts.get(link.target_id, 0) + 1
-                all_edges.append(
-                    (
-                        memory.id,
-                        link.target_id,
-                        link.relation_type.value if link.relation_type else "related",
-                    )
-                )
+                link_counts[target_id] = link_counts.get(target_id, 0) + 1
+                all_edges.append((memory.id, target_id, relation_type or "related"))
 
         # Sort by link count (descending) and take top N
         max_primary_nodes = 100
@@ -5,13 +5,19 @@ This package provides all domain models, organized by concern:
 - memory: Memory, MemoryLink, MemoryWithContext
 - graph: Context, Tag
 - pattern: Pattern, PatternInstance, PatternWithInstances
-- health: SuggestedLink, KnowledgeInsight, KnowledgeHealthIssue
+- health: SuggestedLink, KnowledgeInsight, KnowledgeHealthIssue,
+  KnowledgeHealthSnapshot
 - results: StoreMemoryResult, RecallMemoriesResult, etc.
 """
 
 from .enums import MemoryType, RelationType
 from .graph import Context, Tag
-from .health import KnowledgeHealthIssue, KnowledgeInsight, SuggestedLink
+from .health import (
+    KnowledgeHealthIssue,
+    KnowledgeHealthSnapshot,
+    KnowledgeInsight,
+    SuggestedLink,
+)
 from .memory import Memory, MemoryLink, MemoryWithContext
 from .pattern import Pattern, PatternInstance, PatternWithInstances
 from .results import (
@@ -43,6 +49,7 @@ __all__ = [
     "SuggestedLink",
     "KnowledgeInsight",
     "KnowledgeHealthIssue",
+    "KnowledgeHealthSnapshot",
     # Result models
     "StoreMemoryResult",
     "RecallMemoriesResult",
@@ -48,3 +48,18 @@ class KnowledgeHealthIssue(BaseModel):
         default_factory=list, description="Affected memory IDs"
     )
     suggested_action: str = Field(..., description="Suggested action to resolve")
+
+
+class KnowledgeHealthSnapshot(BaseModel):
+    """Raw health measurements gathered in one pass over all memories."""
+
+    total_memories: int = Field(0, description="Total number of memories")
+    failure_count: int = Field(0, description="Memories of type failure")
+    orphan_count: int = Field(0, description="Memories without tags")
+    orphan_ids: list[str] = Field(
+        default_factory=list, description="Sample of memory IDs without tags"
+    )
+    unlinked_count: int = Field(0, description="Memories without RELATED_TO links")
+    stale_ids: list[str] = Field(
+        default_factory=list, description="Sample of memory IDs not updated recently"
+    )
@@ -571,9 +571,8 @@ class CuriosityEngine:
             # Get all memories with links
             memories, _, _ = self._repo.list_memories(limit=500)
             for mem in memories:
-                links = self._repo.get_links(mem.id)
-                for link in links:
-                    pair = tuple(sorted([mem.id, link.target_id]))
+                for target_id, _, _ in self._repo.get_links_raw(mem.id):
+                    pair = tuple(sorted([mem.id, target_id]))
                     pairs.add(pair)
         except Exception as e:
             logger.warning(f"Error getting existing links: {e}")
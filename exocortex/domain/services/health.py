@@ -12,16 +12,14 @@ from __future__ import annotations
 from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING, Any
 
-from ..models import (
-    AnalyzeKnowledgeResult,
-    KnowledgeHealthIssue,
-    MemoryStats,
-    MemoryType,
-)
+from ..models import AnalyzeKnowledgeResult, KnowledgeHealthIssue
 
 if TYPE_CHECKING:
     from ...infra.repositories import MemoryRepository
 
+# Health score deduction per issue, by severity
+SEVERITY_PENALTIES = {"high": 20, "medium": 10, "low": 5}
+
 
 class KnowledgeHealthAnalyzer:
     """Analyzes knowledge base for health issues and improvements."""
@@ -56,8 +54,10 @@ class KnowledgeHealthAnalyzer:
         suggestions: list[str] = []
         stats: dict[str, Any] = {}
 
-        memory_stats = self._repo.get_stats()
-        total_memories = memory_stats.total_memories
+        # Counts, orphan, unlinked and stale memories all come from one scan
+        stale_threshold = datetime.now(timezone.utc) - timedelta(days=self._stale_days)
+        snapshot = self._repo.get_health_snapshot(threshold=stale_threshold, limit=10)
+        total_memories = snapshot.total_memories
 
         if total_memories == 0:
             return AnalyzeKnowledgeResult(
@@ -69,59 +69,53 @@ class KnowledgeHealthAnalyzer:
             )
 
         # Check for orphan memories (no tags)
-        orphan_memories = self._repo.get_orphan_memories(limit=10)
-        if orphan_memories:
+        if snapshot.orphan_count:
             issues.append(
                 KnowledgeHealthIssue(
                     issue_type="orphan_memories",
                     severity="medium",
-                    message=f"{len(orphan_memories)} memories have no tags.",
-                    affected_memory_ids=[m[0] for m in orphan_memories],
+                    message=f"{snapshot.orphan_count} memories have no tags.",
+                    affected_memory_ids=snapshot.orphan_ids,
                     suggested_action="Add tags using update_memory",
                 )
             )
 
         # Check for unlinked memories
-        unlinked_count = self._repo.get_unlinked_count()
+        unlinked_count = snapshot.unlinked_count
         stats["unlinked_memories"] = unlinked_count
+        # total_memories > 0 is guaranteed by the early return above
+        link_ratio = unlinked_count / total_memories
 
-        if unlinked_count > 0 and total_memories > 5:
-            link_ratio = unlinked_count / total_memories
-            if link_ratio > 0.8:
-                issues.append(
-                    KnowledgeHealthIssue(
-                        issue_type="low_connectivity",
-                        severity="low",
-                        message=f"{unlinked_count}/{total_memories} memories have no links.",
-                        affected_memory_ids=[],
-                        suggested_action="Use explore_related and link_memories",
-                    )
+        if total_memories > 5 and link_ratio > 0.8:
+            issues.append(
+                KnowledgeHealthIssue(
+                    issue_type="low_connectivity",
+                    severity="low",
+                    message=f"{unlinked_count}/{total_memories} memories have no links.",
+                    affected_memory_ids=[],
+                    suggested_action="Use explore_related and link_memories",
                 )
+            )
 
         # Check for stale memories
-        stale_threshold = datetime.now(timezone.utc) - timedelta(days=self._stale_days)
-        stale_memories = self._repo.get_stale_memories(
-            threshold=stale_threshold, limit=10
-        )
-
-        if stale_memories:
+        if snapshot.stale_ids:
             issues.append(
                 KnowledgeHealthIssue(
                     issue_type="stale_memories",
                     severity="low",
-                    message=f"{len(stale_memories)}+ memories not updated in {self._stale_days}+ days.",
-                    affected_memory_ids=[m[0] for m in stale_memories],
+                    message=f"{len(snapshot.stale_ids)}+ memories not updated in {self._stale_days}+ days.",
+                    affected_memory_ids=snapshot.stale_ids,
                     suggested_action="Review and update or mark as superseded",
                 )
             )
 
         # Calculate health score
-        health_score = self._calculate_health_score(
-            issues, unlinked_count, total_memories
-        )
+        health_score = self._calculate_health_score(issues, link_ratio)
 
         # Generate suggestions
-        suggestions = self._generate_suggestions(issues, total_memories, memory_stats)
+        suggestions = self._generate_suggestions(
+            issues, total_memories, snapshot.failure_count
+        )
 
         return AnalyzeKnowledgeResult(
             total_memories=total_memories,
@@ -134,30 +128,23 @@ class KnowledgeHealthAnalyzer:
     def _calculate_health_score(
         self,
         issues: list[KnowledgeHealthIssue],
-        unlinked_count: int,
-        total_memories: int,
+        link_ratio: float,
     ) -> float:
         """Calculate overall health score based on issues.
 
         Args:
             issues: List of detected health issues.
-            unlinked_count: Number of memories without links.
-            total_memories: Total number of memories.
+            link_ratio: Fraction of memories without links.
 
         Returns:
             Health score from 0 to 100.
         """
-        health_score = 100.0
-        for issue in issues:
-            if issue.severity == "high":
-                health_score -= 20
-            elif issue.severity == "medium":
-                health_score -= 10
-            elif issue.severity == "low":
-                health_score -= 5
+        health_score = 100.0 - sum(
+            SEVERITY_PENALTIES.get(issue.severity, 0) for issue in issues
+        )
 
         # Bonus for good link coverage
-        if total_memories > 0 and unlinked_count / total_memories < 0.5:
+        if link_ratio < 0.5:
             health_score = min(100, health_score + 5)
 
         return max(0, health_score)
@@ -166,14 +153,14 @@ class KnowledgeHealthAnalyzer:
         self,
         issues: list[KnowledgeHealthIssue],
         total_memories: int,
-        memory_stats: MemoryStats,
+        failure_count: int,
     ) -> list[str]:
         """Generate improvement suggestions based on health analysis.
 
         Args:
             issues: List of detected health issues.
             total_memories: Total number of memories.
-            memory_stats: Memory statistics.
+            failure_count: Number of failure memories.
 
         Returns:
             List of suggestion strings.
@@ -188,7 +175,7 @@ class KnowledgeHealthAnalyzer:
         if total_memories < 10:
             suggestions.append("Keep recording insights for better semantic search.")
 
-        if memory_stats.memories_by_type.get(MemoryType.FAILURE.value, 0) == 0:
+        if failure_count == 0:
             suggestions.append("Don't forget to record failures too!")
 
         return suggestions
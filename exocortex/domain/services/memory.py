@@ -242,6 +242,10 @@ class MemoryService:
         """Delete a memory."""
         return self._repo.delete_memory(memory_id)
 
+    def delete_memories(self, memory_ids: list[str]) -> int:
+        """Delete many memories at once, returning how many were deleted."""
+        return self._repo.delete_memories(memory_ids)
+
     # =========================================================================
     # Link Operations
     # =========================================================================
@@ -261,10 +265,20 @@ class MemoryService:
             reason=reason,
         )
 
+    def link_memories_bulk(
+        self, links: list[tuple[str, str, RelationType, str | None]]
+    ) -> int:
+        """Create many links at once, returning how many were created."""
+        return self._repo.create_links(links)
+
     def unlink_memories(self, source_id: str, target_id: str) -> bool:
         """Remove a link between two memories."""
         return self._repo.delete_link(source_id, target_id)
 
+    def unlink_memories_bulk(self, pairs: list[tuple[str, str]]) -> int:
+        """Remove many links at once, returning how many were removed."""
+        return self._repo.delete_links(pairs)
+
     def get_memory_links(self, memory_id: str) -> list[MemoryLink]:
         """Get all outgoing links from a memory."""
         return self._repo.get_links(memory_id)
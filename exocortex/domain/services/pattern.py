@@ -94,13 +94,14 @@ class PatternConsolidator:
             if similar_patterns and similar_patterns[0][2] >= 0.8:
                 # Link memories to existing pattern
                 pattern_id = similar_patterns[0][0]
-                for memory in cluster:
-                    self._repo.link_memory_to_pattern(
-                        memory_id=memory.id,
-                        pattern_id=pattern_id,
-                        confidence=similar_patterns[0][2],
-                    )
-                    result["memories_linked"] += 1
+                with self._repo.write_batch():
+                    for memory in cluster:
+                        self._repo.link_memory_to_pattern(
+                            memory_id=memory.id,
+                            pattern_id=pattern_id,
+                            confidence=similar_patterns[0][2],
+                        )
+                        result["memories_linked"] += 1
                 result["patterns_found"] += 1
                 logger.info(
                     f"Linked {len(cluster)} memories to existing pattern {pattern_id[:8]}..."
@@ -109,19 +110,21 @@ class PatternConsolidator:
                 # Create new pattern from cluster
                 pattern_content = self._synthesize_content(cluster)
                 if pattern_content:
-                    pattern_id, summary, _ = self._repo.create_pattern(
-                        content=pattern_content,
-                        confidence=0.5,
-                    )
-
-                    # Link all cluster memories to the new pattern
-                    for memory in cluster:
-                        self._repo.link_memory_to_pattern(
-                            memory_id=memory.id,
-                            pattern_id=pattern_id,
-                            confidence=0.6,
+                    # Pattern and its instance links are committed together
+                    with self._repo.write_batch():
+                        pattern_id, summary, _ = self._repo.create_pattern(
+                            content=pattern_content,
+                            confidence=0.5,
                         )
-                        result["memories_linked"] += 1
+
+                        # Link all cluster memories to the new pattern
+                        for memory in cluster:
+                            self._repo.link_memory_to_pattern(
+                                memory_id=memory.id,
+                                pattern_id=pattern_id,
+                                confidence=0.6,
+                            )
+                            result["memories_linked"] += 1
 
                     result["patterns_created"] += 1
                     result["details"].append(
@@ -161,8 +164,12 @@ class PatternConsolidator:
         clusters: list[list[MemoryWithContext]] = []
         used: set[str] = set()
 
+        # Stored embeddings, read once rather than re-embedded per pair
+        embeddings = self._repo.get_embeddings([memory.id for memory in memories])
+
         for memory in memories:
-            if memory.id in used:
+            embedding = embeddings.get(memory.id)
+            if memory.id in used or embedding is None:
                 continue
 
             # Start a new cluster with this memory
@@ -170,12 +177,11 @@ class PatternConsolidator:
             used.add(memory.id)
 
             # Find similar memories
-            embedding = self._repo._embedding_engine.embed(memory.content)
             for other in memories:
-                if other.id in used:
+                other_embedding = embeddings.get(other.id)
+                if other.id in used or other_embedding is None:
                     continue
 
-                other_embedding = self._repo._embedding_engine.embed(other.content)
                 similarity = self._repo.compute_similarity(embedding, other_embedding)
 
                 if similarity >= threshold:
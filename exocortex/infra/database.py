@@ -5,9 +5,9 @@ from __future__ import annotations
 import logging
 import time
 from collections.abc import Generator
-from contextlib import contextmanager
+from contextlib import contextmanager, suppress
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     import kuzu
@@ -23,6 +23,12 @@ logger = logging.getLogger(__name__)
 DEFAULT_MAX_RETRIES = 3
 DEFAULT_RETRY_DELAY = 0.5  # seconds
 
+# Number of pooled connections used for concurrent (async) reads
+DEFAULT_MAX_CONCURRENT_QUERIES = 4
+
+# Maximum number of prepared statements cached per connection
+MAX_PREPARED_STATEMENTS = 128
+
 
 # =============================================================================
 # Exceptions
@@ -55,6 +61,7 @@ class DatabaseConnection:
         read_only: bool = False,
         max_retries: int = DEFAULT_MAX_RETRIES,
         retry_delay: float = DEFAULT_RETRY_DELAY,
+        max_concurrent_queries: int = DEFAULT_MAX_CONCURRENT_QUERIES,
     ) -> None:
         """Initialize the database connection.
 
@@ -64,14 +71,19 @@ class DatabaseConnection:
             read_only: If True, open database in read-only mode (allows concurrent access).
             max_retries: Maximum retries for acquiring write lock.
             retry_delay: Delay between retries in seconds.
+            max_concurrent_queries: Size of the connection pool used by execute_async.
         """
         self._db_path = db_path
         self._embedding_dimension = embedding_dimension
         self._read_only = read_only
         self._max_retries = max_retries
         self._retry_delay = retry_delay
+        self._max_concurrent_queries = max_concurrent_queries
         self._db: kuzu.Database | None = None
         self._conn: kuzu.Connection | None = None
+        self._async_conn: kuzu.AsyncConnection | None = None
+        self._prepared: dict[str, kuzu.PreparedStatement] = {}
+        self._in_transaction = False
         self._initialized = False
 
     @property
@@ -79,6 +91,11 @@ class DatabaseConnection:
         """Check if connection is in read-only mode."""
         return self._read_only
 
+    @property
+    def in_transaction(self) -> bool:
+        """Check if an explicit transaction (see transaction()) is active."""
+        return self._in_transaction
+
     @property
     def db(self) -> kuzu.Database:
         """Get the database instance, creating if needed."""
@@ -103,6 +120,24 @@ class DatabaseConnection:
                 self._initialized = True
         return self._conn
 
+    @property
+    def async_conn(self) -> kuzu.AsyncConnection:
+        """Get a pooled async connection, creating it if needed.
+
+        KùzuDB connections are not safe to share between threads, so the
+        async connection owns its own pool of connections and a thread
+        executor sized by max_concurrent_queries.
+        """
+        if self._async_conn is None:
+            import kuzu
+
+            # Make sure the schema exists before handing out pooled connections
+            _ = self.conn
+            self._async_conn = kuzu.AsyncConnection(
+                self.db, max_concurrent_queries=self._max_concurrent_queries
+            )
+        return self._async_conn
+
     def _init_schema(self) -> None:
         """Initialize the database schema."""
         logger.info("Initializing database schema...")
@@ -303,6 +338,11 @@ class DatabaseConnection:
     def execute(self, query: str, parameters: dict | None = None) -> kuzu.QueryResult:
         """Execute a query on the database.
 
+        Parameterized queries are prepared once per connection and the
+        prepared statement is reused on later calls, so KùzuDB skips parsing
+        and planning for repeated queries. A reused statement keeps values
+        bound by earlier calls, so every parameter must be passed each time.
+
         Args:
             query: Cypher query string.
             parameters: Optional query parameters.
@@ -311,11 +351,128 @@ class DatabaseConnection:
             Query result.
         """
         if parameters:
-            return self.conn.execute(query, parameters=parameters)
+            return self.conn.execute(
+                self._prepare(query, parameters), parameters=parameters
+            )
         return self.conn.execute(query)
 
+    def _prepare(
+        self, query: str, parameters: dict[str, Any]
+    ) -> kuzu.PreparedStatement | str:
+        """Return the cached prepared statement for a query, preparing it if new.
+
+        The first call's parameters are given to the binder; without them
+        KùzuDB drops parameters that only appear inside an EXISTS subquery
+        combined with other predicates. Queries that fail to prepare are
+        returned unchanged so that executing them raises KùzuDB's usual error.
+        """
+        statement = self._prepared.get(query)
+        if statement is not None:
+            return statement
+
+        import kuzu
+
+        statement = kuzu.PreparedStatement(self.conn, query, parameters)
+        if not statement.is_success():
+            return query
+        if len(self._prepared) >= MAX_PREPARED_STATEMENTS:
+            # Evict the oldest entry (dicts keep insertion order)
+            del self._prepared[next(iter(self._prepared))]
+        self._prepared[query] = statement
+        return statement
+
+    @contextmanager
+    def transaction(self) -> Generator[DatabaseConnection, None, None]:
+        """Run the enclosed queries in one explicit transaction.
+
+        The transaction is committed when the block exits normally and rolled
+        back if it raises, so a group of writes commits (and syncs its WAL)
+        once instead of once per statement. Nested calls join the outer
+        transaction.
+
+        Yields:
+            This connection.
+        """
+        if self._in_transaction:
+            yield self
+            return
+
+        self.conn.execute("BEGIN TRANSACTION")
+        self._in_transaction = True
+        try:
+            yield self
+        except BaseException:
+            # KùzuDB has already rolled back if a statement itself failed
+            with suppress(RuntimeError):
+                self.conn.execute("ROLLBACK")
+            raise
+        else:
+            self.conn.execute("COMMIT")
+        finally:
+            self._in_transaction = False
+
+    async def execute_async(
+        self, query: str, parameters: dict | None = None
+    ) -> kuzu.QueryResult:
+        """Execute a query on the connection pool without blocking the event loop.
+
+        Independent queries can be awaited together (e.g. with asyncio.gather)
+        to overlap their execution.
+
+        Args:
+            query: Cypher query string.
+            parameters: Optional query parameters.
+
+        Returns:
+            Query result.
+        """
+        return await self.async_conn.execute(query, parameters)
+
+    def execute_concurrently(
+        self, queries: list[tuple[str, dict | None]]
+    ) -> list[kuzu.QueryResult]:
+        """Execute independent read queries in parallel from synchronous code.
+
+        Each query runs on its own pooled connection in the async connection's
+        thread executor, so no threads are created per call and the elapsed
+        time is that of the slowest query. Inside a transaction the queries
+        run sequentially on this connection so they see uncommitted writes.
+
+        Args:
+            queries: (query, parameters) pairs.
+
+        Returns:
+            Query results in the same order as the queries.
+        """
+        if self._in_transaction:
+            return [self.execute(query, parameters) for query, parameters in queries]
+
+        pool = self.async_conn
+
+        def run(query: str, parameters: dict | None) -> kuzu.QueryResult:
+            conn = pool.acquire_connection()
+            try:
+                return conn.execute(query, parameters or {})
+            finally:
+                pool.release_connection(conn)
+
+        futures = [
+            pool.executor.submit(run, query, parameters)
+            for query, parameters in queries
+        ]
+        return [future.result() for future in futures]
+
     def close(self) -> None:
         """Close the database connection."""
+        if self._async_conn is not None:
+            # AsyncConnection.close() closes the pooled connections before it
+            # waits for the executor, which hangs a query still running on
+            # one; let in-flight reads finish first
+            self._async_conn.executor.shutdown(wait=True)
+            self._async_conn.close()
+            self._async_conn = None
+        # Prepared statements are bound to the connection being dropped
+        self._prepared.clear()
         if self._conn is not None:
             self._conn = None
         if self._db is not None:
@@ -343,6 +500,7 @@ class SmartDatabaseManager:
         embedding_dimension: int,
         max_retries: int = DEFAULT_MAX_RETRIES,
         retry_delay: float = DEFAULT_RETRY_DELAY,
+        max_concurrent_queries: int = DEFAULT_MAX_CONCURRENT_QUERIES,
     ) -> None:
         """Initialize the smart database manager.
 
@@ -351,15 +509,24 @@ class SmartDatabaseManager:
             embedding_dimension: Dimension of embedding vectors.
             max_retries: Maximum retries for acquiring write lock.
             retry_delay: Delay between retries in seconds.
+            max_concurrent_queries: Size of each connection's async read pool.
         """
         self._db_path = db_path
         self._embedding_dimension = embedding_dimension
         self._max_retries = max_retries
         self._retry_delay = retry_delay
+        self._max_concurrent_queries = max_concurrent_queries
 
         # Lazy-initialized connections
         self._read_conn: DatabaseConnection | None = None
         self._write_conn: DatabaseConnection | None = None
+        # Write connection held open by an active write_transaction()
+        self._batch_conn: DatabaseConnection | None = None
+
+    @property
+    def in_transaction(self) -> bool:
+        """Check if a write_transaction() batch is active."""
+        return self._batch_conn is not None
 
     def _ensure_database_initialized(self) -> None:
         """Ensure database is initialized (schema created) before read-only access."""
@@ -378,7 +545,13 @@ class SmartDatabaseManager:
 
     @property
     def read_connection(self) -> DatabaseConnection:
-        """Get read-only database connection (for concurrent access)."""
+        """Get read-only database connection (for concurrent access).
+
+        Inside write_transaction() reads go to the held write connection so
+        they see the transaction's own uncommitted writes.
+        """
+        if self._batch_conn is not None:
+            return self._batch_conn
         if self._read_conn is None:
             # Ensure database exists before opening in read-only mode
             self._ensure_database_initialized()
@@ -386,6 +559,7 @@ class SmartDatabaseManager:
                 db_path=self._db_path,
                 embedding_dimension=self._embedding_dimension,
                 read_only=True,
+                max_concurrent_queries=self._max_concurrent_queries,
             )
         return self._read_conn
 
@@ -393,7 +567,8 @@ class SmartDatabaseManager:
         """Get read-write database connection with retry logic.
 
         Note: This closes any existing read connection first to avoid
-        conflicts within the same process.
+        conflicts within the same process. Inside write_transaction() the
+        held write connection is returned as-is.
 
         Returns:
             DatabaseConnection in read-write mode.
@@ -401,6 +576,9 @@ class SmartDatabaseManager:
         Raises:
             DatabaseLockError: If unable to acquire write lock after retries.
         """
+        if self._batch_conn is not None:
+            return self._batch_conn
+
         # Close existing connections to avoid conflicts
         if self._read_conn is not None:
             self._read_conn.close()
@@ -419,6 +597,7 @@ class SmartDatabaseManager:
                     db_path=self._db_path,
                     embedding_dimension=self._embedding_dimension,
                     read_only=False,
+                    max_concurrent_queries=self._max_concurrent_queries,
                 )
                 # Try to access the connection to verify it works
                 _ = self._write_conn.conn
@@ -464,12 +643,49 @@ class SmartDatabaseManager:
             # Close write connection to release lock immediately
             self.release_write_lock()
 
+    @contextmanager
+    def write_transaction(self) -> Generator[DatabaseConnection, None, None]:
+        """Context manager running a batch of writes as one transaction.
+
+        The write connection is acquired once and kept open for the whole
+        block instead of being reopened for every write, and all writes are
+        committed together (or rolled back together on error). The write
+        lock is released when the block exits. Nested calls join the
+        outer batch.
+
+        Usage:
+            with manager.write_transaction() as conn:
+                conn.execute("CREATE ...")
+                conn.execute("MATCH ... CREATE ...")
+
+        Yields:
+            DatabaseConnection in read-write mode.
+
+        Raises:
+            DatabaseLockError: If unable to acquire write lock.
+        """
+        if self._batch_conn is not None:
+            yield self._batch_conn
+            return
+
+        conn = self.get_write_connection()
+        self._batch_conn = conn
+        try:
+            with conn.transaction():
+                yield conn
+        finally:
+            self._batch_conn = None
+            self.release_write_lock()
+
     def release_write_lock(self) -> None:
         """Release the write lock by closing the write connection.
 
         This should be called after completing a batch of write operations
-        to allow other processes to access the database.
+        to allow other processes to access the database. It is a no-op
+        inside write_transaction(), which releases the lock on exit.
         """
+        if self._batch_conn is not None:
+            return
         if self._write_conn is not None:
             self._write_conn.close()
             self._write_conn = None
@@ -7,6 +7,11 @@ from typing import TYPE_CHECKING
 
 import numpy as np
 
+try:
+    import simsimd
+except ImportError:  # Optional: pip install exocortex[simd]
+    simsimd = None
+
 if TYPE_CHECKING:
     from fastembed import TextEmbedding
 
@@ -75,19 +80,22 @@ class EmbeddingEngine:
         return [emb.tolist() for emb in embeddings]
 
     def compute_similarity(
-        self, embedding1: list[float], embedding2: list[float]
+        self,
+        embedding1: list[float] | np.ndarray,
+        embedding2: list[float] | np.ndarray,
     ) -> float:
         """Compute cosine similarity between two embeddings.
 
         Args:
-            embedding1: First embedding vector.
-            embedding2: Second embedding vector.
+            embedding1: First embedding vector, as a list or a 1-D array
+                (used as is when already float32).
+            embedding2: Second embedding vector, same as embedding1.
 
         Returns:
             Cosine similarity score (0 to 1).
         """
-        vec1 = np.array(embedding1)
-        vec2 = np.array(embedding2)
+        vec1 = np.asarray(embedding1, dtype=np.float32)
+        vec2 = np.asarray(embedding2, dtype=np.float32)
 
         # Cosine similarity
         dot_product = np.dot(vec1, vec2)
@@ -98,3 +106,83 @@ class EmbeddingEngine:
             return 0.0
 
         return float(dot_product / (norm1 * norm2))
+
+    def compute_similarities(
+        self, query: list[float], embeddings: list[list[float]] | np.ndarray
+    ) -> list[float]:
+        """Compute cosine similarity between one query and many embeddings.
+
+        The embeddings are stacked into a single float32 matrix so all scores
+        come from one matrix-vector product instead of a per-row loop.
+
+        Args:
+            query: Query embedding vector.
+            embeddings: Embedding vectors to score against the query, either
+                as lists or as a 2-D array (used as is when already float32).
+
+        Returns:
+            Cosine similarity scores, in the order of ``embeddings``.
+        """
+        if len(embeddings) == 0:
+            return []
+        return self._cosine_scores(query, embeddings).tolist()
+
+    def top_similarities(
+        self,
+        query: list[float],
+        embeddings: list[list[float]] | np.ndarray,
+        k: int,
+    ) -> list[tuple[int, float]]:
+        """Find the k embeddings most similar to a query.
+
+        Only the top k scores are selected (argpartition) and sorted, instead
+        of sorting every score. Equal scores are ranked by index, so ties are
+        resolved the same way on every call.
+
+        Args:
+            query: Query embedding vector.
+            embeddings: Embedding vectors to score against the query.
+            k: Number of results to return.
+
+        Returns:
+            List of (index into ``embeddings``, similarity) tuples, sorted by
+            similarity descending.
+        """
+        if k <= 0 or len(embeddings) == 0:
+            return []
+
+        scores = self._cosine_scores(query, embeddings)
+        if k < len(scores):
+            # argpartition picks arbitrarily among scores tied with the k-th
+            # best, so take those in index order to fill the remaining slots
+            kth = scores[np.argpartition(-scores, k - 1)[k - 1]]
+            above = np.flatnonzero(scores > kth)
+            tied = np.flatnonzero(scores == kth)[: k - len(above)]
+            top = np.concatenate((above, tied))
+        else:
+            top = np.arange(len(scores))
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(int(i), float(scores[i])) for i in top]
+
+    @staticmethod
+    def _cosine_scores(
+        query: list[float], embeddings: list[list[float]] | np.ndarray
+    ) -> np.ndarray:
+        """Score embeddings against a query in one pass over the matrix.
+
+        Uses SimSIMD's fused cosine kernel when it is installed, otherwise
+        one NumPy matrix-vector product. Zero vectors score 0 either way.
+        """
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        vec = np.asarray(query, dtype=np.float32)
+
+        if simsimd is not None:
+            if not vec.any():
+                return np.zeros(len(matrix), dtype=np.float32)
+            # cdist returns cosine distances; a zero row has distance 1
+            distances = simsimd.cdist(vec[np.newaxis, :], matrix, metric="cosine")
+            return 1.0 - np.asarray(distances, dtype=np.float32).ravel()
+
+        norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(vec)
+        dots = matrix @ vec
+        return np.divide(dots, norms, out=np.zeros_like(dots), where=norms != 0)
@@ -8,7 +8,7 @@ frustration_score and time_cost_hours columns.
 Usage:
     from exocortex.infra.queries import MemoryQueryBuilder
 
-    # Get query string
+    # Get query string (built once, then the same str object on every call)
     query = MemoryQueryBuilder.get_by_id()
 
     # Parse row using column indices
@@ -16,12 +16,19 @@ Usage:
     content = row[MemoryQueryBuilder.Columns.CONTENT]
 """
 
+from functools import cache
+
 
 class MemoryQueryBuilder:
     """Centralized query builder for Memory operations.
 
     All Memory-related queries should use this class to ensure
     consistent column ordering and easy maintenance.
+
+    Query methods are memoized per argument, so each query string is
+    formatted once and every later call returns the same str object. The
+    connection's prepared-statement cache is keyed by query text, and a
+    reused str does not have to be re-hashed for that lookup.
     """
 
     class Columns:
@@ -116,6 +123,7 @@ class MemoryQueryBuilder:
     # ==========================================================================
 
     @classmethod
+    @cache
     def get_by_id(cls) -> str:
         """Query to get a memory by ID with context and tags."""
         return f"""
@@ -127,47 +135,112 @@ class MemoryQueryBuilder:
         """
 
     @classmethod
-    def list_memories(cls, where_clause: str = "TRUE") -> str:
-        """Query to list memories with pagination and filtering."""
+    @cache
+    def get_by_ids(cls) -> str:
+        """Query to get the memories in $ids with context and tags.
+
+        Rows are returned in no particular order.
+        """
         return f"""
             MATCH (m:Memory)
+            WHERE m.id IN $ids
             OPTIONAL MATCH (m)-[:ORIGINATED_IN]->(c:Context)
             OPTIONAL MATCH (m)-[:TAGGED_WITH]->(t:Tag)
-            WHERE {where_clause}
             RETURN {cls.MEMORY_COLUMNS},
                    c.name as context, collect(t.name) as tags
-            ORDER BY m.created_at DESC
+        """
+
+    @classmethod
+    @cache
+    def list_memories(cls, where_clause: str = "TRUE") -> str:
+        """Query to list memories with pagination and filtering.
+
+        The filter and the page are applied before tags are joined, so tags
+        are only collected for the $limit memories that are returned.
+        """
+        return f"""
+            MATCH (m:Memory)
+            OPTIONAL MATCH (m)-[:ORIGINATED_IN]->(c:Context)
+            WITH m, c
+            WHERE {where_clause}
+            WITH m, c
+            ORDER BY m.created_at DESC, m.id
             SKIP $offset LIMIT $limit
+            OPTIONAL MATCH (m)-[:TAGGED_WITH]->(t:Tag)
+            RETURN {cls.MEMORY_COLUMNS},
+                   c.name as context, collect(t.name) as tags
+            ORDER BY m.created_at DESC, m.id
+        """
+
+    @classmethod
+    @cache
+    def vector_search(cls, where_clause: str = "TRUE") -> str:
+        """Query to get the $k nearest memories with context and tags.
+
+        Ranking happens in the HNSW index; the filters in where_clause are
+        applied to those candidates inside the database before tags are
+        joined, so only matching rows are returned. The similarity is
+        appended after the tags column.
+        """
+        return f"""
+            CALL QUERY_VECTOR_INDEX('Memory', 'memory_embedding_idx', $embedding, $k)
+            YIELD node AS m, distance
+            OPTIONAL MATCH (m)-[:ORIGINATED_IN]->(c:Context)
+            WITH m, distance, c
+            WHERE {where_clause}
+            OPTIONAL MATCH (m)-[:TAGGED_WITH]->(t:Tag)
+            RETURN {cls.MEMORY_COLUMNS},
+                   c.name as context, collect(t.name) as tags,
+                   1 - distance as similarity
+            ORDER BY similarity DESC
         """
 
     @classmethod
+    @cache
     def get_memories_by_tag(cls) -> str:
-        """Query to get memories with a specific tag."""
+        """Query to get memories with a specific tag.
+
+        Like get_frequently_accessed, the top-k is taken before context and
+        tags are joined; m.id breaks access_count ties deterministically.
+        """
         return f"""
-            MATCH (m:Memory)-[:TAGGED_WITH]->(t:Tag {{name: $tag}})
+            MATCH (m:Memory)-[:TAGGED_WITH]->(:Tag {{name: $tag}})
+            WITH m
+            ORDER BY m.access_count DESC, m.id
+            LIMIT $limit
             OPTIONAL MATCH (m)-[:ORIGINATED_IN]->(c:Context)
             OPTIONAL MATCH (m)-[:TAGGED_WITH]->(all_tags:Tag)
             RETURN {cls.MEMORY_COLUMNS},
                    c.name, collect(DISTINCT all_tags.name) as tags
-            ORDER BY m.access_count DESC
-            LIMIT $limit
+            ORDER BY m.access_count DESC, m.id
         """
 
     @classmethod
+    @cache
     def get_frequently_accessed(cls) -> str:
-        """Query to get frequently accessed memories."""
+        """Query to get frequently accessed memories.
+
+        KùzuDB has no secondary property indexes, so the top-k is taken on the
+        bare Memory scan first; context and tags are only joined for the
+        $limit surviving rows instead of for every matching memory. m.id
+        breaks access_count ties so the result (and the LIMIT cut-off) is
+        deterministic.
+        """
         return f"""
             MATCH (m:Memory)
             WHERE m.access_count >= $min_count
+            WITH m
+            ORDER BY m.access_count DESC, m.id
+            LIMIT $limit
             OPTIONAL MATCH (m)-[:ORIGINATED_IN]->(c:Context)
             OPTIONAL MATCH (m)-[:TAGGED_WITH]->(t:Tag)
             RETURN {cls.MEMORY_COLUMNS},
                    c.name, collect(t.name) as tags
-            ORDER BY m.access_count DESC
-            LIMIT $limit
+            ORDER BY m.access_count DESC, m.id
         """
 
     @classmethod
+    @cache
     def explore_linked(cls) -> str:
         """Query to get directly linked memories."""
         return f"""
@@ -180,6 +253,7 @@ class MemoryQueryBuilder:
         """
 
     @classmethod
+    @cache
     def explore_tag_siblings(cls) -> str:
         """Query to get memories sharing tags."""
         return f"""
@@ -196,6 +270,7 @@ class MemoryQueryBuilder:
         """
 
     @classmethod
+    @cache
     def explore_context_siblings(cls) -> str:
         """Query to get memories from same context."""
         return f"""
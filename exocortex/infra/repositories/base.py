@@ -9,14 +9,23 @@ This module provides the foundation for all repository operations including:
 
 from __future__ import annotations
 
+import hashlib
 import logging
+from collections import OrderedDict
+from collections.abc import Generator, Iterator
+from contextlib import contextmanager
 from datetime import datetime
-from typing import TYPE_CHECKING, TypeGuard
+from typing import TYPE_CHECKING, Any, TypeGuard
+
+import numpy as np
 
 from ...domain.models import (
     MemoryLink,
+    MemoryStats,
     MemoryType,
     MemoryWithContext,
+    Pattern,
+    RelationType,
 )
 from ..database import DatabaseConnection, SmartDatabaseManager
 from ..embeddings import EmbeddingEngine
@@ -26,6 +35,15 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Number of content embeddings kept by _embed_content
+EMBEDDING_CACHE_SIZE = 256
+
+# Number of search query embeddings kept by _embed_query
+QUERY_EMBEDDING_CACHE_SIZE = 1024
+
+# Distinct tag/context names kept by _intern before the pool is reset
+STRING_POOL_SIZE = 4096
+
 
 # =============================================================================
 # Type Guards for Database Manager
@@ -60,6 +78,18 @@ class BaseRepositoryMixin:
     _embedding_engine: EmbeddingEngine
     _max_summary_length: int
     _use_smart_manager: bool
+    _string_pool: dict[str, str]
+    _embedding_cache: OrderedDict[bytes, np.ndarray]
+    _query_embedding_cache: OrderedDict[bytes, np.ndarray]
+    _pattern_cache: OrderedDict[str, tuple[float, Pattern]]
+    _stats_cache: tuple[float, MemoryStats] | None
+    _memory_version: int
+    _fallback_snapshot: tuple[int, float, np.ndarray, list[list[Any]]] | None
+    _stale_index_version: int | None
+
+    # Stored value -> enum member; a dict lookup instead of the enum call
+    _memory_types = MemoryType._value2member_map_
+    _relation_types = RelationType._value2member_map_
 
     def _init_base(
         self,
@@ -78,6 +108,22 @@ class BaseRepositoryMixin:
         self._embedding_engine = embedding_engine
         self._max_summary_length = max_summary_length
         self._use_smart_manager = isinstance(db_manager, SmartDatabaseManager)
+        # Pool of tag/context names so repeated values share one str object
+        self._string_pool = {}
+        # LRU of content digest -> embedding (see _embed_content)
+        self._embedding_cache = OrderedDict()
+        # Separate LRU for search queries so they do not evict content
+        self._query_embedding_cache = OrderedDict()
+        # LRU of pattern id -> (fetched_at, Pattern) (see get_pattern_by_id)
+        self._pattern_cache = OrderedDict()
+        # (fetched_at, MemoryStats), dropped on every write (see get_stats)
+        self._stats_cache = None
+        # Bumped whenever memories change (see _memories_changed)
+        self._memory_version = 0
+        # (version, fetched_at, embeddings, metadata) (see _search_similar_fallback)
+        self._fallback_snapshot = None
+        # Memory version the vector index was found stale at (see search)
+        self._stale_index_version = None
 
     # =========================================================================
     # Connection Management
@@ -101,6 +147,23 @@ class BaseRepositoryMixin:
             return conn.execute(query, parameters=parameters)
         return conn.execute(query)
 
+    async def _execute_read_async(
+        self, query: str, parameters: dict | None = None
+    ) -> kuzu.QueryResult:
+        """Execute a read query on the read connection's pool.
+
+        Independent reads can be awaited together with asyncio.gather()
+        so their execution overlaps instead of running back to back.
+        """
+        conn = self._get_read_connection()
+        return await conn.execute_async(query, parameters)
+
+    def _execute_reads(
+        self, queries: list[tuple[str, dict | None]]
+    ) -> list[kuzu.QueryResult]:
+        """Execute independent read queries in parallel on the read connection."""
+        return self._get_read_connection().execute_concurrently(queries)
+
     def _execute_write(
         self, query: str, parameters: dict | None = None
     ) -> kuzu.QueryResult:
@@ -109,6 +172,7 @@ class BaseRepositoryMixin:
         For smart manager, this uses the write context with retry logic.
         Note: Call _release_write_lock() after completing all writes in a batch.
         """
+        self._stats_cache = None
         if _is_smart_manager(self._db_manager):
             write_conn = self._db_manager.get_write_connection()
             if parameters:
@@ -126,26 +190,151 @@ class BaseRepositoryMixin:
         if _is_smart_manager(self._db_manager):
             self._db_manager.release_write_lock()
 
+    @contextmanager
+    def write_batch(self) -> Generator[None, None, None]:
+        """Run all writes in the block as one transaction on one connection.
+
+        Without a batch every _execute_write reopens the write connection and
+        commits on its own. Inside a batch the connection is opened once, the
+        writes commit together (or roll back together if the block raises)
+        and the write lock is released on exit. Reads inside the block see
+        the batch's uncommitted writes. Batches nest.
+
+        Usage:
+            with repo.write_batch():
+                pattern_id, _, _ = repo.create_pattern(content)
+                repo.link_memory_to_pattern(memory_id, pattern_id)
+        """
+        if _is_smart_manager(self._db_manager):
+            batch = self._db_manager.write_transaction()
+        elif _is_legacy_connection(self._db_manager):
+            batch = self._db_manager.transaction()
+        else:
+            raise TypeError(f"Unknown db_manager type: {type(self._db_manager)}")
+
+        try:
+            with batch:
+                yield
+        except BaseException:
+            # The batch's writes were rolled back; drop anything read since
+            self._clear_read_caches()
+            raise
+
+    def _can_cache_reads(self) -> bool:
+        """Check whether read results may be stored in the repository caches.
+
+        Inside write_batch() reads see the batch's uncommitted writes, which
+        are gone if it rolls back, so they are not cached.
+        """
+        return not self._db_manager.in_transaction
+
+    def _clear_read_caches(self) -> None:
+        """Drop the cached stats, patterns and fallback search snapshot."""
+        self._stats_cache = None
+        self._pattern_cache.clear()
+        self._fallback_snapshot = None
+
+    @staticmethod
+    def _fetch_rows(result: kuzu.QueryResult) -> list[list[Any]]:
+        """Materialize all remaining rows of a query result.
+
+        has_next/get_next are bound once and driven by iter(callable, sentinel),
+        which avoids the per-row attribute lookups of a ``while has_next()``
+        loop (and the extra __next__ frame of iterating the result directly).
+        """
+        has_next = result.has_next
+        get_next = result.get_next
+        return [get_next() for _ in iter(has_next, False)]
+
+    @staticmethod
+    def _iter_rows(result: kuzu.QueryResult) -> Iterator[list[Any]]:
+        """Yield the remaining rows of a query result one at a time.
+
+        The streaming counterpart of _fetch_rows() for large scans whose rows
+        are packed into a compact structure as they arrive.
+        """
+        has_next = result.has_next
+        get_next = result.get_next
+        for _ in iter(has_next, False):
+            yield get_next()
+
     # =========================================================================
     # Utilities
     # =========================================================================
 
     def compute_similarity(
-        self, embedding1: list[float], embedding2: list[float]
+        self,
+        embedding1: list[float] | np.ndarray,
+        embedding2: list[float] | np.ndarray,
     ) -> float:
         """Compute similarity between two embeddings."""
         return self._embedding_engine.compute_similarity(embedding1, embedding2)
 
+    def compute_similarities(
+        self, embedding: list[float], embeddings: list[list[float]] | np.ndarray
+    ) -> list[float]:
+        """Compute similarity between one embedding and many others at once."""
+        return self._embedding_engine.compute_similarities(embedding, embeddings)
+
+    def _embed_content(self, content: str) -> list[float]:
+        """Embed memory content, reusing the embedding for repeated content.
+
+        Identical content (e.g. a retried update_memory call) is served from
+        an LRU keyed by a digest of the text instead of running the model
+        again.
+        """
+        return self._embed_cached(content, self._embedding_cache, EMBEDDING_CACHE_SIZE)
+
+    def _embed_query(self, query: str) -> list[float]:
+        """Embed a search query, reusing the embedding for repeated queries.
+
+        Same contract as _embed_content(), backed by its own larger LRU.
+        """
+        return self._embed_cached(
+            query, self._query_embedding_cache, QUERY_EMBEDDING_CACHE_SIZE
+        )
+
+    def _embed_cached(
+        self, text: str, cache: OrderedDict[bytes, np.ndarray], max_size: int
+    ) -> list[float]:
+        """Embed text through an LRU keyed by a digest of the text.
+
+        Entries are kept as float32 arrays rather than lists of Python
+        floats (4 bytes per component instead of ~32). The model emits
+        float32, so the list rebuilt on a hit is identical to a fresh embed.
+        """
+        key = hashlib.blake2b(text.encode(), digest_size=16).digest()
+        vector = cache.get(key)
+        if vector is not None:
+            cache.move_to_end(key)
+            return vector.tolist()
+
+        embedding = self._embedding_engine.embed(text)
+        cache[key] = np.asarray(embedding, dtype=np.float32)
+        if len(cache) > max_size:
+            cache.popitem(last=False)
+        return embedding
+
+    def _memories_changed(self) -> None:
+        """Invalidate caches built from memory nodes after a memory write.
+
+        Bumping the version also stops a scan that started before the write
+        from storing its (now outdated) result.
+        """
+        self._memory_version += 1
+        self._fallback_snapshot = None
+
     def _generate_summary(self, content: str) -> str:
         """Generate a summary from content."""
         content = content.strip()
         if len(content) <= self._max_summary_length:
             return content
 
+        # Cut back to the last word boundary if it is not too far back
         truncated = content[: self._max_summary_length]
-        last_space = truncated.rfind(" ")
-        if last_space > self._max_summary_length * 0.7:
-            truncated = truncated[:last_space]
+        head, space, _ = truncated.rpartition(" ")
+        if space and len(head) > self._max_summary_length * 0.7:
+            truncated = head
 
         return truncated + "..."
 
@@ -153,35 +342,102 @@ class BaseRepositoryMixin:
     # Tag Management
     # =========================================================================
 
+    @staticmethod
+    def _normalize_tags(tags: list[str]) -> list[str]:
+        """Strip and lowercase tags, dropping empty and duplicate names."""
+        names = dict.fromkeys(t.strip().lower() for t in tags)
+        return [name for name in names if name]
+
     def _create_tag_relationships(
         self, memory_id: str, tags: list[str], timestamp: datetime
     ) -> None:
-        """Create tag nodes and relationships for a memory."""
-        for tag in tags:
-            tag_normalized = tag.strip().lower()
-            if not tag_normalized:
-                continue
-
-            self._execute_write(
-                """
-                MERGE (t:Tag {name: $name})
-                ON CREATE SET t.created_at = $created_at
-                """,
-                parameters={"name": tag_normalized, "created_at": timestamp},
-            )
-
-            self._execute_write(
-                """
-                MATCH (m:Memory {id: $memory_id}), (t:Tag {name: $tag_name})
-                CREATE (m)-[:TAGGED_WITH]->(t)
-                """,
-                parameters={"memory_id": memory_id, "tag_name": tag_normalized},
-            )
+        """Create tag nodes and relationships for a memory.
+
+        Tags are normalized and de-duplicated, then merged in a single
+        UNWIND statement instead of two writes per tag.
+        """
+        names = self._normalize_tags(tags)
+        if not names:
+            return
+
+        self._execute_write(
+            """
+            MATCH (m:Memory {id: $memory_id})
+            UNWIND $names AS name
+            MERGE (t:Tag {name: name})
+            ON CREATE SET t.created_at = $created_at
+            MERGE (m)-[:TAGGED_WITH]->(t)
+            """,
+            parameters={
+                "memory_id": memory_id,
+                "names": names,
+                "created_at": timestamp,
+            },
+        )
+
+    def _replace_tag_relationships(
+        self, memory_id: str, tags: list[str], timestamp: datetime
+    ) -> None:
+        """Replace all tags of a memory in a single statement.
+
+        The memory's updated_at is set to timestamp, the old TAGGED_WITH
+        relationships are deleted and the new tags merged in one write; an
+        empty tag list only removes the old ones.
+        """
+        self._execute_write(
+            """
+            MATCH (m:Memory {id: $memory_id})
+            SET m.updated_at = $timestamp
+            WITH m
+            OPTIONAL MATCH (m)-[r:TAGGED_WITH]->(:Tag)
+            DELETE r
+            WITH DISTINCT m
+            UNWIND $names AS name
+            MERGE (t:Tag {name: name})
+            ON CREATE SET t.created_at = $timestamp
+            CREATE (m)-[:TAGGED_WITH]->(t)
+            """,
+            parameters={
+                "memory_id": memory_id,
+                "names": self._normalize_tags(tags),
+                "timestamp": timestamp,
+            },
+        )
 
     # =========================================================================
     # Row Mapping
     # =========================================================================
 
+    def _pooled(self) -> dict[str, str]:
+        """Return the string pool, resetting it once it reaches its cap.
+
+        Names of deleted tags and contexts would otherwise stay pooled for
+        the life of a long-running server; a reset only costs re-pooling the
+        names still in use.
+        """
+        pool = self._string_pool
+        if len(pool) >= STRING_POOL_SIZE:
+            pool.clear()
+        return pool
+
+    def _intern(self, value: str | None) -> str | None:
+        """Return the pooled instance of a repeated string (context name)."""
+        if value is None:
+            return None
+        return self._pooled().setdefault(value, value)
+
+    def _intern_tags(self, tags: list[str | None] | None) -> list[str]:
+        """Drop empty entries from a collected tag list and pool the rest.
+
+        The same handful of tag names come back on almost every row, so
+        pooling them keeps one str object per distinct tag instead of one
+        per row.
+        """
+        if not tags:
+            return []
+        pool = self._pooled()
+        return [pool.setdefault(t, t) for t in tags if t]
+
     def _row_to_memory(
         self,
         row: tuple,
@@ -202,40 +458,53 @@ class BaseRepositoryMixin:
              frustration_score, time_cost_hours, context, tags)
         """
         if include_content:
-            tags = [t for t in row[12] if t] if row[12] else []
-            return MemoryWithContext(
-                id=row[0],
-                content=row[1],
-                summary=row[2],
-                memory_type=MemoryType(row[3]),
-                created_at=row[4],
-                updated_at=row[5],
-                last_accessed_at=row[6],
-                access_count=row[7] if row[7] is not None else 1,
-                decay_rate=row[8] if row[8] is not None else 0.1,
-                frustration_score=row[9] if row[9] is not None else 0.0,
-                time_cost_hours=row[10],
-                context=row[11],
-                tags=tags,
-                similarity=similarity,
-                related_memories=related_memories or [],
-            )
+            (
+                memory_id,
+                content,
+                summary,
+                memory_type,
+                created_at,
+                updated_at,
+                last_accessed_at,
+                access_count,
+                decay_rate,
+                frustration_score,
+                time_cost_hours,
+                context,
+                tags,
+            ) = row[:13]
         else:
-            tags = [t for t in row[11] if t] if row[11] else []
-            return MemoryWithContext(
-                id=row[0],
-                content="",
-                summary=row[1],
-                memory_type=MemoryType(row[2]),
-                created_at=row[3],
-                updated_at=row[4],
-                last_accessed_at=row[5],
-                access_count=row[6] if row[6] is not None else 1,
-                decay_rate=row[7] if row[7] is not None else 0.1,
-                frustration_score=row[8] if row[8] is not None else 0.0,
-                time_cost_hours=row[9],
-                context=row[10],
-                tags=tags,
-                similarity=similarity,
-                related_memories=related_memories or [],
-            )
+            (
+                memory_id,
+                summary,
+                memory_type,
+                created_at,
+                updated_at,
+                last_accessed_at,
+                access_count,
+                decay_rate,
+                frustration_score,
+                time_cost_hours,
+                context,
+                tags,
+            ) = row[:12]
+            content = ""
+
+        # Unknown values are passed through for pydantic to reject
+        return MemoryWithContext(
+            id=memory_id,
+            content=content,
+            summary=summary,
+            memory_type=self._memory_types.get(memory_type, memory_type),
+            created_at=created_at,
+            updated_at=updated_at,
+            last_accessed_at=last_accessed_at,
+            access_count=1 if access_count is None else access_count,
+            decay_rate=0.1 if decay_rate is None else decay_rate,
+            frustration_score=0.0 if frustration_score is None else frustration_score,
+            time_cost_hours=time_cost_hours,
+            context=self._intern(context),
+            tags=self._intern_tags(tags),
+            similarity=similarity,
+            related_memories=related_memories or [],
+        )
@@ -5,8 +5,10 @@ This module handles memory-to-memory relationships and graph traversal.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import datetime, timezone
+from typing import TYPE_CHECKING
 
 from ...domain.exceptions import (
     DuplicateLinkError,
@@ -15,13 +17,15 @@ from ...domain.exceptions import (
 )
 from ...domain.models import (
     MemoryLink,
-    MemoryType,
     MemoryWithContext,
     RelationType,
 )
 from ..queries import MemoryQueryBuilder
 from .base import BaseRepositoryMixin
 
+if TYPE_CHECKING:
+    import kuzu
+
 logger = logging.getLogger(__name__)
 
 
@@ -55,11 +59,13 @@ class LinkMixin(BaseRepositoryMixin):
         if source_id == target_id:
             raise SelfLinkError(source_id)
 
-        # Check both memories exist
+        # Check both memories exist and the link does not, in one round trip:
+        # no row means a memory is missing, a relation type means a duplicate
         result = self._execute_read(
             """
             MATCH (s:Memory {id: $source_id}), (t:Memory {id: $target_id})
-            RETURN s.id, t.id
+            OPTIONAL MATCH (s)-[r:RELATED_TO]->(t)
+            RETURN r.relation_type
             """,
             parameters={"source_id": source_id, "target_id": target_id},
         )
@@ -67,17 +73,8 @@ class LinkMixin(BaseRepositoryMixin):
         if not result.has_next():
             raise MemoryNotFoundError(f"{source_id} or {target_id}")
 
-        # Check if link already exists
-        result = self._execute_read(
-            """
-            MATCH (s:Memory {id: $source_id})-[r:RELATED_TO]->(t:Memory {id: $target_id})
-            RETURN r.relation_type
-            """,
-            parameters={"source_id": source_id, "target_id": target_id},
-        )
-
-        if result.has_next():
-            existing_type = result.get_next()[0]
+        existing_type = result.get_next()[0]
+        if existing_type is not None:
             raise DuplicateLinkError(source_id, target_id, existing_type)
 
         now = datetime.now(timezone.utc)
@@ -103,30 +100,120 @@ class LinkMixin(BaseRepositoryMixin):
 
         self._release_write_lock()
 
-        logger.info(f"Linked memory {source_id} -> {target_id} ({relation_type.value})")
+        logger.info(
+            "Linked memory %s -> %s (%s)", source_id, target_id, relation_type.value
+        )
+
+    # Pairs whose endpoints are missing or that are already linked produce no
+    # row after the MATCH/WHERE and are skipped
+    _CREATE_LINKS_QUERY = """
+        UNWIND $links AS link
+        MATCH (s:Memory {id: link.source_id}), (t:Memory {id: link.target_id})
+        WHERE NOT EXISTS { MATCH (s)-[:RELATED_TO]->(t) }
+        CREATE (s)-[:RELATED_TO {
+            relation_type: link.relation_type,
+            reason: link.reason,
+            created_at: $created_at
+        }]->(t)
+        RETURN count(*)
+    """
+
+    def create_links(
+        self, links: list[tuple[str, str, RelationType, str | None]]
+    ) -> int:
+        """Create many links in one statement.
+
+        Unlike create_link(), invalid links are skipped rather than raised:
+        self-links, links whose memories don't exist and links that already
+        exist are left out of the count.
+
+        Args:
+            links: (source_id, target_id, relation_type, reason) tuples.
+
+        Returns:
+            Number of links created.
+        """
+        # A repeated pair would be created once per occurrence; the first wins
+        seen: set[tuple[str, str]] = set()
+        rows: list[dict[str, str]] = []
+        for source_id, target_id, relation_type, reason in links:
+            if source_id == target_id or (source_id, target_id) in seen:
+                continue
+            seen.add((source_id, target_id))
+            rows.append(
+                {
+                    "source_id": source_id,
+                    "target_id": target_id,
+                    "relation_type": relation_type.value,
+                    "reason": reason or "",
+                }
+            )
+        if not rows:
+            return 0
+
+        result = self._execute_write(
+            self._CREATE_LINKS_QUERY,
+            parameters={"links": rows, "created_at": datetime.now(timezone.utc)},
+        )
+        created = result.get_next()[0] if result.has_next() else 0
+
+        self._release_write_lock()
+
+        if created:
+            logger.info("Linked %d memory pairs", created)
+        return created
 
     # =========================================================================
     # Get Links
     # =========================================================================
 
+    _GET_LINKS_QUERY = """
+        MATCH (m:Memory {id: $id})-[r:RELATED_TO]->(t:Memory)
+        RETURN t.id, t.summary, r.relation_type, r.reason, r.created_at
+    """
+
     def get_links(self, memory_id: str) -> list[MemoryLink]:
         """Get all outgoing links from a memory."""
+        return self._build_links(
+            self._execute_read(self._GET_LINKS_QUERY, parameters={"id": memory_id})
+        )
+
+    async def get_links_async(self, memory_id: str) -> list[MemoryLink]:
+        """Get all outgoing links without blocking the event loop."""
+        return self._build_links(
+            await self._execute_read_async(
+                self._GET_LINKS_QUERY, parameters={"id": memory_id}
+            )
+        )
+
+    def get_links_raw(self, memory_id: str) -> list[tuple[str, str, str | None]]:
+        """Get all outgoing links as (target_id, relation_type, reason) tuples.
+
+        A lighter form of get_links() for callers that walk many memories and
+        only need the link endpoints: the target's summary and the link's
+        timestamp are not fetched and no MemoryLink objects are built.
+        """
         result = self._execute_read(
             """
             MATCH (m:Memory {id: $id})-[r:RELATED_TO]->(t:Memory)
-            RETURN t.id, t.summary, r.relation_type, r.reason, r.created_at
+            RETURN t.id, r.relation_type, r.reason
             """,
             parameters={"id": memory_id},
         )
+        return [
+            (target_id, relation_type, reason or None)
+            for target_id, relation_type, reason in self._fetch_rows(result)
+        ]
 
+    def _build_links(self, result: kuzu.QueryResult) -> list[MemoryLink]:
+        """Build MemoryLinks from the rows returned by _GET_LINKS_QUERY."""
         links: list[MemoryLink] = []
-        while result.has_next():
-            row = result.get_next()
+        for row in self._fetch_rows(result):
             links.append(
                 MemoryLink(
                     target_id=row[0],
                     target_summary=row[1],
-                    relation_type=RelationType(row[2]),
+                    relation_type=self._relation_types.get(row[2], row[2]),
                     reason=row[3] if row[3] else None,
                     created_at=row[4],
                 )
@@ -167,15 +254,14 @@ class LinkMixin(BaseRepositoryMixin):
         result = self._execute_read(query, parameters=params)
 
         links: list[MemoryLink] = []
-        while result.has_next():
-            row = result.get_next()
+        for row in self._fetch_rows(result):
             # Note: We store source_id in target_id field for API compatibility
             # The caller should interpret this as "source memory that links to us"
             links.append(
                 MemoryLink(
                     target_id=row[0],  # Actually the source memory ID
                     target_summary=row[1],
-                    relation_type=RelationType(row[2]),
+                    relation_type=self._relation_types.get(row[2], row[2]),
                     reason=row[3] if row[3] else None,
                     created_at=row[4],
                 )
@@ -187,31 +273,65 @@ class LinkMixin(BaseRepositoryMixin):
     # Delete Link
     # =========================================================================
 
+    _DELETE_LINK_QUERY = """
+        MATCH (s:Memory {id: $source_id})-[r:RELATED_TO]->(t:Memory {id: $target_id})
+        DELETE r
+        RETURN count(*)
+    """
+
     def delete_link(self, source_id: str, target_id: str) -> bool:
         """Delete a link between two memories."""
-        result = self._execute_read(
-            """
-            MATCH (s:Memory {id: $source_id})-[r:RELATED_TO]->(t:Memory {id: $target_id})
-            RETURN r
-            """,
+        result = self._execute_write(
+            self._DELETE_LINK_QUERY,
             parameters={"source_id": source_id, "target_id": target_id},
         )
+        deleted = result.get_next()[0] if result.has_next() else 0
 
-        if not result.has_next():
+        self._release_write_lock()
+
+        if not deleted:
             return False
 
-        self._execute_write(
-            """
-            MATCH (s:Memory {id: $source_id})-[r:RELATED_TO]->(t:Memory {id: $target_id})
-            DELETE r
-            """,
-            parameters={"source_id": source_id, "target_id": target_id},
+        logger.info("Unlinked memory %s -> %s", source_id, target_id)
+        return True
+
+    _DELETE_LINKS_QUERY = """
+        UNWIND $pairs AS pair
+        MATCH (s:Memory {id: pair.source_id})-[r:RELATED_TO]->(t:Memory {id: pair.target_id})
+        DELETE r
+        RETURN count(*)
+    """
+
+    def delete_links(self, pairs: list[tuple[str, str]]) -> int:
+        """Delete many links in one statement.
+
+        Args:
+            pairs: (source_id, target_id) pairs to unlink.
+
+        Returns:
+            Number of links deleted; missing links are skipped.
+        """
+        # A repeated pair would match (and be counted) once per occurrence
+        unique_pairs = list(dict.fromkeys(pairs))
+        if not unique_pairs:
+            return 0
+
+        result = self._execute_write(
+            self._DELETE_LINKS_QUERY,
+            parameters={
+                "pairs": [
+                    {"source_id": source_id, "target_id": target_id}
+                    for source_id, target_id in unique_pairs
+                ]
+            },
         )
+        deleted = result.get_next()[0] if result.has_next() else 0
 
         self._release_write_lock()
 
-        logger.info(f"Unlinked memory {source_id} -> {target_id}")
-        return True
+        if deleted:
+            logger.info("Unlinked %d memory links", deleted)
+        return deleted
 
     # =========================================================================
     # Graph Exploration
@@ -224,72 +344,103 @@ class LinkMixin(BaseRepositoryMixin):
         include_context_siblings: bool = True,
         max_per_category: int = 5,
     ) -> dict[str, list[MemoryWithContext]]:
-        """Explore memories related to a given memory."""
+        """Explore memories related to a given memory.
+
+        The linked, tag-sibling and context-sibling queries are independent,
+        so they run in parallel on the read connection pool.
+        """
+        params = {"id": memory_id, "limit": max_per_category}
+
+        queries = [MemoryQueryBuilder.explore_linked()]
+        if include_tag_siblings:
+            queries.append(MemoryQueryBuilder.explore_tag_siblings())
+        if include_context_siblings:
+            queries.append(MemoryQueryBuilder.explore_context_siblings())
+        results = iter(self._execute_reads([(query, params) for query in queries]))
+
+        linked_result = next(results)
+        tag_result = next(results) if include_tag_siblings else None
+        context_result = next(results) if include_context_siblings else None
+
+        return self._build_related(memory_id, linked_result, tag_result, context_result)
+
+    async def explore_related_async(
+        self,
+        memory_id: str,
+        include_tag_siblings: bool = True,
+        include_context_siblings: bool = True,
+        max_per_category: int = 5,
+    ) -> dict[str, list[MemoryWithContext]]:
+        """Explore related memories without blocking the event loop.
+
+        The linked, tag-sibling and context-sibling queries are independent,
+        so they run concurrently on the read connection pool.
+        """
+        params = {"id": memory_id, "limit": max_per_category}
+
+        async def _skip() -> None:
+            return None
+
+        linked_result, tag_result, context_result = await asyncio.gather(
+            self._execute_read_async(MemoryQueryBuilder.explore_linked(), params),
+            self._execute_read_async(MemoryQueryBuilder.explore_tag_siblings(), params)
+            if include_tag_siblings
+            else _skip(),
+            self._execute_read_async(
+                MemoryQueryBuilder.explore_context_siblings(), params
+            )
+            if include_context_siblings
+            else _skip(),
+        )
+
+        return self._build_related(memory_id, linked_result, tag_result, context_result)
+
+    def _build_related(
+        self,
+        memory_id: str,
+        linked_result: kuzu.QueryResult,
+        tag_result: kuzu.QueryResult | None,
+        context_result: kuzu.QueryResult | None,
+    ) -> dict[str, list[MemoryWithContext]]:
+        """Build the explore_related result from the three query results.
+
+        Memories already reported in an earlier category are skipped so each
+        memory appears only once (linked > by_tag > by_context).
+        """
         result_dict: dict[str, list[MemoryWithContext]] = {
             "linked": [],
             "by_tag": [],
             "by_context": [],
         }
 
-        # Get directly linked memories
-        result = self._execute_read(
-            MemoryQueryBuilder.explore_linked(),
-            parameters={"id": memory_id, "limit": max_per_category},
-        )
-
-        while result.has_next():
-            row = result.get_next()
-            tags = [t for t in row[12] if t]
-            memory = MemoryWithContext(
-                id=row[0],
-                content=row[1],
-                summary=row[2],
-                memory_type=MemoryType(row[3]),
-                created_at=row[4],
-                updated_at=row[5],
-                last_accessed_at=row[6],
-                access_count=row[7] if row[7] is not None else 1,
-                decay_rate=row[8] if row[8] is not None else 0.1,
-                frustration_score=row[9] if row[9] is not None else 0.0,
-                time_cost_hours=row[10],
-                context=row[11],
-                tags=tags,
+        # Directly linked memories
+        for row in self._fetch_rows(linked_result):
+            memory = self._row_to_memory(
+                row,
                 related_memories=[
                     MemoryLink(
                         target_id=memory_id,
-                        relation_type=RelationType(row[13]),
+                        relation_type=self._relation_types.get(row[13], row[13]),
                         reason=row[14] if row[14] else None,
                     )
                 ],
             )
             result_dict["linked"].append(memory)
 
-        # Get tag siblings
-        if include_tag_siblings:
-            result = self._execute_read(
-                MemoryQueryBuilder.explore_tag_siblings(),
-                parameters={"id": memory_id, "limit": max_per_category},
-            )
-
+        # Tag siblings
+        if tag_result is not None:
             seen_ids = {m.id for m in result_dict["linked"]}
-            while result.has_next():
-                row = result.get_next()
+            for row in self._fetch_rows(tag_result):
                 if row[0] in seen_ids:
                     continue
                 result_dict["by_tag"].append(self._row_to_memory(row))
                 seen_ids.add(row[0])
 
-        # Get context siblings
-        if include_context_siblings:
-            result = self._execute_read(
-                MemoryQueryBuilder.explore_context_siblings(),
-                parameters={"id": memory_id, "limit": max_per_category},
-            )
-
+        # Context siblings
+        if context_result is not None:
             seen_ids = {m.id for m in result_dict["linked"]}
             seen_ids.update(m.id for m in result_dict["by_tag"])
-            while result.has_next():
-                row = result.get_next()
+            for row in self._fetch_rows(context_result):
                 if row[0] in seen_ids:
                     continue
                 result_dict["by_context"].append(self._row_to_memory(row))
@@ -401,8 +552,7 @@ class LinkMixin(BaseRepositoryMixin):
                     parameters={"id": current_id, "relation_types": relation_types},
                 )
 
-                while result.has_next():
-                    row = result.get_next()
+                for row in self._fetch_rows(result):
                     node_id = row[0]
 
                     # Skip already visited nodes (handles cycles)
@@ -9,12 +9,17 @@ import logging
 import uuid
 from datetime import datetime, timezone
 
+import numpy as np
+
 from ...domain.models import MemoryType, MemoryWithContext
 from ..queries import MemoryQueryBuilder
 from .base import BaseRepositoryMixin
 
 logger = logging.getLogger(__name__)
 
+# IDs per DETACH DELETE statement in delete_memories()
+DELETE_MEMORIES_CHUNK = 10_000
+
 
 class MemoryCrudMixin(BaseRepositoryMixin):
     """Mixin for memory CRUD operations."""
@@ -23,6 +28,34 @@ class MemoryCrudMixin(BaseRepositoryMixin):
     # Create Operations
     # =========================================================================
 
+    # Memory node, context link and tag links in one statement. The tag
+    # UNWIND comes last, so an empty tag list only skips the tag writes.
+    # $tags must already be normalized (see _normalize_tags()).
+    _CREATE_MEMORY_QUERY = """
+        CREATE (m:Memory {
+            id: $id,
+            content: $content,
+            summary: $summary,
+            embedding: $embedding,
+            memory_type: $memory_type,
+            created_at: $created_at,
+            updated_at: $updated_at,
+            last_accessed_at: $last_accessed_at,
+            access_count: $access_count,
+            decay_rate: $decay_rate,
+            frustration_score: $frustration_score,
+            time_cost_hours: $time_cost_hours
+        })
+        MERGE (c:Context {name: $context_name})
+        ON CREATE SET c.created_at = $created_at
+        CREATE (m)-[:ORIGINATED_IN]->(c)
+        WITH m
+        UNWIND $tags AS name
+        MERGE (t:Tag {name: name})
+        ON CREATE SET t.created_at = $created_at
+        CREATE (m)-[:TAGGED_WITH]->(t)
+    """
+
     def create_memory(
         self,
         content: str,
@@ -48,26 +81,11 @@ class MemoryCrudMixin(BaseRepositoryMixin):
         memory_id = str(uuid.uuid4())
         now = datetime.now(timezone.utc)
         summary = self._generate_summary(content)
-        embedding = self._embedding_engine.embed(content)
+        embedding = self._embed_content(content)
+        normalized_tags = self._normalize_tags(tags)
 
-        # Create memory node with dynamics fields
         self._execute_write(
-            """
-            CREATE (m:Memory {
-                id: $id,
-                content: $content,
-                summary: $summary,
-                embedding: $embedding,
-                memory_type: $memory_type,
-                created_at: $created_at,
-                updated_at: $updated_at,
-                last_accessed_at: $last_accessed_at,
-                access_count: $access_count,
-                decay_rate: $decay_rate,
-                frustration_score: $frustration_score,
-                time_cost_hours: $time_cost_hours
-            })
-            """,
+            self._CREATE_MEMORY_QUERY,
             parameters={
                 "id": memory_id,
                 "content": content,
@@ -81,52 +99,14 @@ class MemoryCrudMixin(BaseRepositoryMixin):
                 "decay_rate": 0.1,
                 "frustration_score": frustration_score,
                 "time_cost_hours": time_cost_hours,
+                "context_name": context_name,
+                "tags": normalized_tags,
             },
         )
-
-        # Create or get context
-        self._execute_write(
-            """
-            MERGE (c:Context {name: $name})
-            ON CREATE SET c.created_at = $created_at
-            """,
-            parameters={"name": context_name, "created_at": now},
-        )
-
-        # Create relationship to context
-        self._execute_write(
-            """
-            MATCH (m:Memory {id: $memory_id}), (c:Context {name: $context_name})
-            CREATE (m)-[:ORIGINATED_IN]->(c)
-            """,
-            parameters={"memory_id": memory_id, "context_name": context_name},
-        )
-
-        # Create tags and relationships
-        for tag in tags:
-            tag_normalized = tag.strip().lower()
-            if not tag_normalized:
-                continue
-
-            self._execute_write(
-                """
-                MERGE (t:Tag {name: $name})
-                ON CREATE SET t.created_at = $created_at
-                """,
-                parameters={"name": tag_normalized, "created_at": now},
-            )
-
-            self._execute_write(
-                """
-                MATCH (m:Memory {id: $memory_id}), (t:Tag {name: $tag_name})
-                CREATE (m)-[:TAGGED_WITH]->(t)
-                """,
-                parameters={"memory_id": memory_id, "tag_name": tag_normalized},
-            )
-
         self._release_write_lock()
+        self._memories_changed()
 
-        logger.info(f"Created memory {memory_id} with {len(tags)} tags")
+        logger.info("Created memory %s with %d tags", memory_id, len(normalized_tags))
         return memory_id, summary, embedding
 
     # =========================================================================
@@ -145,6 +125,49 @@ class MemoryCrudMixin(BaseRepositoryMixin):
 
         return self._row_to_memory(result.get_next())
 
+    def get_by_ids(self, memory_ids: list[str]) -> dict[str, MemoryWithContext]:
+        """Get several memories by ID in one query.
+
+        Returns:
+            Mapping of memory ID to memory; IDs that do not exist are absent.
+        """
+        if not memory_ids:
+            return {}
+
+        result = self._execute_read(
+            MemoryQueryBuilder.get_by_ids(),
+            parameters={"ids": list(memory_ids)},
+        )
+        memories = (self._row_to_memory(row) for row in self._iter_rows(result))
+        return {memory.id: memory for memory in memories}
+
+    def get_embeddings(self, memory_ids: list[str]) -> dict[str, np.ndarray]:
+        """Get the stored embeddings of several memories in one query.
+
+        The embeddings are read from the nodes instead of being recomputed
+        and come back as float32 vectors.
+
+        Returns:
+            Mapping of memory ID to embedding; IDs that do not exist are absent.
+        """
+        if not memory_ids:
+            return {}
+
+        result = self._execute_read(
+            """
+            MATCH (m:Memory)
+            WHERE m.id IN $ids
+            RETURN m.id, m.embedding
+            """,
+            parameters={"ids": list(memory_ids)},
+        )
+        rows = self._fetch_rows(result)
+        if not rows:
+            return {}
+
+        matrix = np.array([row[1] for row in rows], dtype=np.float32)
+        return {row[0]: vector for row, vector in zip(rows, matrix, strict=True)}
+
     # =========================================================================
     # Update Operations
     # =========================================================================
@@ -159,18 +182,12 @@ class MemoryCrudMixin(BaseRepositoryMixin):
         """Update an existing memory.
 
         Note: Due to KùzuDB vector index constraints, updating content
-        requires delete-and-recreate of the memory node.
+        requires delete-and-recreate of the memory node (see
+        _recreate_memory()).
 
-        This method implements crash-safe update by:
-        1. Backing up all data before deletion
-        2. Attempting delete-and-recreate
-        3. Rolling back on failure using backup data
-
-        Warning:
-            This operation is NOT atomic at process crash level. If the process
-            is killed (OOM, SIGKILL, power loss) between deletion and recreation,
-            data may be lost. In such cases, backup data is logged for manual
-            recovery via logger.critical().
+        All writes run in a single transaction (see write_batch()), so a
+        failure part-way through the delete-and-recreate rolls the memory
+        back to its previous state.
 
         Returns:
             Tuple of (success, changes, summary).
@@ -194,7 +211,7 @@ class MemoryCrudMixin(BaseRepositoryMixin):
             return False, [], ""
 
         row = result.get_next()
-        # Backup all existing data for crash recovery
+        # Existing node data, carried over when the node is recreated
         backup = {
             "id": row[0],
             "content": row[1],
@@ -213,8 +230,6 @@ class MemoryCrudMixin(BaseRepositoryMixin):
 
         current_summary = backup["summary"]
         current_type = backup["memory_type"]
-        created_at = backup["created_at"]
-        context_name = backup["context_name"]
         existing_tags = backup["existing_tags"]
 
         changes: list[str] = []
@@ -227,45 +242,126 @@ class MemoryCrudMixin(BaseRepositoryMixin):
 
         # If content changes, we need to delete and recreate due to vector index
         if content is not None:
-            embedding = self._embedding_engine.embed(content)
+            embedding = self._embed_content(content)
             summary = self._generate_summary(content)
             new_type = memory_type.value if memory_type else current_type
 
-            # Get existing RELATED_TO links (both directions) - backup for recovery
-            outgoing_links = []
+            self._recreate_memory(
+                backup,
+                content=content,
+                summary=summary,
+                embedding=embedding,
+                memory_type=new_type,
+                tags=tags_to_apply,
+                now=now,
+            )
+
+            changes.append("content")
+            if memory_type is not None:
+                changes.append("memory_type")
+            if tags_changed:
+                changes.append("tags")
+
+        elif memory_type is not None or tags_changed:
+            # No content change - can update in place
+            with self.write_batch():
+                if memory_type is not None:
+                    self._execute_write(
+                        """
+                        MATCH (m:Memory {id: $id})
+                        SET m.memory_type = $memory_type,
+                            m.updated_at = $updated_at
+                        """,
+                        parameters={
+                            "id": memory_id,
+                            "memory_type": memory_type.value,
+                            "updated_at": now,
+                        },
+                    )
+                    changes.append("memory_type")
+
+                if tags_changed:
+                    # Also sets updated_at, so a tag-only change is one write
+                    self._replace_tag_relationships(memory_id, tags_to_apply, now)
+                    changes.append("tags")
+
+        if changes:
+            self._memories_changed()
+
+        # summary is either the freshly generated one or the stored one read above
+        logger.info("Updated memory %s: %s", memory_id, changes)
+        return True, changes, summary or ""
+
+    def _recreate_memory(
+        self,
+        backup: dict,
+        content: str,
+        summary: str,
+        embedding: list[float],
+        memory_type: str,
+        tags: list[str],
+        now: datetime,
+    ) -> None:
+        """Replace a memory node with a new one carrying the updated content.
+
+        The node's context, tags and RELATED_TO links (in both directions)
+        are recreated, and the dynamics fields are carried over from backup.
+        The links are read and all writes run in one transaction.
+        """
+        memory_id = backup["id"]
+        context_name = backup["context_name"]
+
+        with self.write_batch():
+            # Read the RELATED_TO links (both directions, one round trip)
+            # inside the transaction so none created concurrently are dropped
             result = self._execute_read(
                 """
                 MATCH (m:Memory {id: $id})-[r:RELATED_TO]->(t:Memory)
-                RETURN t.id, r.relation_type, r.reason, r.created_at
+                RETURN true AS outgoing, t.id, r.relation_type, r.reason,
+                       r.created_at
+                UNION ALL
+                MATCH (s:Memory)-[r:RELATED_TO]->(m:Memory {id: $id})
+                RETURN false AS outgoing, s.id, r.relation_type, r.reason,
+                       r.created_at
                 """,
                 parameters={"id": memory_id},
             )
-            while result.has_next():
-                outgoing_links.append(result.get_next())
-
+            outgoing_links = []
             incoming_links = []
-            result = self._execute_read(
-                """
-                MATCH (s:Memory)-[r:RELATED_TO]->(m:Memory {id: $id})
-                RETURN s.id, r.relation_type, r.reason, r.created_at
-                """,
+            for outgoing, *link in self._fetch_rows(result):
+                (outgoing_links if outgoing else incoming_links).append(link)
+
+            # Delete the old memory node and all its relationships
+            self._execute_write(
+                "MATCH (m:Memory {id: $id}) DETACH DELETE m",
                 parameters={"id": memory_id},
             )
-            while result.has_next():
-                incoming_links.append(result.get_next())
 
-            try:
-                # Delete the old memory node and all its relationships
-                for rel_query in [
-                    "MATCH (m:Memory {id: $id})-[r:ORIGINATED_IN]->(:Context) DELETE r",
-                    "MATCH (m:Memory {id: $id})-[r:TAGGED_WITH]->(:Tag) DELETE r",
-                    "MATCH (m:Memory {id: $id})-[r:RELATED_TO]->(:Memory) DELETE r",
-                    "MATCH (:Memory)-[r:RELATED_TO]->(m:Memory {id: $id}) DELETE r",
-                    "MATCH (m:Memory {id: $id}) DELETE m",
-                ]:
-                    self._execute_write(rel_query, parameters={"id": memory_id})
-
-                # Recreate memory with new content
+            node = {
+                "id": memory_id,
+                "content": content,
+                "summary": summary,
+                "embedding": embedding,
+                "memory_type": memory_type,
+                "created_at": backup["created_at"],
+                "updated_at": now,
+                "last_accessed_at": backup["last_accessed_at"],
+                "access_count": backup["access_count"],
+                "decay_rate": backup["decay_rate"],
+                "frustration_score": backup["frustration_score"],
+                "time_cost_hours": backup["time_cost_hours"],
+            }
+            if context_name:
+                # Recreate the node with its context and tags in one statement
+                self._execute_write(
+                    self._CREATE_MEMORY_QUERY,
+                    parameters={
+                        **node,
+                        "context_name": context_name,
+                        "tags": self._normalize_tags(tags),
+                    },
+                )
+            else:
                 self._execute_write(
                     """
                     CREATE (m:Memory {
@@ -283,320 +379,127 @@ class MemoryCrudMixin(BaseRepositoryMixin):
                         time_cost_hours: $time_cost_hours
                     })
                     """,
-                    parameters={
-                        "id": memory_id,
-                        "content": content,
-                        "summary": summary,
-                        "embedding": embedding,
-                        "memory_type": new_type,
-                        "created_at": created_at,
-                        "updated_at": now,
-                        "last_accessed_at": backup["last_accessed_at"],
-                        "access_count": backup["access_count"],
-                        "decay_rate": backup["decay_rate"],
-                        "frustration_score": backup["frustration_score"],
-                        "time_cost_hours": backup["time_cost_hours"],
-                    },
+                    parameters=node,
                 )
+                self._create_tag_relationships(memory_id, tags, now)
 
-                # Re-create context relationship
-                if context_name:
-                    self._execute_write(
-                        """
-                        MATCH (m:Memory {id: $memory_id}), (c:Context {name: $context_name})
-                        CREATE (m)-[:ORIGINATED_IN]->(c)
-                        """,
-                        parameters={
-                            "memory_id": memory_id,
-                            "context_name": context_name,
-                        },
-                    )
-
-                # Re-create tags (either new or existing)
-                self._create_tag_relationships(memory_id, tags_to_apply, now)
-
-                # Re-create RELATED_TO links
-                for link in outgoing_links:
-                    self._execute_write(
-                        """
-                        MATCH (s:Memory {id: $source_id}), (t:Memory {id: $target_id})
-                        CREATE (s)-[:RELATED_TO {
-                            relation_type: $relation_type,
-                            reason: $reason,
-                            created_at: $link_created_at
-                        }]->(t)
-                        """,
-                        parameters={
-                            "source_id": memory_id,
-                            "target_id": link[0],
-                            "relation_type": link[1],
-                            "reason": link[2] or "",
-                            "link_created_at": link[3],
-                        },
-                    )
-
-                for link in incoming_links:
-                    self._execute_write(
-                        """
-                        MATCH (s:Memory {id: $source_id}), (t:Memory {id: $target_id})
-                        CREATE (s)-[:RELATED_TO {
-                            relation_type: $relation_type,
-                            reason: $reason,
-                            created_at: $link_created_at
-                        }]->(t)
-                        """,
-                        parameters={
-                            "source_id": link[0],
-                            "target_id": memory_id,
-                            "relation_type": link[1],
-                            "reason": link[2] or "",
-                            "link_created_at": link[3],
-                        },
-                    )
-
-            except Exception as e:
-                # ROLLBACK: Attempt to restore from backup if creation failed
-                logger.error(f"Update failed, attempting rollback: {e}")
-                try:
-                    self._rollback_memory(
-                        backup, existing_tags, outgoing_links, incoming_links
-                    )
-                except Exception as rollback_error:
-                    logger.critical(
-                        f"CRITICAL: Rollback also failed for memory {memory_id}: {rollback_error}. "
-                        f"Backup data: {backup}"
-                    )
-                raise
-
-            changes.append("content")
-            if memory_type is not None:
-                changes.append("memory_type")
-            if tags_changed:
-                changes.append("tags")
-
-        else:
-            # No content change - can update in place
-            if memory_type is not None:
+            # Re-create RELATED_TO links, one UNWIND write per direction.
+            # CAST keeps created_at typed when every value in a batch is NULL.
+            if outgoing_links:
                 self._execute_write(
                     """
-                    MATCH (m:Memory {id: $id})
-                    SET m.memory_type = $memory_type,
-                        m.updated_at = $updated_at
+                    UNWIND $links AS link
+                    MATCH (s:Memory {id: $id}), (t:Memory {id: link.other_id})
+                    CREATE (s)-[:RELATED_TO {
+                        relation_type: link.relation_type,
+                        reason: link.reason,
+                        created_at: CAST(link.created_at AS TIMESTAMP)
+                    }]->(t)
                     """,
                     parameters={
                         "id": memory_id,
-                        "memory_type": memory_type.value,
-                        "updated_at": now,
+                        "links": self._link_params(outgoing_links),
                     },
                 )
-                changes.append("memory_type")
-
-            if tags_changed:
-                # Delete existing tag relationships
-                self._execute_write(
-                    """
-                    MATCH (m:Memory {id: $id})-[r:TAGGED_WITH]->(:Tag)
-                    DELETE r
-                    """,
-                    parameters={"id": memory_id},
-                )
-
-                # Create new tag relationships
-                self._create_tag_relationships(memory_id, tags_to_apply, now)
-                changes.append("tags")
-
-            # Update timestamp if only tags changed
-            if changes and memory_type is None:
-                self._execute_write(
-                    """
-                    MATCH (m:Memory {id: $id})
-                    SET m.updated_at = $updated_at
-                    """,
-                    parameters={"id": memory_id, "updated_at": now},
-                )
-
-        self._release_write_lock()
-
-        # Get updated summary if not already set
-        if not summary:
-            memory = self.get_by_id(memory_id)
-            summary = memory.summary if memory else ""
-
-        logger.info(f"Updated memory {memory_id}: {changes}")
-        return True, changes, summary
-
-    def _rollback_memory(
-        self,
-        backup: dict,
-        tags: list[str],
-        outgoing_links: list,
-        incoming_links: list,
-    ) -> None:
-        """Attempt to restore a memory from backup data after failed update.
-
-        This is a best-effort recovery mechanism. If this also fails,
-        the backup data is logged for manual recovery.
-        """
-        memory_id = backup["id"]
-        now = datetime.now(timezone.utc)
-
-        # Check if memory still exists (partial deletion might have occurred)
-        result = self._execute_read(
-            "MATCH (m:Memory {id: $id}) RETURN m.id",
-            parameters={"id": memory_id},
-        )
-        memory_exists = result.has_next()
-
-        if not memory_exists:
-            # Recreate memory from backup
-            embedding = self._embedding_engine.embed(backup["content"])
-            self._execute_write(
-                """
-                CREATE (m:Memory {
-                    id: $id,
-                    content: $content,
-                    summary: $summary,
-                    embedding: $embedding,
-                    memory_type: $memory_type,
-                    created_at: $created_at,
-                    updated_at: $updated_at,
-                    last_accessed_at: $last_accessed_at,
-                    access_count: $access_count,
-                    decay_rate: $decay_rate,
-                    frustration_score: $frustration_score,
-                    time_cost_hours: $time_cost_hours
-                })
-                """,
-                parameters={
-                    "id": memory_id,
-                    "content": backup["content"],
-                    "summary": backup["summary"],
-                    "embedding": embedding,
-                    "memory_type": backup["memory_type"],
-                    "created_at": backup["created_at"],
-                    "updated_at": backup["updated_at"],
-                    "last_accessed_at": backup["last_accessed_at"],
-                    "access_count": backup["access_count"],
-                    "decay_rate": backup["decay_rate"],
-                    "frustration_score": backup["frustration_score"],
-                    "time_cost_hours": backup["time_cost_hours"],
-                },
-            )
 
-        # Restore context relationship if needed
-        if backup["context_name"]:
-            result = self._execute_read(
-                """
-                MATCH (m:Memory {id: $id})-[:ORIGINATED_IN]->(:Context)
-                RETURN count(*) as cnt
-                """,
-                parameters={"id": memory_id},
-            )
-            if result.has_next() and result.get_next()[0] == 0:
+            if incoming_links:
                 self._execute_write(
                     """
-                    MATCH (m:Memory {id: $memory_id}), (c:Context {name: $context_name})
-                    CREATE (m)-[:ORIGINATED_IN]->(c)
+                    UNWIND $links AS link
+                    MATCH (s:Memory {id: link.other_id}), (t:Memory {id: $id})
+                    CREATE (s)-[:RELATED_TO {
+                        relation_type: link.relation_type,
+                        reason: link.reason,
+                        created_at: CAST(link.created_at AS TIMESTAMP)
+                    }]->(t)
                     """,
                     parameters={
-                        "memory_id": memory_id,
-                        "context_name": backup["context_name"],
+                        "id": memory_id,
+                        "links": self._link_params(incoming_links),
                     },
                 )
 
-        # Restore tags
-        self._create_tag_relationships(memory_id, tags, now)
-
-        # Restore outgoing links
-        for link in outgoing_links:
-            self._execute_write(
-                """
-                MATCH (s:Memory {id: $source_id}), (t:Memory {id: $target_id})
-                WHERE NOT EXISTS {
-                    MATCH (s)-[:RELATED_TO]->(t)
-                }
-                CREATE (s)-[:RELATED_TO {
-                    relation_type: $relation_type,
-                    reason: $reason,
-                    created_at: $link_created_at
-                }]->(t)
-                """,
-                parameters={
-                    "source_id": memory_id,
-                    "target_id": link[0],
-                    "relation_type": link[1],
-                    "reason": link[2] or "",
-                    "link_created_at": link[3],
-                },
-            )
-
-        # Restore incoming links
-        for link in incoming_links:
-            self._execute_write(
-                """
-                MATCH (s:Memory {id: $source_id}), (t:Memory {id: $target_id})
-                WHERE NOT EXISTS {
-                    MATCH (s)-[:RELATED_TO]->(t)
-                }
-                CREATE (s)-[:RELATED_TO {
-                    relation_type: $relation_type,
-                    reason: $reason,
-                    created_at: $link_created_at
-                }]->(t)
-                """,
-                parameters={
-                    "source_id": link[0],
-                    "target_id": memory_id,
-                    "relation_type": link[1],
-                    "reason": link[2] or "",
-                    "link_created_at": link[3],
-                },
-            )
-
-        logger.info(f"Successfully rolled back memory {memory_id}")
+    @staticmethod
+    def _link_params(links: list[list]) -> list[dict]:
+        """Convert (other_id, relation_type, reason, created_at) rows to UNWIND structs."""
+        return [
+            {
+                "other_id": other_id,
+                "relation_type": relation_type,
+                "reason": reason or "",
+                "created_at": created_at,
+            }
+            for other_id, relation_type, reason, created_at in links
+        ]
 
     # =========================================================================
     # Delete Operations
     # =========================================================================
 
     def delete_memory(self, memory_id: str) -> bool:
-        """Delete a memory and its relationships."""
-        result = self._execute_read(
-            "MATCH (m:Memory {id: $id}) RETURN m.id",
+        """Delete a memory and its relationships.
+
+        DETACH DELETE removes the node together with all of its
+        ORIGINATED_IN, TAGGED_WITH and RELATED_TO relationships in a single
+        statement; the returned count doubles as the existence check.
+        """
+        result = self._execute_write(
+            """
+            MATCH (m:Memory {id: $id})
+            DETACH DELETE m
+            RETURN count(*)
+            """,
             parameters={"id": memory_id},
         )
+        deleted = result.get_next()[0] if result.has_next() else 0
 
-        if not result.has_next():
+        self._release_write_lock()
+
+        if not deleted:
             return False
 
-        # Delete relationships
-        self._execute_write(
-            "MATCH (m:Memory {id: $id})-[r:ORIGINATED_IN]->(:Context) DELETE r",
-            parameters={"id": memory_id},
-        )
-        self._execute_write(
-            "MATCH (m:Memory {id: $id})-[r:TAGGED_WITH]->(:Tag) DELETE r",
-            parameters={"id": memory_id},
-        )
-        self._execute_write(
-            "MATCH (m:Memory {id: $id})-[r:RELATED_TO]->(:Memory) DELETE r",
-            parameters={"id": memory_id},
-        )
-        self._execute_write(
-            "MATCH (:Memory)-[r:RELATED_TO]->(m:Memory {id: $id}) DELETE r",
-            parameters={"id": memory_id},
-        )
+        self._memories_changed()
+        logger.info("Deleted memory %s", memory_id)
+        return True
 
-        # Delete node
-        self._execute_write(
-            "MATCH (m:Memory {id: $id}) DELETE m",
-            parameters={"id": memory_id},
-        )
+    _DELETE_MEMORIES_QUERY = """
+        MATCH (m:Memory)
+        WHERE m.id IN $ids
+        DETACH DELETE m
+        RETURN count(*)
+    """
 
-        self._release_write_lock()
+    def delete_memories(self, memory_ids: list[str]) -> int:
+        """Delete many memories and their relationships.
 
-        logger.info(f"Deleted memory {memory_id}")
-        return True
+        IDs are deleted DELETE_MEMORIES_CHUNK at a time, one statement per
+        chunk, all in a single transaction.
+
+        Args:
+            memory_ids: IDs of the memories to delete.
+
+        Returns:
+            Number of memories deleted; unknown IDs are skipped.
+        """
+        unique_ids = list(dict.fromkeys(memory_ids))
+        if not unique_ids:
+            return 0
+
+        deleted = 0
+        with self.write_batch():
+            for start in range(0, len(unique_ids), DELETE_MEMORIES_CHUNK):
+                result = self._execute_write(
+                    self._DELETE_MEMORIES_QUERY,
+                    parameters={
+                        "ids": unique_ids[start : start + DELETE_MEMORIES_CHUNK]
+                    },
+                )
+                deleted += result.get_next()[0] if result.has_next() else 0
+
+        if deleted:
+            self._memories_changed()
+            logger.info("Deleted %d memories", deleted)
+        return deleted
 
     # =========================================================================
     # Access Tracking
@@ -618,10 +521,10 @@ class MemoryCrudMixin(BaseRepositoryMixin):
                 parameters={"id": memory_id, "now": now},
             )
             self._release_write_lock()
-            logger.debug(f"Touched memory {memory_id}")
+            logger.debug("Touched memory %s", memory_id)
             return True
         except Exception as e:
-            logger.warning(f"Failed to touch memory {memory_id}: {e}")
+            logger.warning("Failed to touch memory %s: %s", memory_id, e)
             return False
 
     def touch_memories(self, memory_ids: list[str]) -> int:
@@ -646,8 +549,8 @@ class MemoryCrudMixin(BaseRepositoryMixin):
                 )
                 touched += 1
             except Exception as e:
-                logger.warning(f"Failed to touch memory {memory_id}: {e}")
+                logger.warning("Failed to touch memory %s: %s", memory_id, e)
 
         self._release_write_lock()
-        logger.debug(f"Touched {touched}/{len(memory_ids)} memories")
+        logger.debug("Touched %d/%d memories", touched, len(memory_ids))
         return touched
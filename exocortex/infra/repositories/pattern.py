@@ -5,9 +5,12 @@ This module handles Pattern node creation and memory-to-pattern linking.
 
 from __future__ import annotations
 
+import heapq
 import logging
+import time
 import uuid
 from datetime import datetime, timezone
+from operator import itemgetter
 
 from ...domain.models import MemoryWithContext, Pattern
 from ..queries import MemoryQueryBuilder
@@ -15,6 +18,10 @@ from .base import BaseRepositoryMixin
 
 logger = logging.getLogger(__name__)
 
+# get_pattern_by_id cache bounds
+PATTERN_CACHE_SIZE = 256
+PATTERN_CACHE_TTL = 60.0  # seconds
+
 
 class PatternMixin(BaseRepositoryMixin):
     """Mixin for pattern operations (Phase 2: Concept Abstraction)."""
@@ -40,7 +47,7 @@ class PatternMixin(BaseRepositoryMixin):
         pattern_id = str(uuid.uuid4())
         now = datetime.now(timezone.utc)
         summary = self._generate_summary(content)
-        embedding = self._embedding_engine.embed(content)
+        embedding = self._embed_content(content)
 
         self._execute_write(
             """
@@ -68,7 +75,7 @@ class PatternMixin(BaseRepositoryMixin):
         )
         self._release_write_lock()
 
-        logger.info(f"Created pattern {pattern_id}")
+        logger.info("Created pattern %s", pattern_id)
         return pattern_id, summary, embedding
 
     # =========================================================================
@@ -102,39 +109,42 @@ class PatternMixin(BaseRepositoryMixin):
             parameters={"memory_id": memory_id, "pattern_id": pattern_id},
         )
         if result.has_next() and result.get_next()[0] > 0:
-            logger.debug(f"Link already exists: {memory_id} -> {pattern_id}")
+            logger.debug("Link already exists: %s -> %s", memory_id, pattern_id)
             return True
 
-        # Create the link
-        self._execute_write(
-            """
-            MATCH (m:Memory {id: $memory_id}), (p:Pattern {id: $pattern_id})
-            CREATE (m)-[:INSTANCE_OF {confidence: $confidence, created_at: $created_at}]->(p)
-            """,
-            parameters={
-                "memory_id": memory_id,
-                "pattern_id": pattern_id,
-                "confidence": confidence,
-                "created_at": now,
-            },
-        )
+        with self.write_batch():
+            # Create the link
+            self._execute_write(
+                """
+                MATCH (m:Memory {id: $memory_id}), (p:Pattern {id: $pattern_id})
+                CREATE (m)-[:INSTANCE_OF {confidence: $confidence, created_at: $created_at}]->(p)
+                """,
+                parameters={
+                    "memory_id": memory_id,
+                    "pattern_id": pattern_id,
+                    "confidence": confidence,
+                    "created_at": now,
+                },
+            )
 
-        # Update pattern's instance count and confidence
-        self._execute_write(
-            """
-            MATCH (p:Pattern {id: $pattern_id})
-            SET p.instance_count = p.instance_count + 1,
-                p.updated_at = $now,
-                p.confidence = CASE
-                    WHEN p.confidence < 0.9 THEN p.confidence + 0.05
-                    ELSE p.confidence
-                END
-            """,
-            parameters={"pattern_id": pattern_id, "now": now},
-        )
-        self._release_write_lock()
+            # Update pattern's instance count and confidence
+            self._execute_write(
+                """
+                MATCH (p:Pattern {id: $pattern_id})
+                SET p.instance_count = p.instance_count + 1,
+                    p.updated_at = $now,
+                    p.confidence = CASE
+                        WHEN p.confidence < 0.9 THEN p.confidence + 0.05
+                        ELSE p.confidence
+                    END
+                """,
+                parameters={"pattern_id": pattern_id, "now": now},
+            )
+
+        # instance_count and confidence changed
+        self._pattern_cache.pop(pattern_id, None)
 
-        logger.info(f"Linked memory {memory_id} to pattern {pattern_id}")
+        logger.info("Linked memory %s to pattern %s", memory_id, pattern_id)
         return True
 
     # =========================================================================
@@ -168,19 +178,20 @@ class PatternMixin(BaseRepositoryMixin):
             )
 
             # Compute similarity manually (Pattern table may not have vector index)
-            patterns = []
-            while result.has_next():
-                row = result.get_next()
-                if row[2]:  # has embedding
-                    similarity = self.compute_similarity(embedding, row[2])
-                    patterns.append((row[0], row[1], similarity, row[3]))
+            rows = [row for row in self._fetch_rows(result) if row[2]]
+            similarities = self.compute_similarities(
+                embedding, [row[2] for row in rows]
+            )
+            patterns = [
+                (row[0], row[1], similarity, row[3])
+                for row, similarity in zip(rows, similarities, strict=True)
+            ]
 
-            # Sort by similarity and return top N
-            patterns.sort(key=lambda x: x[2], reverse=True)
-            return patterns[:limit]
+            # Top N by similarity without sorting every pattern
+            return heapq.nlargest(limit, patterns, key=itemgetter(2))
 
         except Exception as e:
-            logger.warning(f"Pattern search error: {e}")
+            logger.warning("Pattern search error: %s", e)
             return []
 
     # =========================================================================
@@ -190,12 +201,25 @@ class PatternMixin(BaseRepositoryMixin):
     def get_pattern_by_id(self, pattern_id: str) -> Pattern | None:
         """Get a pattern by ID.
 
+        Results are cached for PATTERN_CACHE_TTL seconds; the entry is
+        dropped when link_memory_to_pattern() changes the pattern. The TTL
+        bounds staleness from writes made by other processes.
+
         Args:
             pattern_id: The pattern ID.
 
         Returns:
             Pattern model or None if not found.
         """
+        cache = self._pattern_cache
+        cached = cache.get(pattern_id)
+        if cached is not None:
+            fetched_at, pattern = cached
+            if time.monotonic() - fetched_at < PATTERN_CACHE_TTL:
+                cache.move_to_end(pattern_id)
+                return pattern.model_copy()
+            del cache[pattern_id]
+
         result = self._execute_read(
             """
             MATCH (p:Pattern {id: $id})
@@ -209,7 +233,7 @@ class PatternMixin(BaseRepositoryMixin):
             return None
 
         row = result.get_next()
-        return Pattern(
+        pattern = Pattern(
             id=row[0],
             content=row[1],
             summary=row[2],
@@ -219,6 +243,13 @@ class PatternMixin(BaseRepositoryMixin):
             updated_at=row[6],
         )
 
+        if not self._can_cache_reads():
+            return pattern
+        cache[pattern_id] = (time.monotonic(), pattern)
+        if len(cache) > PATTERN_CACHE_SIZE:
+            cache.popitem(last=False)
+        return pattern.model_copy()
+
     # =========================================================================
     # Get Memories by Tag/Frequency
     # =========================================================================
@@ -243,8 +274,7 @@ class PatternMixin(BaseRepositoryMixin):
         )
 
         memories = []
-        while result.has_next():
-            row = result.get_next()
+        for row in self._fetch_rows(result):
             memories.append(self._row_to_memory(row))
 
         return memories
@@ -269,8 +299,7 @@ class PatternMixin(BaseRepositoryMixin):
         )
 
         memories = []
-        while result.has_next():
-            row = result.get_next()
+        for row in self._fetch_rows(result):
             memories.append(self._row_to_memory(row))
 
         return memories
@@ -7,15 +7,22 @@ from __future__ import annotations
 
 import logging
 import math
+import time
 from datetime import datetime, timezone
 from typing import Any
 
+import numpy as np
+
 from ...domain.models import MemoryType, MemoryWithContext
 from ..queries import MemoryQueryBuilder
 from .base import BaseRepositoryMixin
 
 logger = logging.getLogger(__name__)
 
+# Rows preallocated for the embedding matrix of the Python-side fallback scan
+FALLBACK_INITIAL_ROWS = 1024
+FALLBACK_SNAPSHOT_TTL = 60.0  # seconds
+
 
 class SearchMixin(BaseRepositoryMixin):
     """Mixin for search operations with hybrid scoring."""
@@ -45,6 +52,9 @@ class SearchMixin(BaseRepositoryMixin):
         """
         fetch_limit = limit + 5 if exclude_id else limit
 
+        if not self._use_vector_index():
+            return self._search_similar_fallback(embedding, limit, exclude_id)
+
         try:
             result = self._execute_read(
                 """
@@ -59,12 +69,15 @@ class SearchMixin(BaseRepositoryMixin):
                 parameters={"embedding": embedding, "k": fetch_limit},
             )
         except Exception as e:
-            logger.warning(f"Vector index search failed, using fallback: {e}")
+            logger.warning("Vector index search failed, using fallback: %s", e)
+            return self._search_similar_fallback(embedding, limit, exclude_id)
+
+        rows = self._fetch_rows(result)
+        if not rows and self._vector_index_is_stale(embedding):
             return self._search_similar_fallback(embedding, limit, exclude_id)
 
         memories = []
-        while result.has_next():
-            row = result.get_next()
+        for row in rows:
             if exclude_id and row[0] == exclude_id:
                 continue
             memories.append((row[0], row[1], row[2], row[3], row[4]))
@@ -80,25 +93,70 @@ class SearchMixin(BaseRepositoryMixin):
         exclude_id: str | None,
     ) -> list[tuple[str, str, float, str, str | None]]:
         """Fallback similarity search using Python-side computation."""
-        result = self._execute_read("""
-            MATCH (m:Memory)
-            OPTIONAL MATCH (m)-[:ORIGINATED_IN]->(c:Context)
-            RETURN m.id, m.summary, m.embedding, m.memory_type, c.name as context
-        """)
+        matrix, metadata = self._fallback_embeddings(len(embedding))
+        if not metadata:
+            return []
 
-        memories_with_scores: list[tuple[str, str, float, str, str | None]] = []
+        # One spare candidate so the excluded memory can be skipped
+        top = self._embedding_engine.top_similarities(
+            embedding, matrix, limit + 1 if exclude_id else limit
+        )
 
-        while result.has_next():
-            row = result.get_next()
-            memory_id = row[0]
-            if exclude_id and memory_id == exclude_id:
+        memories_with_scores: list[tuple[str, str, float, str, str | None]] = []
+        for index, similarity in top:
+            memory_id, summary, memory_type, context = metadata[index]
+            if memory_id == exclude_id:
                 continue
+            memories_with_scores.append(
+                (memory_id, summary, similarity, memory_type, context)
+            )
+        return memories_with_scores[:limit]
 
-            similarity = self._embedding_engine.compute_similarity(embedding, row[2])
-            memories_with_scores.append((memory_id, row[1], similarity, row[3], row[4]))
+    def _fallback_embeddings(
+        self, dimensions: int
+    ) -> tuple[np.ndarray, list[list[Any]]]:
+        """Get every memory's embedding matrix and (id, summary, type, context).
 
-        memories_with_scores.sort(key=lambda x: x[2], reverse=True)
-        return memories_with_scores[:limit]
+        The scan is kept as a snapshot, so repeated fallback searches score
+        against memory instead of re-reading every embedding. Memory writes
+        through this repository drop it (see _memories_changed()); the TTL
+        bounds staleness from writes made by other processes.
+        """
+        version = self._memory_version
+        snapshot = self._fallback_snapshot
+        if (
+            snapshot is not None
+            and snapshot[0] == version
+            and time.monotonic() - snapshot[1] < FALLBACK_SNAPSHOT_TTL
+        ):
+            return snapshot[2], snapshot[3]
+
+        result = self._execute_read(
+            """
+            MATCH (m:Memory)
+            OPTIONAL MATCH (m)-[:ORIGINATED_IN]->(c:Context)
+            RETURN m.id, m.summary, m.memory_type, c.name as context, m.embedding
+            """
+        )
+
+        # Struct of arrays: each embedding is copied into a preallocated
+        # float32 matrix as its row arrives (doubling it when full), so only
+        # one row's boxed Python floats are alive at a time
+        metadata: list[list[Any]] = []
+        matrix = np.empty((FALLBACK_INITIAL_ROWS, dimensions), dtype=np.float32)
+        for row, (*meta, vector) in enumerate(self._iter_rows(result)):
+            if row == len(matrix):
+                grown = np.empty((2 * row, matrix.shape[1]), dtype=np.float32)
+                grown[:row] = matrix
+                matrix = grown
+            matrix[row] = vector
+            metadata.append(meta)
+        # Trim to the rows read, so the snapshot does not pin the spare rows
+        matrix = matrix[: len(metadata)].copy()
+
+        if version == self._memory_version and self._can_cache_reads():
+            self._fallback_snapshot = (version, time.monotonic(), matrix, metadata)
+        return matrix, metadata
 
     # =========================================================================
     # High-Level Search
@@ -115,6 +173,10 @@ class SearchMixin(BaseRepositoryMixin):
     ) -> tuple[list[MemoryWithContext], int]:
         """Search memories by semantic similarity with hybrid scoring.
 
+        Candidates come from the vector index with the context, type and tag
+        filters evaluated in the same query; Python-side filtering is only
+        used when the vector index cannot be queried.
+
         Args:
             query: Search query.
             limit: Maximum results.
@@ -126,44 +188,138 @@ class SearchMixin(BaseRepositoryMixin):
         Returns:
             Tuple of (memories, total_found).
         """
-        query_embedding = self._embedding_engine.embed(query)
+        query_embedding = self._embed_query(query)
 
         # Fetch more candidates to account for filtering and reranking
         fetch_multiplier = 5 if use_hybrid_scoring else 3
         if context_filter or tag_filter or type_filter:
             fetch_multiplier += 2
-        candidates = self.search_similar_by_embedding(
-            embedding=query_embedding,
-            limit=limit * fetch_multiplier + 20,
+        fetch_limit = limit * fetch_multiplier + 20
+
+        where_clause, params = self._filter_clause(
+            context_filter, tag_filter, type_filter
         )
+        params["embedding"] = query_embedding
+        params["k"] = fetch_limit
+
+        memories: list[MemoryWithContext] | None = None
+        if self._use_vector_index():
+            try:
+                memories = self._query_vector_candidates(where_clause, params)
+                if where_clause != "TRUE" and len(memories) < limit:
+                    # Filters only see the approximate top-k; widen the
+                    # candidate pool until enough memories match or it
+                    # covers every memory
+                    total = self._count_memories()
+                    while len(memories) < limit and params["k"] < total:
+                        params["k"] = min(params["k"] * 4, total)
+                        memories = self._query_vector_candidates(where_clause, params)
+            except Exception as e:
+                logger.warning("Vector index search failed, using fallback: %s", e)
+                memories = None
+            else:
+                if not memories and self._vector_index_is_stale(query_embedding):
+                    memories = None
+
+        if memories is None:
+            memories = self._search_by_similarity_fallback(
+                query_embedding, fetch_limit, context_filter, tag_filter, type_filter
+            )
 
-        memories: list[MemoryWithContext] = []
+        # Apply hybrid scoring if enabled
+        if use_hybrid_scoring and memories:
+            memories = self._apply_hybrid_scoring(memories)
 
-        for memory_id, _summary, similarity, memory_type, context in candidates:
-            # Apply filters
-            if context_filter and context != context_filter:
-                continue
-            if type_filter and memory_type != type_filter.value:
-                continue
+        return memories[:limit], len(memories[:limit])
+
+    def _query_vector_candidates(
+        self, where_clause: str, params: dict[str, Any]
+    ) -> list[MemoryWithContext]:
+        """Fetch the filtered $k nearest memories from the vector index."""
+        result = self._execute_read(
+            MemoryQueryBuilder.vector_search(where_clause), parameters=params
+        )
+        return [
+            self._row_to_memory(row, similarity=row[13])
+            for row in self._fetch_rows(result)
+        ]
+
+    def _use_vector_index(self) -> bool:
+        """Check whether the vector index is worth querying.
+
+        Once found stale it is skipped until memories change, when the next
+        empty search probes it again.
+        """
+        return self._stale_index_version != self._memory_version
+
+    def _vector_index_is_stale(self, embedding: list[float]) -> bool:
+        """Check whether the vector index has lost track of existing memories.
+
+        KùzuDB's HNSW index is maintained on every CREATE and DELETE, but once
+        it has been emptied by deletes it stops returning nodes inserted
+        afterwards, and it cannot be rebuilt. Only called when a search came
+        back empty; the result is remembered for the current memory version
+        and the warning is logged the first time only.
+        """
+        version = self._memory_version
+        result = self._execute_read(
+            """
+            CALL QUERY_VECTOR_INDEX('Memory', 'memory_embedding_idx', $embedding, 1)
+            RETURN node.id
+            """,
+            parameters={"embedding": embedding},
+        )
+        if result.has_next() or self._count_memories() == 0:
+            return False
+        if self._stale_index_version is None:
+            logger.warning("Vector index returned no memories, using fallback")
+        self._stale_index_version = version
+        return True
+
+    def _count_memories(self) -> int:
+        """Count all memory nodes."""
+        result = self._execute_read("MATCH (m:Memory) RETURN count(m)")
+        return result.get_next()[0] if result.has_next() else 0
+
+    def _search_by_similarity_fallback(
+        self,
+        query_embedding: list[float],
+        fetch_limit: int,
+        context_filter: str | None,
+        tag_filter: list[str] | None,
+        type_filter: MemoryType | None,
+    ) -> list[MemoryWithContext]:
+        """Fallback filtered search using Python-side filtering."""
+        # The vector index already failed or is stale; do not query it again
+        candidates = self._search_similar_fallback(query_embedding, fetch_limit, None)
+
+        # Normalize the filters once instead of per candidate
+        type_value = type_filter.value if type_filter else None
+        wanted_tags = frozenset(self._normalize_tags(tag_filter or []))
 
-            # Get full memory with tags for tag filtering
-            full_memory = self.get_by_id(memory_id)  # type: ignore
+        matches = [
+            (memory_id, similarity)
+            for memory_id, _summary, similarity, memory_type, context in candidates
+            if not (context_filter and context != context_filter)
+            and not (type_value and memory_type != type_value)
+        ]
+
+        # Full memories with tags for the survivors, in one query
+        by_id = self.get_by_ids([memory_id for memory_id, _ in matches])  # type: ignore
+
+        memories: list[MemoryWithContext] = []
+        for memory_id, similarity in matches:
+            full_memory = by_id.get(memory_id)
             if full_memory is None:
                 continue
 
-            if tag_filter:
-                tag_set = set(full_memory.tags)
-                if not any(t.lower() in tag_set for t in tag_filter):
-                    continue
+            if tag_filter and wanted_tags.isdisjoint(full_memory.tags):
+                continue
 
             full_memory.similarity = similarity
             memories.append(full_memory)
 
-        # Apply hybrid scoring if enabled
-        if use_hybrid_scoring and memories:
-            memories = self._apply_hybrid_scoring(memories)
-
-        return memories[:limit], len(memories[:limit])
+        return memories
 
     # =========================================================================
     # Hybrid Scoring
@@ -229,9 +385,14 @@ class SearchMixin(BaseRepositoryMixin):
             scored_memories.append((hybrid_score, memory))
 
             logger.debug(
-                f"Memory {memory.id[:8]}... hybrid={hybrid_score:.3f} "
-                f"(vec={s_vec:.3f}, recency={s_recency:.3f}, "
-                f"freq={s_freq:.3f}, frustration={s_frustration:.3f})"
+                "Memory %s... hybrid=%.3f (vec=%.3f, recency=%.3f, "
+                "freq=%.3f, frustration=%.3f)",
+                memory.id[:8],
+                hybrid_score,
+                s_vec,
+                s_recency,
+                s_freq,
+                s_frustration,
             )
 
         # Sort by hybrid score (descending)
@@ -257,24 +418,20 @@ class SearchMixin(BaseRepositoryMixin):
         tag_filter: list[str] | None = None,
         type_filter: MemoryType | None = None,
     ) -> tuple[list[MemoryWithContext], int, bool]:
-        """List memories with pagination."""
-        where_clauses = []
-        params: dict[str, Any] = {}
-
-        if context_filter:
-            where_clauses.append("c.name = $context_filter")
-            params["context_filter"] = context_filter
+        """List memories with pagination.
 
-        if type_filter:
-            where_clauses.append("m.memory_type = $type_filter")
-            params["type_filter"] = type_filter.value
-
-        where_clause = " AND ".join(where_clauses) if where_clauses else "TRUE"
+        All filters are evaluated in the database before SKIP/LIMIT, so
+        pages and total_count only cover matching memories.
+        """
+        where_clause, params = self._filter_clause(
+            context_filter, tag_filter, type_filter
+        )
 
         # Get total count
         count_query = f"""
             MATCH (m:Memory)
             OPTIONAL MATCH (m)-[:ORIGINATED_IN]->(c:Context)
+            WITH m, c
             WHERE {where_clause}
             RETURN count(DISTINCT m.id) as total
         """
@@ -287,18 +444,39 @@ class SearchMixin(BaseRepositoryMixin):
         params["limit"] = limit
 
         result = self._execute_read(query, parameters=params)
-        memories: list[MemoryWithContext] = []
+        memories = [self._row_to_memory(row) for row in self._fetch_rows(result)]
 
-        while result.has_next():
-            row = result.get_next()
-            tags = [t for t in row[12] if t] if row[12] else []
+        has_more = offset + len(memories) < total_count
+        return memories, total_count, has_more
 
-            if tag_filter:
-                tag_set = set(tags)
-                if not any(t.lower() in tag_set for t in tag_filter):
-                    continue
+    def _filter_clause(
+        self,
+        context_filter: str | None,
+        tag_filter: list[str] | None,
+        type_filter: MemoryType | None,
+    ) -> tuple[str, dict[str, Any]]:
+        """Build the WHERE clause and parameters for the memory filters.
+
+        The clause refers to the memory as ``m`` and its context as ``c``.
+        Tag filters are normalized the same way as stored tags.
+        """
+        where_clauses = []
+        params: dict[str, Any] = {}
 
-            memories.append(self._row_to_memory(row))
+        if context_filter:
+            where_clauses.append("c.name = $context_filter")
+            params["context_filter"] = context_filter
 
-        has_more = offset + len(memories) < total_count
-        return memories, total_count, has_more
+        if type_filter:
+            where_clauses.append("m.memory_type = $type_filter")
+            params["type_filter"] = type_filter.value
+
+        if tag_filter:
+            where_clauses.append(
+                "EXISTS { MATCH (m)-[:TAGGED_WITH]->(ft:Tag) "
+                "WHERE ft.name IN $tag_filter }"
+            )
+            params["tag_filter"] = self._normalize_tags(tag_filter)
+
+        where_clause = " AND ".join(where_clauses) if where_clauses else "TRUE"
+        return where_clause, params
@@ -6,14 +6,20 @@ This module handles memory statistics and knowledge health queries.
 from __future__ import annotations
 
 import logging
+import time
 from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from ...domain.models import MemoryStats
+from ...domain.models import KnowledgeHealthSnapshot, MemoryStats, MemoryType
 from .base import BaseRepositoryMixin
 
+if TYPE_CHECKING:
+    import kuzu
+
 logger = logging.getLogger(__name__)
 
+STATS_CACHE_TTL = 5.0  # seconds
+
 
 class StatsMixin(BaseRepositoryMixin):
     """Mixin for statistics and health analysis operations."""
@@ -22,39 +28,87 @@ class StatsMixin(BaseRepositoryMixin):
     # Statistics
     # =========================================================================
 
+    # Single aggregation query for all statistics. OPTIONAL MATCH keeps the
+    # WITH chain alive on an empty database (one NULL group with count 0).
+    # TAGGED_WITH only runs from Memory, so its source is left unlabelled:
+    # tag counts then come from the relationship table alone, without
+    # scanning Memory and hash-joining it back in. The top ten are picked by
+    # a TOP_K heap over the grouped counts rather than a full sort.
+    _STATS_QUERY = """
+        OPTIONAL MATCH (m:Memory)
+        WITH m.memory_type AS memory_type, count(m) AS type_count
+        WITH collect({memory_type: memory_type, count: type_count}) AS by_type
+        OPTIONAL MATCH (t:Tag)<-[:TAGGED_WITH]-()
+        WITH by_type, t.name AS tag_name, count(t) AS tag_count
+        ORDER BY tag_count DESC
+        LIMIT 10
+        WITH by_type, collect({name: tag_name, count: tag_count}) AS top_tags
+        RETURN by_type, top_tags,
+               COUNT { MATCH (c:Context) } AS total_contexts,
+               COUNT { MATCH (t:Tag) } AS total_tags
+    """
+
     def get_stats(self) -> MemoryStats:
-        """Get statistics about stored memories."""
-        result = self._execute_read("MATCH (m:Memory) RETURN count(m)")
-        total_memories = result.get_next()[0] if result.has_next() else 0
-
-        result = self._execute_read("""
-            MATCH (m:Memory)
-            RETURN m.memory_type, count(m) as count
-        """)
-        memories_by_type: dict[str, int] = {}
-        while result.has_next():
-            row = result.get_next()
-            memories_by_type[row[0]] = row[1]
-
-        result = self._execute_read("MATCH (c:Context) RETURN count(c)")
-        total_contexts = result.get_next()[0] if result.has_next() else 0
-
-        result = self._execute_read("MATCH (t:Tag) RETURN count(t)")
-        total_tags = result.get_next()[0] if result.has_next() else 0
-
-        result = self._execute_read("""
-            MATCH (m:Memory)-[:TAGGED_WITH]->(t:Tag)
-            RETURN t.name, count(m) as count
-            ORDER BY count DESC
-            LIMIT 10
-        """)
-        top_tags: list[dict[str, Any]] = []
-        while result.has_next():
-            row = result.get_next()
-            top_tags.append({"name": row[0], "count": row[1]})
+        """Get statistics about stored memories.
+
+        Results are cached for STATS_CACHE_TTL seconds so that polling
+        callers (e.g. the dashboard) do not rescan the graph each time. Any
+        write through this repository drops the cached value; the TTL bounds
+        staleness from writes made by other processes.
+        """
+        cached = self._cached_stats()
+        if cached is not None:
+            return cached
+        return self._cache_stats(
+            self._build_stats(self._execute_read(self._STATS_QUERY))
+        )
+
+    async def get_stats_async(self) -> MemoryStats:
+        """Get statistics about stored memories without blocking the event loop."""
+        cached = self._cached_stats()
+        if cached is not None:
+            return cached
+        return self._cache_stats(
+            self._build_stats(await self._execute_read_async(self._STATS_QUERY))
+        )
+
+    def _cached_stats(self) -> MemoryStats | None:
+        """Return a copy of the cached stats if they are still fresh."""
+        if self._stats_cache is None:
+            return None
+        fetched_at, stats = self._stats_cache
+        if time.monotonic() - fetched_at >= STATS_CACHE_TTL:
+            self._stats_cache = None
+            return None
+        return stats.model_copy(deep=True)
+
+    def _cache_stats(self, stats: MemoryStats) -> MemoryStats:
+        """Store freshly computed stats and return a copy for the caller."""
+        if not self._can_cache_reads():
+            return stats
+        self._stats_cache = (time.monotonic(), stats)
+        return stats.model_copy(deep=True)
+
+    def _build_stats(self, result: kuzu.QueryResult) -> MemoryStats:
+        """Build MemoryStats from the single row returned by _STATS_QUERY."""
+        by_type, tag_counts, total_contexts, total_tags = result.get_next()
+
+        # Empty groups come back as a single {NULL: 0} entry
+        memories_by_type: dict[str, int] = {
+            entry["memory_type"]: entry["count"] for entry in by_type if entry["count"]
+        }
+        top_tags: list[dict[str, Any]] = sorted(
+            (
+                {"name": entry["name"], "count": entry["count"]}
+                for entry in tag_counts
+                if entry["count"]
+            ),
+            key=lambda tag: tag["count"],
+            reverse=True,
+        )
 
         return MemoryStats(
-            total_memories=total_memories,
+            total_memories=sum(memories_by_type.values()),
             memories_by_type=memories_by_type,
             total_contexts=total_contexts,
             total_tags=total_tags,
@@ -65,6 +119,108 @@ class StatsMixin(BaseRepositoryMixin):
     # Health Analysis
     # =========================================================================
 
+    # All health checks in one scan of Memory: each memory is classified once
+    # and conditional aggregates count or sample each class. collect() skips
+    # the NULLs from non-matching rows and is NULL itself on an empty table.
+    _HEALTH_QUERY = """
+        MATCH (m:Memory)
+        WITH m,
+             NOT EXISTS { MATCH (m)-[:TAGGED_WITH]->(:Tag) } AS orphan,
+             NOT EXISTS { MATCH (m)-[:RELATED_TO]-(:Memory) } AS unlinked,
+             m.updated_at < $threshold AS stale
+        WITH count(m) AS total_memories,
+             count(CASE WHEN m.memory_type = $failure THEN 1 END) AS failure_count,
+             count(CASE WHEN orphan THEN 1 END) AS orphan_count,
+             collect(CASE WHEN orphan THEN m.id END) AS orphan_ids,
+             count(CASE WHEN unlinked THEN 1 END) AS unlinked_count,
+             collect(CASE WHEN stale THEN m.id END) AS stale_ids
+        RETURN total_memories, failure_count,
+               orphan_count, coalesce(orphan_ids, [])[1:$limit],
+               unlinked_count, coalesce(stale_ids, [])[1:$limit]
+    """
+
+    _ORPHANS_QUERY = """
+        MATCH (m:Memory)
+        WHERE NOT EXISTS { MATCH (m)-[:TAGGED_WITH]->(:Tag) }
+        RETURN m.id, m.summary
+        LIMIT $limit
+    """
+
+    # One undirected pattern covers links in both directions, so KùzuDB scans
+    # RELATED_TO once instead of once per direction
+    _UNLINKED_COUNT_QUERY = """
+        MATCH (m:Memory)
+        WHERE NOT EXISTS { MATCH (m)-[:RELATED_TO]-(:Memory) }
+        RETURN count(m)
+    """
+
+    _STALE_QUERY = """
+        MATCH (m:Memory)
+        WHERE m.updated_at < $threshold
+        RETURN m.id, m.summary
+        LIMIT $limit
+    """
+
+    def get_health_snapshot(
+        self, threshold: datetime, limit: int = 10
+    ) -> KnowledgeHealthSnapshot:
+        """Gather everything the health analysis needs in a single query.
+
+        Besides the orphan, unlinked and stale checks this counts all
+        memories and failures, so the analysis does not need get_stats().
+
+        Args:
+            threshold: Memories not updated since this time are stale.
+            limit: Maximum number of orphan and stale IDs to sample.
+
+        Returns:
+            KnowledgeHealthSnapshot with the counts and the ID samples.
+        """
+        return self._build_health_snapshot(
+            self._execute_read(
+                self._HEALTH_QUERY, self._health_params(threshold, limit)
+            )
+        )
+
+    async def get_health_snapshot_async(
+        self, threshold: datetime, limit: int = 10
+    ) -> KnowledgeHealthSnapshot:
+        """Gather the health analysis inputs without blocking the event loop."""
+        return self._build_health_snapshot(
+            await self._execute_read_async(
+                self._HEALTH_QUERY, self._health_params(threshold, limit)
+            )
+        )
+
+    @staticmethod
+    def _health_params(threshold: datetime, limit: int) -> dict[str, Any]:
+        """Parameters for _HEALTH_QUERY."""
+        return {
+            "threshold": threshold,
+            "limit": limit,
+            "failure": MemoryType.FAILURE.value,
+        }
+
+    @staticmethod
+    def _build_health_snapshot(result: kuzu.QueryResult) -> KnowledgeHealthSnapshot:
+        """Build a KnowledgeHealthSnapshot from the row of _HEALTH_QUERY."""
+        (
+            total_memories,
+            failure_count,
+            orphan_count,
+            orphan_ids,
+            unlinked_count,
+            stale_ids,
+        ) = result.get_next()
+        return KnowledgeHealthSnapshot(
+            total_memories=total_memories,
+            failure_count=failure_count,
+            orphan_count=orphan_count,
+            orphan_ids=orphan_ids,
+            unlinked_count=unlinked_count,
+            stale_ids=stale_ids,
+        )
+
     def get_orphan_memories(self, limit: int = 10) -> list[tuple[str, str]]:
         """Get memories without tags.
 
@@ -74,29 +230,12 @@ class StatsMixin(BaseRepositoryMixin):
         Returns:
             List of (id, summary) tuples for memories without tags.
         """
-        result = self._execute_read(
-            """
-            MATCH (m:Memory)
-            WHERE NOT EXISTS { MATCH (m)-[:TAGGED_WITH]->(:Tag) }
-            RETURN m.id, m.summary
-            LIMIT $limit
-            """,
-            parameters={"limit": limit},
-        )
-        memories: list[tuple[str, str]] = []
-        while result.has_next():
-            row = result.get_next()
-            memories.append((row[0], row[1]))
-        return memories
+        result = self._execute_read(self._ORPHANS_QUERY, parameters={"limit": limit})
+        return [(row[0], row[1]) for row in self._fetch_rows(result)]
 
     def get_unlinked_count(self) -> int:
         """Get count of memories without any RELATED_TO links."""
-        result = self._execute_read("""
-            MATCH (m:Memory)
-            WHERE NOT EXISTS { MATCH (m)-[:RELATED_TO]->(:Memory) }
-              AND NOT EXISTS { MATCH (:Memory)-[:RELATED_TO]->(m) }
-            RETURN count(m)
-        """)
+        result = self._execute_read(self._UNLINKED_COUNT_QUERY)
         return result.get_next()[0] if result.has_next() else 0
 
     def get_stale_memories(
@@ -112,16 +251,6 @@ class StatsMixin(BaseRepositoryMixin):
             List of (id, summary) tuples for stale memories.
         """
         result = self._execute_read(
-            """
-            MATCH (m:Memory)
-            WHERE m.updated_at < $threshold
-            RETURN m.id, m.summary
-            LIMIT $limit
-            """,
-            parameters={"threshold": threshold, "limit": limit},
+            self._STALE_QUERY, parameters={"threshold": threshold, "limit": limit}
         )
-        memories: list[tuple[str, str]] = []
-        while result.has_next():
-            row = result.get_next()
-            memories.append((row[0], row[1]))
-        return memories
+        return [(row[0], row[1]) for row in self._fetch_rows(result)]
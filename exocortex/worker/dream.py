@@ -18,6 +18,7 @@ import logging
 import signal
 import sys
 import time
+from typing import TYPE_CHECKING
 
 from filelock import FileLock, Timeout
 
@@ -25,6 +26,9 @@ from ..config import Config, get_config
 from ..container import Container
 from ..domain.models import RelationType
 
+if TYPE_CHECKING:
+    from ..domain.services import MemoryService
+
 # Configure logging for the worker
 logging.basicConfig(
     level=logging.INFO,
@@ -33,6 +37,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Links written per statement by the auto-linking task
+AUTO_LINK_BATCH_SIZE = 100
+
 
 # =============================================================================
 # Dream Worker Class
@@ -301,6 +308,7 @@ class DreamWorker:
 
             duplicate_threshold = 0.95
             processed_pairs: set[tuple[str, str]] = set()
+            memories_by_id = {memory.id: memory for memory in memories}
             duplicates_found = 0
 
             for _i, memory in enumerate(memories):
@@ -324,8 +332,8 @@ class DreamWorker:
                         continue
                     processed_pairs.add(pair)
 
-                    # Get the other memory
-                    other = repo.get_by_id(other_id)
+                    # Get the other memory (usually already listed above)
+                    other = memories_by_id.get(other_id) or repo.get_by_id(other_id)
                     if other is None:
                         continue
 
@@ -378,13 +386,15 @@ class DreamWorker:
             orphan_tuples = repo.get_orphan_memories()
             logger.info(f"Found {len(orphan_tuples)} orphan memories")
 
+            # Full memories (content for embedding) for all orphans at once
+            orphans = repo.get_by_ids([orphan_id for orphan_id, _ in orphan_tuples])
+
             rescued = 0
             for orphan_id, _orphan_summary in orphan_tuples:
                 if not self._running:
                     break
 
-                # Get the full memory to access content for embedding
-                memory = repo.get_by_id(orphan_id)
+                memory = orphans.get(orphan_id)
                 if memory is None:
                     logger.debug(f"Orphan {orphan_id[:8]}... not found, skipping")
                     continue
@@ -441,9 +451,8 @@ class DreamWorker:
             # Get existing links to avoid duplicates
             existing_links: set[tuple[str, str]] = set()
             for mem in memories:
-                links = repo.get_links(mem.id)
-                for link in links:
-                    pair = tuple(sorted([mem.id, link.target_id]))
+                for target_id, _, _ in repo.get_links_raw(mem.id):
+                    pair = tuple(sorted([mem.id, target_id]))
                     existing_links.add(pair)
 
             links_created = 0
@@ -454,23 +463,19 @@ class DreamWorker:
             tag_links = self._find_tag_shared_pairs(
                 memories, existing_links, processed_pairs
             )
-            for source_id, target_id, shared_tags in tag_links:
-                if not self._running:
-                    break
-                try:
-                    service.link_memories(
-                        source_id=source_id,
-                        target_id=target_id,
-                        relation_type=RelationType.RELATED,
-                        reason=f"Auto-linked: Share {len(shared_tags)} tags ({', '.join(list(shared_tags)[:3])})",
-                    )
-                    links_created += 1
-                    logger.info(
-                        f"Linked (tags): {source_id[:8]}... ↔ {target_id[:8]}... "
-                        f"(shared: {', '.join(list(shared_tags)[:3])})"
+            links_created += self._write_links(
+                service,
+                [
+                    (
+                        source_id,
+                        target_id,
+                        RelationType.RELATED,
+                        f"Auto-linked: Share {len(shared_tags)} tags ({', '.join(list(shared_tags)[:3])})",
                     )
-                except Exception as e:
-                    logger.debug(f"Could not create tag-based link: {e}")
+                    for source_id, target_id, shared_tags in tag_links
+                ],
+                strategy="tags",
+            )
 
             # Strategy 2: Semantic similarity (80%+)
             if self._running:
@@ -478,29 +483,55 @@ class DreamWorker:
                 semantic_links = self._find_semantic_pairs(
                     memories, existing_links, processed_pairs, repo
                 )
-                for source_id, target_id, similarity in semantic_links:
-                    if not self._running:
-                        break
-                    try:
-                        service.link_memories(
-                            source_id=source_id,
-                            target_id=target_id,
-                            relation_type=RelationType.RELATED,
-                            reason=f"Auto-linked: High semantic similarity ({similarity:.0%})",
-                        )
-                        links_created += 1
-                        logger.info(
-                            f"Linked (semantic): {source_id[:8]}... ↔ {target_id[:8]}... "
-                            f"(similarity: {similarity:.0%})"
+                links_created += self._write_links(
+                    service,
+                    [
+                        (
+                            source_id,
+                            target_id,
+                            RelationType.RELATED,
+                            f"Auto-linked: High semantic similarity ({similarity:.0%})",
                         )
-                    except Exception as e:
-                        logger.debug(f"Could not create semantic link: {e}")
+                        for source_id, target_id, similarity in semantic_links
+                    ],
+                    strategy="semantic",
+                )
 
             logger.info(f"Auto-linking complete: {links_created} links created")
 
         except Exception as e:
             logger.warning(f"Auto-linking task error: {e}")
 
+    def _write_links(
+        self,
+        service: MemoryService,
+        links: list[tuple[str, str, RelationType, str]],
+        strategy: str,
+    ) -> int:
+        """Create auto-links in chunks of AUTO_LINK_BATCH_SIZE.
+
+        Each chunk is one statement that commits (or fails) on its own and
+        releases the write lock afterwards, so other processes can write
+        between chunks and a failed chunk doesn't undo the earlier ones.
+
+        Returns:
+            Number of links created.
+        """
+        created = 0
+        for start in range(0, len(links), AUTO_LINK_BATCH_SIZE):
+            if not self._running:
+                break
+            chunk = links[start : start + AUTO_LINK_BATCH_SIZE]
+            try:
+                created += service.link_memories_bulk(chunk)
+            except Exception as e:
+                logger.warning(
+                    f"Could not create {len(chunk)} {strategy}-based links: {e}"
+                )
+
+        logger.info(f"Linked ({strategy}): {created} of {len(links)} candidate pairs")
+        return created
+
     def _find_tag_shared_pairs(
         self,
         memories: list,
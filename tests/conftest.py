@@ -54,6 +54,40 @@ def container(test_config: Config) -> Generator[Container, None, None]:
     reset_config()
 
 
+@pytest.fixture
+def embed_calls(
+    container: Container, monkeypatch: pytest.MonkeyPatch
+) -> Generator[list[str], None, None]:
+    """Record every text the container's embedding model is asked to embed."""
+    engine = container.repository._embedding_engine
+    embed = engine.embed
+    calls: list[str] = []
+
+    def counting_embed(text: str) -> list[float]:
+        calls.append(text)
+        return embed(text)
+
+    monkeypatch.setattr(engine, "embed", counting_embed)
+    yield calls
+
+
+@pytest.fixture
+def write_queries(
+    container: Container, monkeypatch: pytest.MonkeyPatch
+) -> Generator[list[tuple[str, dict | None]], None, None]:
+    """Record the (query, parameters) of every write the repository executes."""
+    repo = container.repository
+    execute_write = repo._execute_write
+    writes: list[tuple[str, dict | None]] = []
+
+    def spy_execute_write(query: str, parameters: dict | None = None):
+        writes.append((query, parameters))
+        return execute_write(query, parameters)
+
+    monkeypatch.setattr(repo, "_execute_write", spy_execute_write)
+    yield writes
+
+
 @pytest.fixture(autouse=True)
 def set_test_env(temp_data_dir: Path) -> Generator[None, None, None]:
     """Set environment variables for tests."""
@@ -2,11 +2,25 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
 import pytest
 
+from exocortex.config import Config
 from exocortex.container import Container
-from exocortex.domain.exceptions import DuplicateLinkError, SelfLinkError
+from exocortex.domain.exceptions import (
+    DuplicateLinkError,
+    MemoryNotFoundError,
+    SelfLinkError,
+)
 from exocortex.domain.models import MemoryType, RelationType
+from exocortex.infra.queries import MemoryQueryBuilder
+from exocortex.infra.repositories import memory_crud as memory_crud_module
+from exocortex.infra.repositories import search as search_module
+from exocortex.infra.repositories import stats as stats_module
 
 
 class TestDatabaseIntegration:
@@ -20,6 +34,108 @@ class TestDatabaseIntegration:
         result = db_manager.read_connection.execute("MATCH (n) RETURN count(n)")
         assert result.has_next()
 
+    def test_parameterized_queries_reuse_prepared_statement(self, container: Container):
+        """Test that repeated parameterized reads share one prepared statement."""
+        repo = container.repository
+        first_id, _, _ = repo.create_memory(
+            content="First prepared memory",
+            context_name="test",
+            tags=["test"],
+            memory_type=MemoryType.NOTE,
+        )
+        second_id, _, _ = repo.create_memory(
+            content="Second prepared memory",
+            context_name="test",
+            tags=["test"],
+            memory_type=MemoryType.NOTE,
+        )
+
+        conn = container.database_manager.read_connection
+        query = "MATCH (m:Memory {id: $id}) RETURN m.content"
+
+        first = conn.execute(query, {"id": first_id}).get_next()
+        second = conn.execute(query, {"id": second_id}).get_next()
+
+        assert first == ["First prepared memory"]
+        assert second == ["Second prepared memory"]
+        assert list(conn._prepared) == [query]
+
+        # Built queries are formatted once and then reused as-is
+        assert MemoryQueryBuilder.get_by_id() is MemoryQueryBuilder.get_by_id()
+        assert MemoryQueryBuilder.list_memories(
+            "c.name = $context_filter"
+        ) is MemoryQueryBuilder.list_memories("c.name = $context_filter")
+
+    def test_key_lookups_plan_primary_key_scans(self, container: Container):
+        """Test that id/name lookups are planned as primary-key index seeks."""
+        repo = container.repository
+
+        def plan(query: str, parameters: dict) -> str:
+            return repo._execute_read(f"EXPLAIN {query}", parameters).get_next()[0]
+
+        for query, parameters in [
+            (MemoryQueryBuilder.get_by_id(), {"id": "x"}),
+            (MemoryQueryBuilder.get_memories_by_tag(), {"tag": "x", "limit": 1}),
+            (MemoryQueryBuilder.explore_linked(), {"id": "x", "limit": 1}),
+            (MemoryQueryBuilder.explore_tag_siblings(), {"id": "x", "limit": 1}),
+        ]:
+            assert "PRIMARY_KEY_SCAN_NODE_TABLE" in plan(query, parameters)
+
+    def test_execute_concurrently_keeps_query_order(self, container: Container):
+        """Test that parallel reads return one result per query, in order."""
+        repo = container.repository
+        memory_id, _, _ = repo.create_memory(
+            content="Concurrent read memory",
+            context_name="test",
+            tags=["test"],
+            memory_type=MemoryType.NOTE,
+        )
+
+        conn = container.database_manager.read_connection
+        results = conn.execute_concurrently(
+            [
+                ("MATCH (m:Memory {id: $id}) RETURN m.content", {"id": memory_id}),
+                ("MATCH (c:Context) RETURN c.name", None),
+                ("MATCH (t:Tag) RETURN count(t)", None),
+            ]
+        )
+
+        assert [r.get_next() for r in results] == [
+            ["Concurrent read memory"],
+            ["test"],
+            [1],
+        ]
+
+    def test_read_pool_size_comes_from_config(self, test_config: Config):
+        """Test that max_concurrent_queries sizes the async read pool."""
+        test_config.max_concurrent_queries = 2
+        container = Container.create(test_config)
+        try:
+            pool = container.database_manager.read_connection.async_conn
+            assert len(pool.connections) == 2
+        finally:
+            container.close()
+
+    async def test_write_waits_for_in_flight_async_read(self, container: Container):
+        """Test a write lets a running async read finish before closing its pool."""
+        repo = container.repository
+        manager = container.database_manager
+
+        read = asyncio.create_task(
+            repo._execute_read_async("UNWIND range(1, 300000) AS x RETURN sum(x)")
+        )
+        # Let the read reach the pool's executor before the write starts
+        await asyncio.sleep(0.05)
+
+        # Opening the database read-write closes the read connection's pool
+        manager.get_write_connection().execute("CREATE (:Context {name: 'written'})")
+        manager.release_write_lock()
+
+        result = await asyncio.wait_for(read, timeout=30)
+        assert result.get_next() == [45000150000]
+        contexts = repo._execute_read("MATCH (c:Context) RETURN c.name")
+        assert repo._fetch_rows(contexts) == [["written"]]
+
     def test_full_memory_lifecycle(self, container: Container):
         """Test complete memory lifecycle: create, read, update, delete."""
         repo = container.repository
@@ -94,6 +210,7 @@ class TestDatabaseIntegration:
         assert len(links) == 1
         assert links[0].target_id == m1_id
         assert links[0].relation_type == RelationType.EXTENDS
+        assert repo.get_links_raw(m2_id) == [(m1_id, "extends", "M2 extends M1")]
 
         # Delete link
         success = repo.delete_link(m2_id, m1_id)
@@ -101,6 +218,454 @@ class TestDatabaseIntegration:
 
         links = repo.get_links(m2_id)
         assert len(links) == 0
+        assert repo.get_links_raw(m2_id) == []
+
+        # Deleting a missing link reports nothing was deleted
+        assert repo.delete_link(m2_id, m1_id) is False
+
+    def test_create_links_in_bulk(self, container: Container):
+        """Test that many links are created with one call, skipping bad pairs."""
+        repo = container.repository
+
+        ids = [
+            repo.create_memory(
+                content=f"Bulk link memory {i}",
+                context_name="test",
+                tags=["test"],
+                memory_type=MemoryType.NOTE,
+            )[0]
+            for i in range(3)
+        ]
+        repo.create_link(ids[0], ids[1], RelationType.RELATED)
+
+        # Existing, self, missing and repeated pairs are not created
+        created = repo.create_links(
+            [
+                (ids[0], ids[1], RelationType.EXTENDS, None),
+                (ids[1], ids[2], RelationType.EXTENDS, "first"),
+                (ids[1], ids[2], RelationType.RELATED, "second"),
+                (ids[2], ids[2], RelationType.RELATED, None),
+                (ids[2], "missing", RelationType.RELATED, None),
+                (ids[2], ids[0], RelationType.RELATED, None),
+            ]
+        )
+
+        assert created == 2
+        assert repo.get_links_raw(ids[0]) == [(ids[1], "related", None)]
+        assert repo.get_links_raw(ids[1]) == [(ids[2], "extends", "first")]
+        assert repo.get_links_raw(ids[2]) == [(ids[0], "related", None)]
+        assert repo.create_links([]) == 0
+
+    def test_delete_links_in_bulk(self, container: Container):
+        """Test that many links are removed with one call."""
+        repo = container.repository
+
+        ids = [
+            repo.create_memory(
+                content=f"Bulk unlink memory {i}",
+                context_name="test",
+                tags=["test"],
+                memory_type=MemoryType.NOTE,
+            )[0]
+            for i in range(3)
+        ]
+        repo.create_link(ids[0], ids[1], RelationType.RELATED)
+        repo.create_link(ids[1], ids[2], RelationType.EXTENDS)
+        repo.create_link(ids[2], ids[0], RelationType.RELATED)
+
+        # Missing and repeated pairs are not counted
+        deleted = repo.delete_links(
+            [(ids[0], ids[1]), (ids[1], ids[2]), (ids[1], ids[0]), (ids[0], ids[1])]
+        )
+
+        assert deleted == 2
+        assert repo.get_links(ids[0]) == []
+        assert repo.get_links(ids[1]) == []
+        assert [link.target_id for link in repo.get_links(ids[2])] == [ids[0]]
+        assert repo.delete_links([]) == 0
+
+    def test_delete_memories_in_bulk(
+        self,
+        container: Container,
+        monkeypatch: pytest.MonkeyPatch,
+        write_queries: list[tuple[str, dict | None]],
+    ):
+        """Test that many memories are deleted in chunks of one statement."""
+        repo = container.repository
+
+        ids = [
+            repo.create_memory(
+                content=f"Bulk delete memory {i}",
+                context_name="test",
+                tags=["test"],
+                memory_type=MemoryType.NOTE,
+            )[0]
+            for i in range(4)
+        ]
+        repo.create_link(ids[0], ids[3], RelationType.RELATED)
+
+        monkeypatch.setattr(memory_crud_module, "DELETE_MEMORIES_CHUNK", 2)
+        write_queries.clear()
+
+        # Missing and repeated IDs are not counted
+        deleted = repo.delete_memories([ids[0], "missing", ids[1], ids[0], ids[2]])
+
+        assert deleted == 3
+        assert len(write_queries) == 2
+        assert [repo.get_by_id(i) is None for i in ids] == [True, True, True, False]
+        assert repo.get_incoming_links(ids[3]) == []
+        assert repo.get_stats().total_memories == 1
+        assert repo.delete_memories([]) == 0
+
+    def test_delete_memory_removes_relationships(self, container: Container):
+        """Test that deleting a memory also removes its links and tags."""
+        repo = container.repository
+
+        keep_id, _, _ = repo.create_memory(
+            content="Memory to keep",
+            context_name="test",
+            tags=["shared"],
+            memory_type=MemoryType.INSIGHT,
+        )
+        drop_id, _, _ = repo.create_memory(
+            content="Memory to drop",
+            context_name="test",
+            tags=["shared"],
+            memory_type=MemoryType.INSIGHT,
+        )
+        repo.create_link(keep_id, drop_id, RelationType.RELATED)
+        repo.create_link(drop_id, keep_id, RelationType.EXTENDS)
+
+        assert repo.delete_memory(drop_id) is True
+
+        assert repo.get_by_id(drop_id) is None
+        assert repo.get_links(keep_id) == []
+        assert repo.get_incoming_links(keep_id) == []
+        assert repo.get_memories_by_tag("shared")[0].id == keep_id
+
+        # Deleting again reports the memory as missing
+        assert repo.delete_memory(drop_id) is False
+
+    def test_repeated_tag_and_context_names_are_shared(self, container: Container):
+        """Test that rows reuse one string object per tag/context name."""
+        repo = container.repository
+
+        for i in range(2):
+            repo.create_memory(
+                content=f"Pooled strings memory {i}",
+                context_name="pooled-project",
+                tags=["pooled"],
+                memory_type=MemoryType.NOTE,
+            )
+
+        first, second = repo.get_memories_by_tag("pooled")
+
+        assert first.tags == second.tags == ["pooled"]
+        assert first.tags[0] is second.tags[0]
+        assert first.context is second.context
+
+    def test_tags_are_normalized_and_deduplicated(self, container: Container):
+        """Test that tag variants collapse into one TAGGED_WITH relationship."""
+        repo = container.repository
+
+        memory_id, _, _ = repo.create_memory(
+            content="Memory with messy tags",
+            context_name="test",
+            tags=["Python", " python ", "", "DB"],
+            memory_type=MemoryType.NOTE,
+        )
+        assert sorted(repo.get_by_id(memory_id).tags) == ["db", "python"]
+
+        repo.update_memory(memory_id, tags=["db", "Db", "sql"])
+        assert sorted(repo.get_by_id(memory_id).tags) == ["db", "sql"]
+
+        # Replacing with no tags only removes the old ones
+        repo.update_memory(memory_id, tags=[" "])
+        assert repo.get_by_id(memory_id).tags == []
+        repo.update_memory(memory_id, tags=["sql"])
+        assert repo.get_by_id(memory_id).tags == ["sql"]
+
+    def test_update_memory_reuses_content_embedding(
+        self, container: Container, embed_calls: list[str]
+    ):
+        """Test that updating to already-embedded content skips the model."""
+        repo = container.repository
+        memory_id, _, _ = repo.create_memory(
+            content="Original content",
+            context_name="test",
+            tags=["test"],
+            memory_type=MemoryType.NOTE,
+        )
+        embed_calls.clear()
+
+        repo.update_memory(memory_id, content="Revised content")
+        repo.update_memory(memory_id, content="Revised content")
+
+        assert embed_calls == ["Revised content"]
+        assert repo.get_by_id(memory_id).content == "Revised content"
+
+    def test_create_memory_reuses_content_embedding(
+        self, container: Container, embed_calls: list[str]
+    ):
+        """Test that re-ingesting identical content skips the model."""
+        repo = container.repository
+
+        first_id, _, first_embedding = repo.create_memory(
+            content="Re-ingested content",
+            context_name="test",
+            tags=["test"],
+            memory_type=MemoryType.NOTE,
+        )
+        second_id, _, second_embedding = repo.create_memory(
+            content="Re-ingested content",
+            context_name="test",
+            tags=["test"],
+            memory_type=MemoryType.NOTE,
+        )
+        repo.update_memory(first_id, content="Re-ingested content")
+
+        assert embed_calls == ["Re-ingested content"]
+        assert first_id != second_id
+        assert first_embedding == second_embedding
+
+    def test_repeated_search_reuses_query_embedding(
+        self, container: Container, embed_calls: list[str]
+    ):
+        """Test that repeating a search query skips the model."""
+        repo = container.repository
+        repo.create_memory(
+            content="Cached query target",
+            context_name="test",
+            tags=["test"],
+            memory_type=MemoryType.NOTE,
+        )
+        embed_calls.clear()
+
+        first, _ = repo.search_by_similarity("cached query", limit=5)
+        second, _ = repo.search_by_similarity("cached query", limit=5)
+
+        assert embed_calls == ["cached query"]
+        assert [m.id for m in first] == [m.id for m in second]
+
+        # Hits are rebuilt from the float32 entry without losing precision
+        cached = repo._embed_query("cached query")
+        assert cached == repo._embedding_engine.embed("cached query")
+        assert cached is not repo._embed_query("cached query")
+
+    def test_write_batch_commits_or_rolls_back_together(self, container: Container):
+        """Test that writes in a batch are committed or discarded as a unit."""
+        repo = container.repository
+
+        with repo.write_batch():
+            kept_id, _, _ = repo.create_memory(
+                content="Committed in a batch",
+                context_name="test",
+                tags=["batch"],
+                memory_type=MemoryType.NOTE,
+            )
+            # Reads inside the batch see its own writes
+            assert repo.get_by_id(kept_id) is not None
+
+        with pytest.raises(RuntimeError, match="abort batch"), repo.write_batch():
+            dropped_id, _, _ = repo.create_memory(
+                content="Discarded with the batch",
+                context_name="test",
+                tags=["batch"],
+                memory_type=MemoryType.NOTE,
+            )
+            raise RuntimeError("abort batch")
+
+        assert repo.get_by_id(kept_id) is not None
+        assert repo.get_by_id(dropped_id) is None
+
+    def test_failed_update_memory_is_rolled_back(
+        self, container: Container, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that a failing content update leaves the memory untouched."""
+        repo = container.repository
+        memory_id, _, _ = repo.create_memory(
+            content="Content before failed update",
+            context_name="test",
+            tags=["original"],
+            memory_type=MemoryType.NOTE,
+        )
+        other_id, _, _ = repo.create_memory(
+            content="Linked memory",
+            context_name="test",
+            tags=["other"],
+            memory_type=MemoryType.NOTE,
+        )
+        repo.create_link(memory_id, other_id, RelationType.RELATED)
+
+        def fail_links(*_args, **_kwargs):
+            raise RuntimeError("link write failed")
+
+        # Fails after the node has been deleted and recreated
+        monkeypatch.setattr(repo, "_link_params", fail_links)
+
+        with pytest.raises(RuntimeError, match="link write failed"):
+            repo.update_memory(memory_id, content="Content after failed update")
+
+        memory = repo.get_by_id(memory_id)
+        assert memory.content == "Content before failed update"
+        assert memory.tags == ["original"]
+        assert memory.context == "test"
+        assert [link.target_id for link in repo.get_links(memory_id)] == [other_id]
+
+    def test_update_memory_recreates_node(self, container: Container):
+        """Test content updates keep the id, created_at, context, tags and links."""
+        repo = container.repository
+        memory_id, _, _ = repo.create_memory(
+            content="Content before update",
+            context_name="test",
+            tags=["original"],
+            memory_type=MemoryType.NOTE,
+        )
+        other_id, _, _ = repo.create_memory(
+            content="Linked memory",
+            context_name="test",
+            tags=["other"],
+            memory_type=MemoryType.NOTE,
+        )
+        repo.create_link(memory_id, other_id, RelationType.RELATED)
+        repo.create_link(other_id, memory_id, RelationType.EXTENDS)
+        created_at = repo.get_by_id(memory_id).created_at
+
+        repo.update_memory(memory_id, content="First revision")
+
+        memory = repo.get_by_id(memory_id)
+        assert memory.id == memory_id
+        assert memory.created_at == created_at
+        assert memory.content == "First revision"
+        assert memory.tags == ["original"]
+
+        repo.update_memory(memory_id, content="Second revision", tags=["revised"])
+
+        memory = repo.get_by_id(memory_id)
+        assert memory.id == memory_id
+        assert memory.created_at == created_at
+        assert memory.content == "Second revision"
+        assert memory.tags == ["revised"]
+        assert memory.context == "test"
+        assert [link.target_id for link in repo.get_links(memory_id)] == [other_id]
+        assert [link.target_id for link in repo.get_links(other_id)] == [memory_id]
+
+    def test_update_memory_preserves_link_details(self, container: Container):
+        """Test recreated links keep their relation type and reason."""
+        repo = container.repository
+        memory_id, _, _ = repo.create_memory(
+            content="Hub memory",
+            context_name="test",
+            tags=["hub"],
+            memory_type=MemoryType.NOTE,
+        )
+        targets = {}
+        for relation in (RelationType.EXTENDS, RelationType.DEPENDS_ON):
+            target_id, _, _ = repo.create_memory(
+                content=f"Target via {relation.value}",
+                context_name="test",
+                tags=["spoke"],
+                memory_type=MemoryType.NOTE,
+            )
+            repo.create_link(memory_id, target_id, relation, reason=relation.value)
+            targets[target_id] = relation
+        source_id, _, _ = repo.create_memory(
+            content="Source memory",
+            context_name="test",
+            tags=["spoke"],
+            memory_type=MemoryType.NOTE,
+        )
+        repo.create_link(source_id, memory_id, RelationType.SUPERSEDES)
+
+        repo.update_memory(memory_id, content="Hub memory, revised")
+
+        links = repo.get_links(memory_id)
+        assert {link.target_id: link.relation_type for link in links} == targets
+        assert {link.reason for link in links} == {r.value for r in targets.values()}
+        incoming = repo.get_links(source_id)
+        assert [(link.target_id, link.relation_type) for link in incoming] == [
+            (memory_id, RelationType.SUPERSEDES)
+        ]
+
+    def test_generate_summary_cuts_at_word_boundary(self, container: Container):
+        """Test long content is truncated at a nearby space, or hard-cut."""
+        repo = container.repository
+        limit = repo._max_summary_length
+
+        assert repo._generate_summary("  short  ") == "short"
+
+        words = repo._generate_summary("word " * limit)
+        assert words.endswith("word...")
+        assert len(words) <= limit + 3
+
+        # No space close enough to the limit: cut at exactly the limit
+        assert repo._generate_summary("x" * (limit * 2)) == "x" * limit + "..."
+        far = "a " + "y" * limit
+        assert repo._generate_summary(far) == far[:limit] + "..."
+
+    def test_update_memory_without_changes_does_not_write(
+        self, container: Container, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that an update with nothing to change leaves the writer alone."""
+        repo = container.repository
+        memory_id, summary, _ = repo.create_memory(
+            content="Memory that is not changed",
+            context_name="test",
+            tags=["kept"],
+            memory_type=MemoryType.NOTE,
+        )
+
+        def fail_write_batch():
+            raise AssertionError("a no-op update should not open a write batch")
+
+        monkeypatch.setattr(repo, "write_batch", fail_write_batch)
+
+        assert repo.update_memory(memory_id) == (True, [], summary)
+
+    def test_update_memory_tags_returns_stored_summary(
+        self, container: Container, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that a tag-only update returns the summary without re-reading."""
+        repo = container.repository
+        memory_id, summary, _ = repo.create_memory(
+            content="Content whose summary should be returned",
+            context_name="test",
+            tags=["before"],
+            memory_type=MemoryType.NOTE,
+        )
+
+        def fail_get_by_id(_memory_id: str):
+            raise AssertionError("update_memory should not re-read the memory")
+
+        monkeypatch.setattr(repo, "get_by_id", fail_get_by_id)
+
+        success, changes, new_summary = repo.update_memory(memory_id, tags=["after"])
+
+        assert success is True
+        assert changes == ["tags"]
+        assert new_summary == summary
+
+    def test_update_memory_tags_only_is_one_write(
+        self, container: Container, write_queries: list[tuple[str, dict | None]]
+    ):
+        """Test that a tag-only update rewrites tags and updated_at together."""
+        repo = container.repository
+        memory_id, _, _ = repo.create_memory(
+            content="Memory whose tags change",
+            context_name="test",
+            tags=["before"],
+            memory_type=MemoryType.NOTE,
+        )
+        created = repo.get_by_id(memory_id)
+
+        for tags in (["after"], []):
+            write_queries.clear()
+            assert repo.update_memory(memory_id, tags=tags)[1] == ["tags"]
+            assert len(write_queries) == 1
+
+            memory = repo.get_by_id(memory_id)
+            assert memory.tags == tags
+            assert memory.updated_at > created.updated_at
 
     def test_duplicate_link_prevention(self, container: Container):
         """Test that duplicate links are rejected."""
@@ -128,6 +693,12 @@ class TestDatabaseIntegration:
 
         assert exc_info.value.existing_type == "related"
 
+        # The reverse direction is a different link
+        repo.create_link(m1_id, m2_id, RelationType.EXTENDS)
+
+        with pytest.raises(MemoryNotFoundError):
+            repo.create_link(m1_id, "missing", RelationType.RELATED)
+
     def test_self_link_prevention(self, container: Container):
         """Test that self-links are rejected."""
         repo = container.repository
@@ -179,6 +750,293 @@ class TestDatabaseIntegration:
             or "concurrent" in memories[0].content.lower()
         )
 
+    def test_fallback_search_scores_match_pairwise_similarity(
+        self, container: Container, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test the batched fallback scores agree with compute_similarity."""
+        repo = container.repository
+
+        ids = []
+        for content in ("Fallback alpha", "Fallback beta", "Something else"):
+            memory_id, _, _ = repo.create_memory(
+                content=content,
+                context_name="test",
+                tags=["test"],
+                memory_type=MemoryType.NOTE,
+            )
+            ids.append(memory_id)
+
+        query = repo._embed_content("Fallback alpha")
+        results = repo._search_similar_fallback(query, limit=10, exclude_id=ids[2])
+
+        assert {r[0] for r in results} == set(ids[:2])
+        assert results[0][0] == ids[0]
+        for memory_id, _, similarity, _, _ in results:
+            expected = repo.compute_similarity(
+                query, repo._embed_content(repo.get_by_id(memory_id).content)
+            )
+            assert similarity == pytest.approx(expected, abs=1e-5)
+
+        # Only the top-k is selected, still in descending order
+        assert [r[0] for r in repo._search_similar_fallback(query, 1, None)] == [ids[0]]
+
+        # Later searches score against the snapshot without rescanning
+        with monkeypatch.context() as m:
+            m.setattr(repo, "_execute_read", pytest.fail)
+            assert repo._search_similar_fallback(query, 10, ids[2]) == results
+
+        # A memory write drops the snapshot; the rescan sees the new memory
+        new_id, _, _ = repo.create_memory(
+            content="Fallback alpha again",
+            context_name="test",
+            tags=["test"],
+            memory_type=MemoryType.NOTE,
+        )
+        assert repo._fallback_snapshot is None
+        assert new_id in {r[0] for r in repo._search_similar_fallback(query, 10, None)}
+        repo.delete_memory(new_id)
+
+        # The streamed embedding matrix grows when it runs out of rows
+        monkeypatch.setattr(search_module, "FALLBACK_INITIAL_ROWS", 1)
+        assert repo._fallback_snapshot is None
+        assert repo._search_similar_fallback(query, 10, ids[2]) == results
+        assert repo._fallback_snapshot[2].shape == (3, len(query))
+
+    def test_get_embeddings_returns_stored_vectors(self, container: Container):
+        """Test stored embeddings are read back as float32 vectors."""
+        repo = container.repository
+        memory_id, _, embedding = repo.create_memory(
+            content="Memory whose embedding is read back",
+            context_name="test",
+            tags=[],
+            memory_type=MemoryType.NOTE,
+        )
+
+        embeddings = repo.get_embeddings([memory_id, "missing"])
+
+        assert list(embeddings) == [memory_id]
+        assert embeddings[memory_id].dtype == np.float32
+        assert embeddings[memory_id].tolist() == pytest.approx(embedding)
+        assert repo.get_embeddings([]) == {}
+
+    def test_filtered_fallback_fetches_memories_in_one_query(
+        self, container: Container, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test the filtered fallback loads its candidates with get_by_ids."""
+        repo = container.repository
+
+        ids = {}
+        for content, tag in (("Fallback alpha", "keep"), ("Fallback beta", "drop")):
+            ids[tag], _, _ = repo.create_memory(
+                content=content,
+                context_name="test",
+                tags=[tag, "shared"],
+                memory_type=MemoryType.NOTE,
+            )
+
+        found = repo.get_by_ids([ids["keep"], "missing", ids["keep"]])
+        assert list(found) == [ids["keep"]]
+        assert sorted(found[ids["keep"]].tags) == ["keep", "shared"]
+        assert repo.get_by_ids([]) == {}
+
+        monkeypatch.setattr(repo, "get_by_id", pytest.fail)
+        query = repo._embed_content("Fallback beta")
+        memories = repo._search_by_similarity_fallback(
+            query, 10, "test", ["KEEP"], MemoryType.NOTE
+        )
+
+        assert [memory.id for memory in memories] == [ids["keep"]]
+        assert memories[0].similarity is not None
+
+    def test_list_memories_filters_before_pagination(self, container: Container):
+        """Test list filters narrow both the page and the total count."""
+        repo = container.repository
+
+        created = {}
+        for name, context, tags in [
+            ("a1", "alpha", ["python"]),
+            ("b1", "beta", ["python"]),
+            ("a2", "alpha", ["rust"]),
+            ("a3", "alpha", ["python", "db"]),
+        ]:
+            created[name], _, _ = repo.create_memory(
+                content=f"List filter memory {name}",
+                context_name=context,
+                tags=tags,
+                memory_type=MemoryType.NOTE,
+            )
+
+        memories, total, has_more = repo.list_memories(
+            limit=1, context_filter="alpha", tag_filter=["Python"]
+        )
+        assert total == 2
+        assert has_more is True
+        assert [m.id for m in memories] == [created["a3"]]
+        assert set(memories[0].tags) == {"python", "db"}
+
+        memories, total, has_more = repo.list_memories(
+            limit=1, offset=1, context_filter="alpha", tag_filter=["python"]
+        )
+        assert [m.id for m in memories] == [created["a1"]]
+        assert has_more is False
+
+        _, total, _ = repo.list_memories(type_filter=MemoryType.INSIGHT)
+        assert total == 0
+
+    def test_search_filters_are_applied_in_query(self, container: Container):
+        """Test context, type and tag filters narrow the vector search."""
+        repo = container.repository
+
+        alpha_insight, _, _ = repo.create_memory(
+            content="Filtered search insight in alpha",
+            context_name="alpha",
+            tags=["python", "db"],
+            memory_type=MemoryType.INSIGHT,
+        )
+        beta_note, _, _ = repo.create_memory(
+            content="Filtered search note in beta",
+            context_name="beta",
+            tags=["python"],
+            memory_type=MemoryType.NOTE,
+        )
+        alpha_note, _, _ = repo.create_memory(
+            content="Filtered search note in alpha",
+            context_name="alpha",
+            tags=["rust"],
+            memory_type=MemoryType.NOTE,
+        )
+
+        def ids(**filters):
+            memories, _ = repo.search_by_similarity("filtered search", 10, **filters)
+            return {m.id for m in memories}
+
+        assert ids(context_filter="alpha") == {alpha_insight, alpha_note}
+        assert ids(type_filter=MemoryType.NOTE) == {beta_note, alpha_note}
+        assert ids(tag_filter=["Rust", "db"]) == {alpha_insight, alpha_note}
+        assert ids(context_filter="alpha", type_filter=MemoryType.NOTE) == {alpha_note}
+        assert ids(tag_filter=[" RUST ", "rust"]) == {alpha_note}
+
+        # The Python-side fallback applies the same filters
+        fallback = repo._search_by_similarity_fallback(
+            repo._embed_query("filtered search"),
+            10,
+            context_filter="alpha",
+            tag_filter=[" Python "],
+            type_filter=MemoryType.INSIGHT,
+        )
+        assert [m.id for m in fallback] == [alpha_insight]
+
+        memories, _ = repo.search_by_similarity(
+            "filtered search", 10, tag_filter=["db"]
+        )
+        assert memories[0].context == "alpha"
+        assert set(memories[0].tags) == {"python", "db"}
+        assert memories[0].content == "Filtered search insight in alpha"
+
+    def test_vector_index_tracks_create_update_delete(self, container: Container):
+        """Test the vector index reflects writes without a rebuild."""
+        repo = container.repository
+
+        def nearest(text: str) -> list[str]:
+            return [
+                row[0]
+                for row in repo.search_similar_by_embedding(
+                    repo._embed_query(text), limit=10
+                )
+            ]
+
+        memory_id, _, _ = repo.create_memory(
+            content="Glacier meltwater chemistry",
+            context_name="test",
+            tags=["test"],
+            memory_type=MemoryType.NOTE,
+        )
+        assert nearest("Glacier meltwater chemistry")[0] == memory_id
+
+        repo.update_memory(memory_id, content="Volcanic ash dispersion")
+        assert nearest("Volcanic ash dispersion")[0] == memory_id
+
+        repo.delete_memory(memory_id)
+        assert memory_id not in nearest("Volcanic ash dispersion")
+
+    def test_stale_vector_index_warns_once(
+        self,
+        container: Container,
+        monkeypatch: pytest.MonkeyPatch,
+        caplog: pytest.LogCaptureFixture,
+    ):
+        """Test a dead vector index is remembered, not re-probed per search."""
+        repo = container.repository
+
+        # Emptying the index leaves it blind to memories created afterwards
+        first_id, _, _ = repo.create_memory(
+            content="Tidal pool ecology",
+            context_name="test",
+            tags=["test"],
+            memory_type=MemoryType.NOTE,
+        )
+        repo.delete_memory(first_id)
+        memory_id, _, _ = repo.create_memory(
+            content="Tidal pool ecology",
+            context_name="test",
+            tags=["test"],
+            memory_type=MemoryType.NOTE,
+        )
+
+        with caplog.at_level(logging.WARNING):
+            memories, _ = repo.search_by_similarity("Tidal pool ecology")
+        assert [m.id for m in memories] == [memory_id]
+        assert repo._stale_index_version == repo._memory_version
+
+        reads: list[str] = []
+        execute_read = repo._execute_read
+
+        def spy_execute_read(query: str, parameters: dict | None = None):
+            reads.append(query)
+            return execute_read(query, parameters)
+
+        monkeypatch.setattr(repo, "_execute_read", spy_execute_read)
+        with caplog.at_level(logging.WARNING):
+            memories, _ = repo.search_by_similarity("Tidal pool ecology")
+            results = repo.search_similar_by_embedding(
+                repo._embed_query("Tidal pool ecology"), limit=5
+            )
+
+        assert [m.id for m in memories] == [memory_id]
+        assert [r[0] for r in results] == [memory_id]
+        assert not any("QUERY_VECTOR_INDEX" in query for query in reads)
+        assert [r.getMessage() for r in caplog.records].count(
+            "Vector index returned no memories, using fallback"
+        ) == 1
+
+    def test_filtered_search_widens_candidates(self, container: Container):
+        """Test a selective filter still finds matches outside the first top-k."""
+        repo = container.repository
+
+        for i in range(30):
+            repo.create_memory(
+                content=f"Kubernetes deployment rollout {i}",
+                context_name="busy",
+                tags=["k8s"],
+                memory_type=MemoryType.NOTE,
+            )
+        quiet_id, _, _ = repo.create_memory(
+            content="Sourdough starter hydration",
+            context_name="quiet",
+            tags=["baking"],
+            memory_type=MemoryType.NOTE,
+        )
+
+        memories, total = repo.search_by_similarity(
+            "Kubernetes deployment rollout",
+            limit=1,
+            context_filter="quiet",
+            use_hybrid_scoring=False,
+        )
+
+        assert total == 1
+        assert memories[0].id == quiet_id
+
     def test_explore_related(self, container: Container):
         """Test exploring related memories."""
         repo = container.repository
@@ -241,6 +1099,81 @@ class TestDatabaseIntegration:
         assert stats.memories_by_type.get("success", 0) == 1
         assert stats.total_contexts >= 1
         assert stats.total_tags >= 2
+        assert stats.top_tags[0] == {"name": "test", "count": 4}
+        assert stats.top_tags[1] == {"name": "success", "count": 1}
+
+        # Tag counts come from TAGGED_WITH alone, without joining Memory back
+        plan = repo._execute_read(f"EXPLAIN {repo._STATS_QUERY}").get_next()[0]
+        assert "HASH_JOIN" not in plan
+        assert "TOP_K" in plan
+
+    def test_statistics_empty_database(self, container: Container):
+        """Test statistics on a database without memories."""
+        stats = container.repository.get_stats()
+
+        assert stats.total_memories == 0
+        assert stats.memories_by_type == {}
+        assert stats.total_contexts == 0
+        assert stats.total_tags == 0
+        assert stats.top_tags == []
+
+    def test_statistics_cache(self, container: Container, monkeypatch):
+        """Stats are served from cache until a write or the TTL expires."""
+        repo = container.repository
+        repo.create_memory(
+            content="First",
+            context_name="test",
+            tags=["a"],
+            memory_type=MemoryType.INSIGHT,
+        )
+
+        stats = repo.get_stats()
+        assert stats.total_memories == 1
+        stats.memories_by_type.clear()
+
+        with monkeypatch.context() as m:
+            m.setattr(repo, "_execute_read", pytest.fail)
+            cached = repo.get_stats()
+        assert cached.total_memories == 1
+        assert cached.memories_by_type == {"insight": 1}
+
+        # Writes drop the cached value
+        repo.create_memory(
+            content="Second",
+            context_name="test",
+            tags=["b"],
+            memory_type=MemoryType.INSIGHT,
+        )
+        assert repo.get_stats().total_memories == 2
+
+        # Expired entries are recomputed
+        monkeypatch.setattr(stats_module, "STATS_CACHE_TTL", 0.0)
+        calls = []
+        read = repo._execute_read
+        monkeypatch.setattr(
+            repo, "_execute_read", lambda *a, **k: calls.append(a) or read(*a, **k)
+        )
+        assert repo.get_stats().total_memories == 2
+        assert len(calls) == 1
+
+    def test_statistics_read_in_rolled_back_batch_are_not_cached(
+        self, container: Container
+    ):
+        """Stats read inside a batch that rolls back are not served later."""
+        repo = container.repository
+
+        with pytest.raises(RuntimeError, match="abort"), repo.write_batch():
+            repo.create_memory(
+                content="Rolled back",
+                context_name="test",
+                tags=["a"],
+                memory_type=MemoryType.INSIGHT,
+            )
+            assert repo.get_stats().total_memories == 1
+            raise RuntimeError("abort")
+
+        assert repo._stats_cache is None
+        assert repo.get_stats().total_memories == 0
 
     def test_analyze_health(self, container: Container):
         """Test knowledge base health analysis."""
@@ -261,6 +1194,59 @@ class TestDatabaseIntegration:
         assert result.total_memories >= 1
         assert 0 <= result.health_score <= 100
 
+    def test_health_snapshot_matches_individual_checks(self, container: Container):
+        """Test the single-scan health snapshot agrees with the per-check queries."""
+        repo = container.repository
+
+        orphan_id, _, _ = repo.create_memory(
+            content="Snapshot orphan",
+            context_name="test",
+            tags=[],
+            memory_type=MemoryType.NOTE,
+        )
+        source_id, _, _ = repo.create_memory(
+            content="Snapshot source",
+            context_name="test",
+            tags=["health"],
+            memory_type=MemoryType.NOTE,
+        )
+        target_id, _, _ = repo.create_memory(
+            content="Snapshot target",
+            context_name="test",
+            tags=["health"],
+            memory_type=MemoryType.FAILURE,
+        )
+        repo.create_link(source_id, target_id, RelationType.RELATED)
+
+        now = datetime.now(timezone.utc)
+        snapshot = repo.get_health_snapshot(threshold=now - timedelta(days=1))
+        stats = repo.get_stats()
+        assert snapshot.total_memories == stats.total_memories == 3
+        assert snapshot.failure_count == stats.memories_by_type["failure"] == 1
+        assert snapshot.orphan_count == 1
+        assert snapshot.orphan_ids == [orphan_id]
+        assert snapshot.unlinked_count == repo.get_unlinked_count() == 1
+        assert snapshot.stale_ids == []
+
+        # Every memory is stale against a future threshold; samples are capped
+        future = now + timedelta(days=1)
+        snapshot = repo.get_health_snapshot(threshold=future, limit=2)
+        assert len(snapshot.stale_ids) == 2
+        assert set(snapshot.stale_ids) <= {orphan_id, source_id, target_id}
+        assert len(repo.get_stale_memories(threshold=future)) == 3
+
+        # The orphan total is counted in the database, not from the sample
+        for i in range(3):
+            repo.create_memory(
+                content=f"Snapshot orphan {i}",
+                context_name="test",
+                tags=[],
+                memory_type=MemoryType.NOTE,
+            )
+        snapshot = repo.get_health_snapshot(threshold=now, limit=2)
+        assert snapshot.orphan_count == 4
+        assert len(snapshot.orphan_ids) == 2
+
 
 class TestTraceLineage:
     """Integration tests for trace_lineage (Temporal Reasoning)."""
@@ -613,3 +1599,106 @@ class TestIncomingLinks:
         incoming = repo.get_incoming_links(isolated_id)
 
         assert len(incoming) == 0
+
+
+class TestAsyncReads:
+    """Tests for non-blocking read variants."""
+
+    async def test_get_stats_async_matches_sync(self, container: Container):
+        """Test that get_stats_async returns the same stats as get_stats."""
+        repo = container.repository
+
+        repo.create_memory(
+            content="Async stats insight",
+            context_name="async-project",
+            tags=["async", "stats"],
+            memory_type=MemoryType.INSIGHT,
+        )
+        repo.create_memory(
+            content="Async stats failure",
+            context_name="async-project",
+            tags=["async"],
+            memory_type=MemoryType.FAILURE,
+        )
+
+        stats = await repo.get_stats_async()
+
+        assert stats == repo.get_stats()
+        assert stats.total_memories == 2
+        assert stats.memories_by_type == {"insight": 1, "failure": 1}
+
+    async def test_links_and_health_async_match_sync(self, container: Container):
+        """Test that the async link and health reads match their sync forms."""
+        repo = container.repository
+
+        source_id, _, _ = repo.create_memory(
+            content="Async link source",
+            context_name="async-project",
+            tags=["async"],
+            memory_type=MemoryType.INSIGHT,
+        )
+        target_id, _, _ = repo.create_memory(
+            content="Async link target",
+            context_name="async-project",
+            tags=[],
+            memory_type=MemoryType.FAILURE,
+        )
+        repo.create_link(source_id, target_id, RelationType.EXTENDS, "async reason")
+
+        links = await repo.get_links_async(source_id)
+        assert links == repo.get_links(source_id)
+        assert [link.target_id for link in links] == [target_id]
+        assert links[0].reason == "async reason"
+
+        threshold = datetime.now(timezone.utc) - timedelta(days=1)
+        snapshot = await repo.get_health_snapshot_async(threshold)
+        assert snapshot == repo.get_health_snapshot(threshold)
+        assert snapshot.total_memories == 2
+        assert snapshot.failure_count == 1
+        assert snapshot.orphan_ids == [target_id]
+
+    async def test_explore_related_async_matches_sync(self, container: Container):
+        """Test that explore_related_async returns the same memories."""
+        repo = container.repository
+
+        base_id, _, _ = repo.create_memory(
+            content="Async base insight",
+            context_name="async-project",
+            tags=["python"],
+            memory_type=MemoryType.INSIGHT,
+        )
+        linked_id, _, _ = repo.create_memory(
+            content="Async linked insight",
+            context_name="other-project",
+            tags=["go"],
+            memory_type=MemoryType.INSIGHT,
+        )
+        tag_id, _, _ = repo.create_memory(
+            content="Async tag sibling",
+            context_name="other-project",
+            tags=["python"],
+            memory_type=MemoryType.NOTE,
+        )
+        context_id, _, _ = repo.create_memory(
+            content="Async context sibling",
+            context_name="async-project",
+            tags=["rust"],
+            memory_type=MemoryType.NOTE,
+        )
+        repo.create_link(base_id, linked_id, RelationType.EXTENDS)
+
+        result = await repo.explore_related_async(memory_id=base_id)
+
+        assert [m.id for m in result["linked"]] == [linked_id]
+        assert [m.id for m in result["by_tag"]] == [tag_id]
+        assert [m.id for m in result["by_context"]] == [context_id]
+        assert result == repo.explore_related(memory_id=base_id)
+
+        # Disabled categories are not queried
+        result = await repo.explore_related_async(
+            memory_id=base_id,
+            include_tag_siblings=False,
+            include_context_siblings=False,
+        )
+        assert result["by_tag"] == []
+        assert result["by_context"] == []
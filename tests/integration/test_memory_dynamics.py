@@ -186,6 +186,55 @@ class TestMemoryDynamicsIntegration:
             memory = service.get_memory(memory_id)
             assert memory.access_count >= 2  # Initial + 1 touch
 
+    def test_frequently_accessed_ordering_and_limit(self, container: Container):
+        """Test frequently accessed memories are the top-k by access count."""
+        repo = container.repository
+
+        ids = []
+        for i in range(4):
+            memory_id, _, _ = repo.create_memory(
+                content=f"Frequency test memory number {i}",
+                context_name="test-project",
+                tags=["frequency-test", f"tag-{i}"],
+                memory_type=MemoryType.NOTE,
+            )
+            ids.append(memory_id)
+            # Memory i ends up with access_count 1 + i
+            for _ in range(i):
+                repo.touch_memory(memory_id)
+
+        memories = repo.get_frequently_accessed_memories(min_access_count=2, limit=2)
+
+        assert [m.id for m in memories] == [ids[3], ids[2]]
+        assert [m.access_count for m in memories] == [4, 3]
+        assert set(memories[0].tags) == {"frequency-test", "tag-3"}
+        assert memories[0].context == "test-project"
+
+        # The same top-k applies to tag lookups, with every tag of each memory
+        by_tag = repo.get_memories_by_tag("frequency-test", limit=2)
+        assert [m.id for m in by_tag] == [ids[3], ids[2]]
+        assert set(by_tag[1].tags) == {"frequency-test", "tag-2"}
+
+    def test_frequently_accessed_ties_break_by_id(self, container: Container):
+        """Test equal access counts come back in a stable id order."""
+        repo = container.repository
+
+        ids = []
+        for i in range(3):
+            memory_id, _, _ = repo.create_memory(
+                content=f"Tied access memory {i}",
+                context_name="test-project",
+                tags=["tie-test"],
+                memory_type=MemoryType.NOTE,
+            )
+            ids.append(memory_id)
+
+        memories = repo.get_frequently_accessed_memories(min_access_count=1, limit=2)
+        by_tag = repo.get_memories_by_tag("tie-test", limit=2)
+
+        assert [m.id for m in memories] == sorted(ids)[:2]
+        assert [m.id for m in by_tag] == sorted(ids)[:2]
+
     def test_hybrid_score_includes_vector_similarity(self, container: Container):
         """Test that vector similarity is the primary factor."""
         service = container.memory_service
@@ -55,6 +55,46 @@ class TestPatternCreationIntegration:
         pattern = repo.get_pattern_by_id("nonexistent-pattern-id")
         assert pattern is None
 
+    def test_get_pattern_by_id_is_cached(self, container: Container):
+        """Test repeated lookups are served from cache until the TTL expires."""
+        repo = container.repository
+
+        pattern_id, _, _ = repo.create_pattern(
+            content="Cache hot lookups",
+            confidence=0.6,
+        )
+
+        first = repo.get_pattern_by_id(pattern_id)
+        with patch.object(repo, "_execute_read") as mock_read:
+            second = repo.get_pattern_by_id(pattern_id)
+        mock_read.assert_not_called()
+        assert second == first
+        assert second is not first
+
+        with (
+            patch("exocortex.infra.repositories.pattern.PATTERN_CACHE_TTL", 0.0),
+            patch.object(repo, "_execute_read", wraps=repo._execute_read) as spy,
+        ):
+            assert repo.get_pattern_by_id(pattern_id) == first
+        spy.assert_called_once()
+
+    def test_pattern_read_in_rolled_back_batch_is_not_cached(
+        self, container: Container
+    ):
+        """Test a pattern read inside a batch that rolls back is not cached."""
+        repo = container.repository
+
+        with pytest.raises(RuntimeError, match="abort"), repo.write_batch():
+            pattern_id, _, _ = repo.create_pattern(
+                content="Rolled back pattern",
+                confidence=0.6,
+            )
+            assert repo.get_pattern_by_id(pattern_id) is not None
+            raise RuntimeError("abort")
+
+        assert pattern_id not in repo._pattern_cache
+        assert repo.get_pattern_by_id(pattern_id) is None
+
 
 class TestPatternLinkingIntegration:
     """Integration tests for linking memories to patterns."""
@@ -209,6 +249,22 @@ class TestPatternSearchIntegration:
         # Low confidence should be excluded
         assert low_conf_id not in similar_ids
 
+    def test_search_patterns_returns_top_matches_in_order(self, container: Container):
+        """Test pattern search returns the most similar patterns first."""
+        repo = container.repository
+
+        for topic in ["caching", "logging", "retries", "indexing"]:
+            repo.create_pattern(content=f"Pattern about {topic}", confidence=0.6)
+
+        query_embedding = repo._embedding_engine.embed("Pattern about retries")
+        all_patterns = repo.search_similar_patterns(query_embedding, limit=10)
+        top_two = repo.search_similar_patterns(query_embedding, limit=2)
+
+        similarities = [s[2] for s in all_patterns]
+        assert len(all_patterns) == 4
+        assert similarities == sorted(similarities, reverse=True)
+        assert top_two == all_patterns[:2]
+
 
 class TestConsolidatePatternsIntegration:
     """Integration tests for the consolidate_patterns service method."""
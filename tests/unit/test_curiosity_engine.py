@@ -267,6 +267,7 @@ class TestCuriosityEngineSuggestedLinks:
         """Create engine with mock repository."""
         mock_repo = MagicMock()
         mock_repo.get_links.return_value = []
+        mock_repo.get_links_raw.return_value = []
         return CuriosityEngine(repository=mock_repo)
 
     @pytest.fixture
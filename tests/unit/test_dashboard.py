@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from starlette.testclient import TestClient
 
 from exocortex.dashboard.app import create_dashboard_app
+from exocortex.domain.models import (
+    KnowledgeHealthSnapshot,
+    MemoryLink,
+    RelationType,
+)
+from exocortex.infra.repositories import MemoryRepository
 
 
 @pytest.fixture
@@ -43,13 +49,13 @@ class TestApiStats:
         """Test stats endpoint returns correct data."""
         mock_container_obj, mock_repo = mock_container
 
-        # Mock get_stats()
+        # Mock get_stats_async()
         mock_stats = MagicMock()
         mock_stats.total_memories = 100
         mock_stats.memories_by_type = {"insight": 20, "failure": 15}
         mock_stats.total_contexts = 2
         mock_stats.total_tags = 3
-        mock_repo.get_stats.return_value = mock_stats
+        mock_repo.get_stats_async = AsyncMock(return_value=mock_stats)
 
         # Mock _execute_read for contexts
         mock_ctx_result = MagicMock()
@@ -62,6 +68,7 @@ class TestApiStats:
         mock_tag_result.get_next.side_effect = [["python"], ["api"], ["bugfix"]]
 
         mock_repo._execute_read.side_effect = [mock_ctx_result, mock_tag_result]
+        mock_repo._fetch_rows = MemoryRepository._fetch_rows
         mock_repo.get_orphan_memories.return_value = []
 
         with patch(
@@ -78,6 +85,8 @@ class TestApiStats:
         assert data["stats"]["total_memories"] == 100
         assert data["stats"]["contexts_count"] == 2
         assert data["stats"]["tags_count"] == 3
+        assert data["stats"]["contexts"] == ["project1", "project2"]
+        assert data["stats"]["tags"] == ["python", "api", "bugfix"]
 
     def test_api_stats_error(self):
         """Test stats endpoint handles errors."""
@@ -149,6 +158,50 @@ class TestApiMemories:
         assert call_kwargs["context_filter"] == "myproject"
 
 
+class TestApiMemoryDetail:
+    """Tests for /api/memories/{memory_id} endpoint."""
+
+    def test_api_memory_detail_with_links(self, mock_container):
+        """Test memory detail endpoint returns the memory and its links."""
+        mock_container_obj, mock_repo = mock_container
+
+        mock_memory = MagicMock()
+        mock_memory.id = "mem-1"
+        mock_memory.content = "Test content"
+        mock_memory.summary = "Test summary"
+        mock_memory.context = "test-project"
+        mock_memory.memory_type = MagicMock(value="insight")
+        mock_memory.tags = ["test"]
+        mock_memory.created_at = None
+        mock_memory.updated_at = None
+        mock_memory.last_accessed_at = None
+        mock_memory.access_count = 1
+        mock_repo.get_by_id.return_value = mock_memory
+        mock_repo.get_links_async = AsyncMock(
+            return_value=[
+                MemoryLink(
+                    target_id="mem-2",
+                    target_summary="Linked",
+                    relation_type=RelationType.EXTENDS,
+                )
+            ]
+        )
+
+        with patch(
+            "exocortex.dashboard.app.get_container", return_value=mock_container_obj
+        ):
+            app = create_dashboard_app()
+            client = TestClient(app)
+            response = client.get("/api/memories/mem-1")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["memory"]["id"] == "mem-1"
+        assert data["links"][0]["target_id"] == "mem-2"
+        assert data["links"][0]["relation_type"] == "extends"
+        mock_repo.get_links_async.assert_awaited_once_with("mem-1")
+
+
 class TestApiHealth:
     """Tests for /api/health endpoint."""
 
@@ -156,10 +209,8 @@ class TestApiHealth:
         """Test health endpoint with healthy knowledge base."""
         mock_container_obj, mock_repo = mock_container
 
-        mock_stats = MagicMock()
-        mock_stats.total_memories = 50
-        mock_repo.get_stats.return_value = mock_stats
-        mock_repo.get_orphan_memories.return_value = []
+        mock_snapshot = KnowledgeHealthSnapshot(total_memories=50)
+        mock_repo.get_health_snapshot_async = AsyncMock(return_value=mock_snapshot)
 
         with patch(
             "exocortex.dashboard.app.get_container", return_value=mock_container_obj
@@ -178,13 +229,10 @@ class TestApiHealth:
         """Test health endpoint with orphan memories."""
         mock_container_obj, mock_repo = mock_container
 
-        mock_stats = MagicMock()
-        mock_stats.total_memories = 10
-        mock_repo.get_stats.return_value = mock_stats
-        mock_repo.get_orphan_memories.return_value = [
-            ("orphan-1", "Orphan 1"),
-            ("orphan-2", "Orphan 2"),
-        ]
+        mock_snapshot = KnowledgeHealthSnapshot(
+            total_memories=10, orphan_count=2, orphan_ids=["orphan-1", "orphan-2"]
+        )
+        mock_repo.get_health_snapshot_async = AsyncMock(return_value=mock_snapshot)
 
         with patch(
             "exocortex.dashboard.app.get_container", return_value=mock_container_obj
@@ -237,11 +285,8 @@ class TestApiGraph:
         # list_memories returns (memories, total, has_more)
         mock_repo.list_memories.return_value = ([mock_memory], 1, False)
 
-        # Mock MemoryLink object
-        mock_link = MagicMock()
-        mock_link.target_id = "mem-2"
-        mock_link.relation_type = MagicMock(value="related")
-        mock_repo.get_links.return_value = [mock_link]
+        # (target_id, relation_type, reason) tuples
+        mock_repo.get_links_raw.return_value = [("mem-2", "related", None)]
 
         with patch(
             "exocortex.dashboard.app.get_container", return_value=mock_container_obj
@@ -0,0 +1,64 @@
+"""Unit tests for EmbeddingEngine similarity scoring."""
+
+from __future__ import annotations
+
+import pytest
+
+from exocortex.infra.embeddings import EmbeddingEngine
+
+
+@pytest.fixture
+def engine() -> EmbeddingEngine:
+    """Create an engine; similarity scoring never loads the model."""
+    return EmbeddingEngine(model_name="unused")
+
+
+class TestZeroVectors:
+    """Zero vectors score 0 instead of dividing by zero."""
+
+    def test_compute_similarity_with_zero_vector(self, engine: EmbeddingEngine):
+        """A zero vector on either side scores 0."""
+        assert engine.compute_similarity([0.0, 0.0], [1.0, 0.0]) == 0.0
+        assert engine.compute_similarity([1.0, 0.0], [0.0, 0.0]) == 0.0
+
+    def test_compute_similarities_with_zero_row(self, engine: EmbeddingEngine):
+        """A zero row scores 0 while the other rows are scored normally."""
+        scores = engine.compute_similarities([1.0, 0.0], [[1.0, 0.0], [0.0, 0.0]])
+        assert scores == pytest.approx([1.0, 0.0])
+
+    def test_compute_similarities_with_zero_query(self, engine: EmbeddingEngine):
+        """A zero query scores 0 against every row."""
+        assert engine.compute_similarities([0.0, 0.0], [[1.0, 0.0], [0.0, 0.0]]) == [
+            0.0,
+            0.0,
+        ]
+
+
+class TestTopSimilarities:
+    """Top-k selection in EmbeddingEngine.top_similarities."""
+
+    def test_returns_top_k_in_descending_order(self, engine: EmbeddingEngine):
+        """Only the k best rows come back, best first, with their scores."""
+        top = engine.top_similarities(
+            [1.0, 0.0], [[0.0, 1.0], [1.0, 0.0], [1.0, 1.0]], 2
+        )
+
+        assert [index for index, _ in top] == [1, 2]
+        assert top[0][1] == pytest.approx(1.0)
+        assert top[1][1] == pytest.approx(2**-0.5)
+
+    def test_ties_are_ranked_by_index(self, engine: EmbeddingEngine):
+        """Rows tied with the k-th best score are taken in index order."""
+        embeddings = [[0.0, 1.0]] + [[1.0, 0.0]] * 8 + [[1.0, 1.0]]
+
+        for k in range(1, 9):
+            top = engine.top_similarities([1.0, 0.0], embeddings, k)
+            assert [index for index, _ in top] == list(range(1, k + 1))
+
+        top = engine.top_similarities([1.0, 0.0], embeddings, 10)
+        assert [index for index, _ in top] == [*range(1, 9), 9, 0]
+
+    def test_empty_input_or_non_positive_k(self, engine: EmbeddingEngine):
+        """Nothing is returned for k <= 0 or when there are no embeddings."""
+        assert engine.top_similarities([1.0, 0.0], [], 3) == []
+        assert engine.top_similarities([1.0, 0.0], [[1.0, 0.0]], 0) == []
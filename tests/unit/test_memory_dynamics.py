@@ -354,3 +354,63 @@ class TestScoringScenarios:
 
         # Low match old should be last
         assert sorted_scores[-1][0] == "low_match_old"
+
+
+class TestRowToMemory:
+    """Tests for mapping database rows to MemoryWithContext."""
+
+    @pytest.fixture
+    def mapper(self):
+        """Bare repository mixin with the state _row_to_memory needs."""
+        from exocortex.infra.repositories.base import BaseRepositoryMixin
+
+        repo = BaseRepositoryMixin()
+        repo._string_pool = {}
+        return repo
+
+    def test_row_with_content_applies_dynamics_defaults(self, mapper):
+        """Test NULL dynamics columns fall back to model defaults."""
+        now = datetime.now(timezone.utc)
+        row = ["id-1", "content", "summary", "failure", now, now, None]
+        row += [None, None, None, None, "ctx", ["a", None, "b"]]
+
+        memory = mapper._row_to_memory(row, similarity=0.5)
+
+        assert memory.content == "content"
+        assert memory.memory_type is MemoryType.FAILURE
+        assert memory.access_count == 1
+        assert memory.decay_rate == 0.1
+        assert memory.frustration_score == 0.0
+        assert memory.context == "ctx"
+        assert memory.tags == ["a", "b"]
+        assert memory.similarity == 0.5
+
+    def test_row_without_content_ignores_extra_columns(self, mapper):
+        """Test the content-less shape, with trailing query-specific columns."""
+        now = datetime.now(timezone.utc)
+        row = ["id-2", "summary", "note", now, now, now, 0, 0.0, 0.7, 2.5]
+        row += [None, [], "extends", "reason"]
+
+        memory = mapper._row_to_memory(row, include_content=False)
+
+        assert memory.content == ""
+        assert memory.summary == "summary"
+        assert memory.memory_type is MemoryType.NOTE
+        assert memory.access_count == 0
+        assert memory.decay_rate == 0.0
+        assert memory.frustration_score == 0.7
+        assert memory.time_cost_hours == 2.5
+        assert memory.context is None
+        assert memory.tags == []
+
+    def test_string_pool_is_bounded(self, mapper, monkeypatch):
+        """Test the tag/context pool resets instead of growing without bound."""
+        from exocortex.infra.repositories import base
+
+        monkeypatch.setattr(base, "STRING_POOL_SIZE", 3)
+
+        mapper._intern_tags(["a", "b", "c"])
+        assert len(mapper._string_pool) == 3
+
+        assert mapper._intern("ctx") == "ctx"
+        assert mapper._string_pool == {"ctx": "ctx"}
@@ -260,3 +260,16 @@ class TestMemoryServiceLink:
 
         links = service.get_memory_links(result2.memory_id)
         assert len(links) == 0
+
+        # Bulk unlink reports how many links were removed
+        service.link_memories(
+            source_id=result1.memory_id,
+            target_id=result2.memory_id,
+            relation_type=RelationType.RELATED,
+        )
+        pairs = [
+            (result1.memory_id, result2.memory_id),
+            (result2.memory_id, result1.memory_id),
+        ]
+        assert service.unlink_memories_bulk(pairs) == 1
+        assert service.get_memory_links(result1.memory_id) == []
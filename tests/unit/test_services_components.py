@@ -9,10 +9,12 @@ Tests for:
 from datetime import datetime, timezone
 from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 
 from exocortex.domain.models import (
-    MemoryStats,
+    KnowledgeHealthIssue,
+    KnowledgeHealthSnapshot,
     MemoryType,
     MemoryWithContext,
     RelationType,
@@ -298,26 +300,19 @@ class TestKnowledgeHealthAnalyzer:
     def mock_repo(self):
         """Create mock repository."""
         repo = MagicMock()
-        repo.get_stats.return_value = MemoryStats(
+        repo.get_health_snapshot.return_value = KnowledgeHealthSnapshot(
             total_memories=20,
-            memories_by_type={"insight": 10, "success": 5, "failure": 3, "decision": 2},
-            total_contexts=5,
-            total_tags=30,
-            top_tags=[{"name": "python", "count": 10}],
+            failure_count=3,
+            orphan_ids=[],
+            unlinked_count=5,
+            stale_ids=[],
         )
-        repo.get_orphan_memories.return_value = []
-        repo.get_unlinked_count.return_value = 5
-        repo.get_stale_memories.return_value = []
         return repo
 
     def test_empty_knowledge_base(self, mock_repo):
         """Empty knowledge base should return healthy score."""
-        mock_repo.get_stats.return_value = MemoryStats(
-            total_memories=0,
-            memories_by_type={},
-            total_contexts=0,
-            total_tags=0,
-            top_tags=[],
+        mock_repo.get_health_snapshot.return_value = KnowledgeHealthSnapshot(
+            total_memories=0
         )
         analyzer = KnowledgeHealthAnalyzer(repository=mock_repo)
 
@@ -337,13 +332,19 @@ class TestKnowledgeHealthAnalyzer:
         assert result.total_memories == 20
         assert result.health_score >= 95.0  # Good link coverage bonus
         assert len(result.issues) == 0
+        # Everything comes from the single snapshot query
+        mock_repo.get_health_snapshot.assert_called_once()
+        mock_repo.get_stats.assert_not_called()
 
     def test_orphan_memories_detected(self, mock_repo):
         """Orphan memories should be detected as issue."""
-        mock_repo.get_orphan_memories.return_value = [
-            ("orphan-1", "Orphan memory 1"),
-            ("orphan-2", "Orphan memory 2"),
-        ]
+        mock_repo.get_health_snapshot.return_value = KnowledgeHealthSnapshot(
+            total_memories=20,
+            failure_count=3,
+            orphan_count=2,
+            orphan_ids=["orphan-1", "orphan-2"],
+            unlinked_count=5,
+        )
         analyzer = KnowledgeHealthAnalyzer(repository=mock_repo)
 
         result = analyzer.analyze()
@@ -355,7 +356,11 @@ class TestKnowledgeHealthAnalyzer:
 
     def test_low_connectivity_detected(self, mock_repo):
         """Low connectivity should be detected when many memories unlinked."""
-        mock_repo.get_unlinked_count.return_value = 18  # 90% unlinked
+        mock_repo.get_health_snapshot.return_value = KnowledgeHealthSnapshot(
+            total_memories=20,
+            failure_count=3,
+            unlinked_count=18,  # 90% unlinked
+        )
         analyzer = KnowledgeHealthAnalyzer(repository=mock_repo)
 
         result = analyzer.analyze()
@@ -368,11 +373,12 @@ class TestKnowledgeHealthAnalyzer:
 
     def test_stale_memories_detected(self, mock_repo):
         """Stale memories should be detected."""
-        mock_repo.get_stale_memories.return_value = [
-            ("stale-1", "Old memory 1"),
-            ("stale-2", "Old memory 2"),
-            ("stale-3", "Old memory 3"),
-        ]
+        mock_repo.get_health_snapshot.return_value = KnowledgeHealthSnapshot(
+            total_memories=20,
+            failure_count=3,
+            unlinked_count=5,
+            stale_ids=["stale-1", "stale-2", "stale-3"],
+        )
         analyzer = KnowledgeHealthAnalyzer(repository=mock_repo, stale_days=90)
 
         result = analyzer.analyze()
@@ -383,9 +389,14 @@ class TestKnowledgeHealthAnalyzer:
 
     def test_health_score_calculation(self, mock_repo):
         """Health score should decrease based on issue severity."""
-        mock_repo.get_orphan_memories.return_value = [("o1", "")]  # medium: -10
-        mock_repo.get_stale_memories.return_value = [("s1", "")]  # low: -5
-        mock_repo.get_unlinked_count.return_value = 18  # low: -5
+        mock_repo.get_health_snapshot.return_value = KnowledgeHealthSnapshot(
+            total_memories=20,
+            failure_count=3,
+            orphan_count=1,
+            orphan_ids=["o1"],  # medium: -10
+            stale_ids=["s1"],  # low: -5
+            unlinked_count=18,  # low: -5
+        )
         analyzer = KnowledgeHealthAnalyzer(repository=mock_repo)
 
         result = analyzer.analyze()
@@ -393,14 +404,29 @@ class TestKnowledgeHealthAnalyzer:
         # 100 - 10 (orphan) - 5 (stale) - 5 (connectivity) = 80
         assert result.health_score == 80.0
 
+    def test_health_score_penalty_per_severity(self, mock_repo):
+        """Each severity deducts its fixed penalty; unknown severities none."""
+        analyzer = KnowledgeHealthAnalyzer(repository=mock_repo)
+        issues = [
+            KnowledgeHealthIssue(
+                issue_type="test",
+                severity=severity,
+                message="",
+                suggested_action="",
+            )
+            for severity in ("high", "medium", "low", "unknown")
+        ]
+
+        # No bonus: every memory is unlinked
+        assert analyzer._calculate_health_score(issues, 1.0) == 65.0
+        assert analyzer._calculate_health_score(issues * 4, 1.0) == 0
+
     def test_no_failures_suggestion(self, mock_repo):
         """Should suggest recording failures if none exist."""
-        mock_repo.get_stats.return_value = MemoryStats(
+        mock_repo.get_health_snapshot.return_value = KnowledgeHealthSnapshot(
             total_memories=20,
-            memories_by_type={"insight": 15, "success": 5},  # No failures
-            total_contexts=5,
-            total_tags=30,
-            top_tags=[],
+            failure_count=0,  # No failures
+            unlinked_count=5,
         )
         analyzer = KnowledgeHealthAnalyzer(repository=mock_repo)
 
@@ -547,6 +573,25 @@ class TestPatternConsolidator:
         # Should have at least one cluster
         assert len(clusters) >= 0
 
+    def test_find_clusters_uses_stored_embeddings(self, mock_repo):
+        """Clustering should read stored embeddings once, not embed per pair."""
+        memories = [
+            self._create_mock_memory(f"m{i}", f"Memory {i}", ["tag"]) for i in range(4)
+        ]
+        mock_repo.get_embeddings.return_value = {
+            memory.id: np.full(3, i, dtype=np.float32)
+            for i, memory in enumerate(memories[:3])
+        }
+        mock_repo.compute_similarity.return_value = 0.3
+
+        consolidator = PatternConsolidator(repository=mock_repo)
+        consolidator._find_clusters(memories, threshold=0.7, min_size=2)
+
+        mock_repo.get_embeddings.assert_called_once_with(["m0", "m1", "m2", "m3"])
+        mock_repo._embedding_engine.embed.assert_not_called()
+        # m3 has no stored embedding and is left out of every comparison
+        assert mock_repo.compute_similarity.call_count == 3
+
     def test_frequently_accessed_fallback(self, mock_repo):
         """Should use frequently accessed memories if no tag filter."""
         memories = [
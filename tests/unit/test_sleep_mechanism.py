@@ -568,3 +568,78 @@ class TestDreamWorkerAutoLinking:
             )
 
             assert len(results) == 0
+
+    def test_links_are_written_in_bounded_chunks(self):
+        """Auto-links are created in chunks; a failed chunk doesn't stop the rest."""
+        from exocortex.config import Config
+        from exocortex.worker import dream
+        from exocortex.worker.dream import DreamWorker
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = Config(data_dir=Path(tmpdir))
+            worker = DreamWorker(config=config)
+            worker._running = True
+
+            container = MagicMock()
+            container.repository.list_memories.return_value = ([], 0, False)
+            service = container.memory_service
+            service.link_memories_bulk.side_effect = [
+                RuntimeError("write failed"),
+                1,
+                1,
+            ]
+            tags = {"x", "y", "z"}
+            worker._find_tag_shared_pairs = MagicMock(
+                return_value=[("a", "b", tags), ("c", "d", tags), ("e", "f", tags)]
+            )
+            worker._find_semantic_pairs = MagicMock(return_value=[("g", "h", 0.9)])
+
+            with patch.object(dream, "AUTO_LINK_BATCH_SIZE", 2):
+                worker._task_auto_linking(container)
+
+            chunks = [
+                [link[:2] for link in call.args[0]]
+                for call in service.link_memories_bulk.call_args_list
+            ]
+            assert chunks == [[("a", "b"), ("c", "d")], [("e", "f")], [("g", "h")]]
+            service.link_memories.assert_not_called()
+
+
+class TestDreamWorkerOrphanRescue:
+    """Tests for the orphan rescue task."""
+
+    def test_orphans_are_loaded_in_one_batch(self):
+        """Orphan memories are fetched with one get_by_ids call."""
+        from exocortex.config import Config
+        from exocortex.worker.dream import DreamWorker
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = Config(data_dir=Path(tmpdir))
+            worker = DreamWorker(config=config)
+            worker._running = True
+
+            orphan = MagicMock()
+            orphan.content = "Orphan content"
+
+            container = MagicMock()
+            repo = container.repository
+            repo.get_orphan_memories.return_value = [
+                ("orphan-a", "Summary A"),
+                ("gone-b", "Summary B"),
+            ]
+            repo.get_by_ids.return_value = {"orphan-a": orphan}
+            repo._embedding_engine.embed.return_value = [0.1, 0.2, 0.3]
+            repo.search_similar_by_embedding.return_value = [
+                ("mem-c", "Summary C", 0.9, "insight", None),
+            ]
+
+            worker._task_orphan_rescue(container)
+
+            repo.get_by_ids.assert_called_once_with(["orphan-a", "gone-b"])
+            repo.get_by_id.assert_not_called()
+            repo._embedding_engine.embed.assert_called_once_with("Orphan content")
+            container.memory_service.link_memories.assert_called_once()
+            assert (
+                container.memory_service.link_memories.call_args.kwargs["source_id"]
+                == "orphan-a"
+            )